@@ -7,20 +7,35 @@ Created on Sun Jan  9 16:30:59 2022
 
 import os, re
 import argparse
+import random
+import queue
+import threading
+import traceback
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from profab.model_learn.classifications import classification_methods
 from profab.model_learn.regressions import regression_methods
 from profab.model_evaluate.evaluation_metrics import evaluate_score
 from profab.model_evaluate.form_table import *
+from profab.model_evaluate.result_store import ResultStore
 from profab.import_dataset.data_loader import *
 from profab.model_preprocess.scaler import scale_methods
 from profab.model_preprocess.extracter import extract_protein_feature
 from profab.model_preprocess.splitter import ttv_split
+from profab.model_preprocess.similarity import fasta_groups
 import warnings
 
 warnings.filterwarnings("ignore")
 
+def budget_type(s):
+    '''e.g. "n_folds=5,n_repeats=1,abort_margin=0.05" -> dict'''
+    budget = {}
+    for item in s.split(','):
+        key, value = item.split('=')
+        budget[key.strip()] = int(value) if value.strip().isdigit() else float(value)
+    return budget
+
 parser = argparse.ArgumentParser(description='ProFAB in terminal to train GO and EC terms')
 parser.add_argument('--file_name',
                     type = str,
@@ -31,20 +46,23 @@ parser.add_argument('--file_name',
 parser.add_argument('--set_type',
                     type = str,
                     default='random',
-                    help='Splitting type of train and test sets',
+                    help='Splitting type of train and test sets. If isFasta is True, it can be'
+                    ' "similarity", then similar proteins are not put into different sets.',
                     )
 parser.add_argument('--protein_feature',
-                    type=str,
-                    default='paac',
-                    help='Numerical feature of protein sequence')
+                    type = lambda s: s.split(','),
+                    default = ['paac'],
+                    help='Numerical feature of protein sequence. If comma separated features'
+                    ' are given, all of them are benchmarked.')
 parser.add_argument('--ratio',
                     type = lambda s: [float(item) for item in s.split(',')],
                     default = [0.2],
                     help = 'Ratio of between validation and test sets.')
 parser.add_argument('--ml_type',
-                    type = str,
-                    default = 'logistic_reg',
-                    help = 'Machine learning algorithms will be used in prediction')
+                    type = lambda s: s.split(','),
+                    default = ['logistic_reg'],
+                    help = 'Machine learning algorithms will be used in prediction. If comma'
+                    ' separated algorithms are given, all of them are benchmarked.')
 parser.add_argument('--score_path',
                     type = str,
                     default='score_path.csv',
@@ -54,9 +72,10 @@ parser.add_argument('--model_path',
                     default=None,
                     help = 'A destination where model parameters are saved.')
 parser.add_argument('--scale_type',
-                    type = str,
-                    default = 'standard',
-                    help = 'Scaling of data to prevent biases.')
+                    type = lambda s: s.split(','),
+                    default = ['standard'],
+                    help = 'Scaling of data to prevent biases. If comma separated types are'
+                    ' given, all of them are benchmarked.')
 parser.add_argument('--pre_determined',
                     type = bool,
                     default = False,
@@ -75,6 +94,11 @@ parser.add_argument('--place_protein_id',
                            " e.g. fasta header: >sp|O27002|....|....|...., seperate the header wrt."
                            " '|' then >sp is in the zeroth position, protein id in the first(1) "
                            "position.")
+parser.add_argument('--similarity_threshold',
+                    type = float,
+                    default = 0.3,
+                    help = "Similarity of k-mer sets of proteins above which they are kept in the"
+                           " same set, if set_type is 'similarity' (arg for fasta files).")
 parser.add_argument('--output_fasta',
                     type = str,
                     default = '',
@@ -110,12 +134,65 @@ parser.add_argument('--delimiter',
                     type = str,
                     default = "\t",
                     help = "A character to separate columns in file.")
+parser.add_argument('--prefetch',
+                    type = int,
+                    default = 0,
+                    help = "Number of next datasets that are downloaded and imported in background"
+                           " while the current one is trained. If 0, datasets are handled one by one.")
+parser.add_argument('--workers',
+                    type = int,
+                    default = 1,
+                    help = "Number of processes that run datasets in parallel. Processors are"
+                           " shared between them and hyperparameter search of each dataset.")
+parser.add_argument('--results_store',
+                    type = str,
+                    default = None,
+                    help = "A .jsonl file where scores of each dataset are saved as soon as it is"
+                           " finished. Datasets already found in it with the same parameters are skipped.")
+parser.add_argument('--search',
+                    type = str,
+                    default = 'random',
+                    help = "Strategy of hyperparameter search: 'random', 'halving', 'hyperband',"
+                           " 'path' (only logistic_reg and ridge_class) or 'precomputed' (only SVM).")
+parser.add_argument('--cv_budget',
+                    type = budget_type,
+                    default = None,
+                    help = "Cross-validation budget of hyperparameter search as comma separated"
+                           " key=value pairs, e.g. n_folds=5,n_repeats=1,max_time=60,abort_margin=0.05."
+                           " Keys are n_folds, n_repeats, max_time, max_fits, min_folds and abort_margin.")
+parser.add_argument('--fit_cache',
+                    type = str,
+                    default = None,
+                    help = "A folder where scores of cross-validation folds are cached. Repeated"
+                           " runs on the same datasets skip fits found in it.")
+parser.add_argument('--seed',
+                    type = int,
+                    default = None,
+                    help = "Random seed of data splitting and shuffling.")
 
-def imp_train_result(data_name, model_path, kwargs, user_kwargs, fasta_kwargs):
+def feature_ids(file_name):
+    
+    #protein ids are in the first column of extracted feature files
+    with open(file_name) as f:
+        return [line.split('\t', 1)[0].strip() for line in f if line.strip()]
+
+def seed_training(kwargs):
+    
+    #Training draws from global generators, so they are seeded by the thread or process
+    #that trains. Imports use generators of their own, so that they can run in background.
+    if kwargs.get('seed') is not None:
+        random.seed(kwargs['seed'])
+        np.random.seed(kwargs['seed'])
+
+def imp_result(data_name, kwargs, user_kwargs, fasta_kwargs):
     
     dataset = ()
     data_model = None
     
+    rng = None
+    if kwargs.get('seed') is not None:
+        rng = np.random.RandomState(kwargs['seed'])
+    
         
     if kwargs['isFasta']:
         
@@ -133,8 +210,10 @@ def imp_train_result(data_name, model_path, kwargs, user_kwargs, fasta_kwargs):
                 )
             if re.search('positive',output_file):    
                 X_pos_file_name = output_file
+                pos_fasta = fasta
             else:
                 X_neg_file_name = output_file
+                neg_fasta = fasta
         
         
         pPath = os.path.split(os.path.realpath(__file__))[0]
@@ -142,8 +221,20 @@ def imp_train_result(data_name, model_path, kwargs, user_kwargs, fasta_kwargs):
                             pPath + '/' + X_pos_file_name)
         X_neg = SelfGet(name = True).get_data(
                             pPath + '/' + X_neg_file_name)
+        
+        groups = None
+        if kwargs['set_type'] == 'similarity':
+            print(f'Clustering similar proteins...')
+            groups = fasta_groups(
+                [data_name + '/' + pos_fasta, data_name + '/' + neg_fasta],
+                place_protein_id = fasta_kwargs['place_protein_id'],
+                protein_ids = feature_ids(pPath + '/' + X_pos_file_name) + feature_ids(
+                    pPath + '/' + X_neg_file_name),
+                threshold = fasta_kwargs['similarity_threshold'],
+                random_state = kwargs.get('seed') or 0)
                             
-        datasets = ttv_split(X_pos = X_pos,X_neg = X_neg,ratio = kwargs['ratio'])
+        datasets = ttv_split(X_pos = X_pos,X_neg = X_neg,ratio = kwargs['ratio'],
+                             random_state = rng, groups = groups)
         
     elif kwargs['isUser']:
         
@@ -164,7 +255,8 @@ def imp_train_result(data_name, model_path, kwargs, user_kwargs, fasta_kwargs):
                                 delimiter = user_kwargs['delimiter']).get_data(
                                     data_name + '/' + dataset)
         
-        datasets = ttv_split(X_pos = X_pos,X_neg = X_neg,ratio = kwargs['ratio'])
+        datasets = ttv_split(X_pos = X_pos,X_neg = X_neg,ratio = kwargs['ratio'],
+                             random_state = rng)
         
     else:
             
@@ -190,19 +282,38 @@ def imp_train_result(data_name, model_path, kwargs, user_kwargs, fasta_kwargs):
                           
             print(f'Importing data...')
             datasets = data_model.get_data(
-                data_name = data_name)
+                data_name = data_name, random_state = rng)
         
         else:
             
             print(f'Importing data...')
             datasets = data_model.get_data(
-                data_name = data_name)
-        
+                data_name = data_name, random_state = rng)
+    
+    return datasets
+
+def scale_sets(datasets, scale_type):
+    
     if len(datasets) == 6:
         X_train,X_test,X_validation,y_train,y_test,y_validation = datasets
         
-        X_train,scaler = scale_methods(X_train,scale_type = kwargs['scale_type'])
+        X_train,scaler = scale_methods(X_train,scale_type = scale_type)
         X_test,X_validation = scaler.transform(X_test),scaler.transform(X_validation)
+        return X_train,X_test,X_validation,y_train,y_test,y_validation
+    
+    if len(datasets) == 4:
+        X_train,X_test,y_train,y_test = datasets
+        
+        X_train,scaler = scale_methods(X_train,scale_type = scale_type)
+        X_test= scaler.transform(X_test)
+        return X_train,X_test,y_train,y_test
+
+def fit_result(data_name, datasets, model_path, kwargs):
+    
+    seed_training(kwargs)
+    
+    if len(datasets) == 6:
+        X_train,X_test,X_validation,y_train,y_test,y_validation = datasets
         
         print(f'Training starts...')
         model = classification_methods(ml_type = kwargs['ml_type'],
@@ -210,7 +321,11 @@ def imp_train_result(data_name, model_path, kwargs, user_kwargs, fasta_kwargs):
                                 y_train = y_train,
                                 X_valid = X_validation,
                                 y_valid = y_validation,
-                                path = model_path
+                                path = model_path,
+                                n_jobs = kwargs.get('n_jobs', -1),
+                                search = kwargs.get('search', 'random'),
+                                cv_budget = kwargs.get('cv_budget'),
+                                fit_cache = kwargs.get('fit_cache')
                                 )
         
         print(f'Predicting test-validation sets labels and Scoring...')
@@ -226,14 +341,15 @@ def imp_train_result(data_name, model_path, kwargs, user_kwargs, fasta_kwargs):
         
         X_train,X_test,y_train,y_test = datasets
         
-        X_train,scaler = scale_methods(X_train,scale_type = kwargs['scale_type'])
-        X_test= scaler.transform(X_test)
-        
         print(f'Training starts...')
         model = classification_methods(ml_type = kwargs['ml_type'],
                                 X_train = X_train,
                                 y_train = y_train,
-                                path = model_path
+                                path = model_path,
+                                n_jobs = kwargs.get('n_jobs', -1),
+                                search = kwargs.get('search', 'random'),
+                                cv_budget = kwargs.get('cv_budget'),
+                                fit_cache = kwargs.get('fit_cache')
                                 )
         print(f'Predicting test set labels and Scoring...')
         score_train = evaluate_score(model,X_train,y_train,preds = False)
@@ -242,9 +358,223 @@ def imp_train_result(data_name, model_path, kwargs, user_kwargs, fasta_kwargs):
         idn = re.split('/',data_name)[-1]
         print(f'Training and scoring is done for {idn}\n---------***---------\n')
         return {'train':score_train,'test':score_test}
+
+def train_result(data_name, datasets, model_path, kwargs):
+    
+    return fit_result(data_name, scale_sets(datasets, kwargs['scale_type']), model_path, kwargs)
+
+def imp_train_result(data_name, model_path, kwargs, user_kwargs, fasta_kwargs):
+    
+    datasets = imp_result(data_name, kwargs, user_kwargs, fasta_kwargs)
+    return train_result(data_name, datasets, model_path, kwargs)
+
+def prefetch_datasets(data_names, n_prefetch, kwargs, user_kwargs, fasta_kwargs):
+    '''
+    Description:
+        Import datasets in a background thread while the caller trains on
+        previous ones. At most n_prefetch imported datasets wait in queue,
+        so memory is bounded by n_prefetch + 2 datasets. Datasets are
+        yielded in the order of data_names. Imports do not touch global
+        random generators (see imp_result), so scores of a seed do not
+        depend on timing of the background thread.
+    '''
+    imported = queue.Queue(maxsize = n_prefetch)
+    
+    def producer():
+        for data_name in data_names:
+            try:
+                imported.put((data_name, imp_result(data_name, kwargs, user_kwargs, fasta_kwargs)))
+            except Exception as e:
+                imported.put((data_name, e))
+                return
+    
+    threading.Thread(target = producer, daemon = True).start()
+    
+    for _ in data_names:
+        data_name, datasets = imported.get()
+        if isinstance(datasets, Exception):
+            raise datasets
+        yield data_name, datasets
         
     
 
+def run_safely(function, *args):
+    '''
+    Description:
+        Run a job such as imp_train_result in a worker process. Errors are
+        returned instead of raised so that other jobs keep running.
+    '''
+    try:
+        return function(*args), None
+    except BaseException:
+        return None, traceback.format_exc()
+
+def run_key(data_name, kwargs, fasta_kwargs):
+    '''
+    Description:
+        Key of a run in results store
+    '''
+    return ResultStore.key(data_name = data_name,
+                           similarity_threshold = fasta_kwargs['similarity_threshold'], **kwargs)
+
+def parallel_loop(data_names, kwargs, user_kwargs, fasta_kwargs, store = None, stored = None):
+    '''
+    Description:
+        Run datasets in a pool of kwargs['workers'] processes. Processors
+        are split between workers and the hyperparameter search in each
+        of them. Scores of each dataset are appended to score path as soon
+        as it is finished. Scores in stored are written first.
+    '''
+    workers = kwargs['workers']
+    kwargs = dict(kwargs, n_jobs = max(1, (os.cpu_count() or 1) // workers))
+    
+    header = True
+    for idn,scores in (stored or {}).items():
+        multiple_form_table({idn:scores}, score_path = kwargs['score_path'],
+                            header = header, end_table = False)
+        header = False
+    
+    failed = []
+    with ProcessPoolExecutor(max_workers = workers) as executor:
+        futures = {}
+        for data_name in data_names:
+            model_path = kwargs['model_path']
+            if model_path is not None:
+                model_path = data_name + '_' + model_path
+            futures[executor.submit(run_safely, imp_train_result, data_name, model_path,
+                                    kwargs, user_kwargs, fasta_kwargs)] = data_name
+        
+        for future in as_completed(futures):
+            idn = re.split('/',futures[future])[-1]
+            scores, error = future.result()
+            if error is not None:
+                print(f'Training and scoring failed for {idn}:\n{error}')
+                failed.append(idn)
+                continue
+            if store is not None:
+                store.add(run_key(futures[future], kwargs, fasta_kwargs), scores)
+            multiple_form_table({idn:scores}, score_path = kwargs['score_path'],
+                                header = header, end_table = False)
+            header = False
+    
+    if not header:
+        print(f'Scores are written to score path: {kwargs["score_path"]}\n\n'
+              f'---------***---------\n\n')
+    if failed:
+        print(f'Evaluation for these datasets could not be done: {", ".join(failed)}')
+
+MATRIX_AXES = ('protein_feature', 'scale_type', 'ml_type')
+
+def matrix_records(data_name, cell, scores):
+    
+    idn = re.split('/',data_name)[-1]
+    return [dict({'Dataset Name':idn, 'Protein Feature':cell['protein_feature'],
+                  'Scale Type':cell['scale_type'], 'ML Type':cell['ml_type'], 'Set':sc},
+                 **scores[sc]) for sc in scores.keys()]
+
+def matrix_loop(data_names, kwargs, user_kwargs, fasta_kwargs):
+    '''
+    Description:
+        Benchmark every combination of protein_feature, scale_type and
+        ml_type lists in kwargs. Each dataset is imported and split once
+        per protein feature and scaled once per scale type, then models
+        of all ml types are trained on the same sets, in kwargs['workers']
+        processes if it is larger than 1. Scores are appended to score
+        path as a tidy table with one row for each dataset, protein
+        feature, scale type, ml type and set.
+    '''
+    axes = {axis:kwargs[axis] if type(kwargs[axis]) == list else [kwargs[axis]]
+            for axis in MATRIX_AXES}
+    workers = kwargs.get('workers', 1)
+    n_jobs = max(1, (os.cpu_count() or 1) // workers) if workers > 1 else -1
+    
+    store = None
+    if kwargs.get('results_store') is not None:
+        store = ResultStore(kwargs['results_store'])
+    
+    executor = ProcessPoolExecutor(max_workers = workers) if workers > 1 else None
+    header = True
+    failed = []
+    n_stored = 0
+    for data_name in data_names:
+        idn = re.split('/',data_name)[-1]
+        for protein_feature in axes['protein_feature']:
+            
+            cells = {}
+            for scale_type in axes['scale_type']:
+                for ml_type in axes['ml_type']:
+                    cells[(scale_type, ml_type)] = dict(kwargs, protein_feature = protein_feature,
+                                                        scale_type = scale_type, ml_type = ml_type,
+                                                        n_jobs = n_jobs)
+            
+            #Cells which are already scored with same parameters are skipped
+            pending = {}
+            for cell,cell_kwargs in cells.items():
+                key = run_key(data_name, cell_kwargs, fasta_kwargs)
+                if store is not None and key in store:
+                    tidy_form_table(matrix_records(data_name, cell_kwargs, store.get(key)),
+                                    score_path = kwargs['score_path'], header = header)
+                    header = False
+                    n_stored += 1
+                else:
+                    pending[cell] = cell_kwargs
+            if not pending:
+                continue
+            
+            print('---------***---------\n')
+            print(f'Dataset: {idn}, Protein Feature: {protein_feature}')
+            try:
+                datasets = imp_result(data_name, dict(kwargs, protein_feature = protein_feature),
+                                      user_kwargs, fasta_kwargs)
+            except Exception:
+                print(f'Importing failed for {idn}:\n{traceback.format_exc()}')
+                failed.extend([f'{idn}:{protein_feature}:{st}:{ml}' for st,ml in pending])
+                continue
+            
+            jobs = []
+            for scale_type in axes['scale_type']:
+                scale_cells = [cell for cell in pending if cell[0] == scale_type]
+                if not scale_cells:
+                    continue
+                scaled = scale_sets(datasets, scale_type)
+                for cell in scale_cells:
+                    model_path = kwargs['model_path']
+                    if model_path is not None:
+                        model_path = '_'.join([data_name, protein_feature, cell[0], cell[1], model_path])
+                    args = (fit_result, data_name, scaled, model_path, pending[cell])
+                    if executor is not None:
+                        jobs.append((cell, executor.submit(run_safely, *args)))
+                    else:
+                        jobs.append((cell, run_safely(*args)))
+            
+            if executor is not None:
+                cell_of = {future:cell for cell,future in jobs}
+                jobs = ((cell_of[future], future.result()) for future in as_completed(cell_of))
+            
+            for cell,(scores,error) in jobs:
+                cell_kwargs = pending[cell]
+                if error is not None:
+                    print(f'Training and scoring failed for {idn}, {protein_feature}, '
+                          f'{cell[0]}, {cell[1]}:\n{error}')
+                    failed.append(f'{idn}:{protein_feature}:{cell[0]}:{cell[1]}')
+                    continue
+                if store is not None:
+                    store.add(run_key(data_name, cell_kwargs, fasta_kwargs), scores)
+                tidy_form_table(matrix_records(data_name, cell_kwargs, scores),
+                                score_path = kwargs['score_path'], header = header)
+                header = False
+    
+    if executor is not None:
+        executor.shutdown()
+    if n_stored:
+        print(f'Scores of {n_stored} combinations are found in {kwargs["results_store"]}, '
+              f'they are not computed again.')
+    if not header:
+        print(f'Scores are written to score path: {kwargs["score_path"]}\n\n'
+              f'---------***---------\n\n')
+    if failed:
+        print(f'Evaluation for these combinations could not be done: {", ".join(failed)}')
+
 def loop_trough(file_name, kwargs, user_kwargs, fasta_kwargs):
     model_path = kwargs['model_path']
     data_names = []
@@ -252,20 +582,60 @@ def loop_trough(file_name, kwargs, user_kwargs, fasta_kwargs):
         for row in f:
             if row.strip('\n') != '':
                 data_names.append(row.strip('\n'))
+    
+    #More than one protein_feature, scale_type or ml_type is benchmarked in matrix mode
+    if data_names and any(type(kwargs[axis]) == list for axis in MATRIX_AXES):
+        if kwargs.get('prefetch', 0) > 0:
+            print('prefetch is not used in matrix mode, datasets are imported one by one.')
+        matrix_loop(data_names, kwargs, user_kwargs, fasta_kwargs)
+        return
+    
+    #Datasets which are already scored with same parameters are skipped
+    store = None
+    if kwargs.get('results_store') is not None:
+        store = ResultStore(kwargs['results_store'])
+    stored = {}
+    for data_name in data_names:
+        key = run_key(data_name, kwargs, fasta_kwargs)
+        if store is not None and key in store:
+            stored[data_name] = store.get(key)
+    if stored:
+        print(f'Scores of {len(stored)} datasets are found in {kwargs["results_store"]}, '
+              f'they are not computed again.')
+    pending = [data_name for data_name in data_names if data_name not in stored]
+    
     score_dict = {}
-    if data_names:
-        for data_name in data_names:
+    if data_names and kwargs.get('workers', 1) > 1:
+        if kwargs.get('prefetch', 0) > 0:
+            print('prefetch is not used when workers > 1, each worker imports its own datasets.')
+        parallel_loop(pending, kwargs, user_kwargs, fasta_kwargs, store = store,
+                      stored = {re.split('/',data_name)[-1]:scores for data_name,scores in stored.items()})
+    elif data_names:
+        if kwargs.get('prefetch', 0) > 0:
+            datasets_iter = prefetch_datasets(pending, kwargs['prefetch'],
+                                              kwargs, user_kwargs, fasta_kwargs)
+        else:
+            datasets_iter = ((data_name, None) for data_name in pending)
+        
+        results = dict(stored)
+        for data_name, datasets in datasets_iter:
             if kwargs['model_path'] is not None:
                 model_path = data_name + '_' + kwargs['model_path']
            
             print('---------***---------\n')
             idn = re.split('/',data_name)[-1]
             print(f'Dataset: {idn}')
-            score_dict.update({re.split('/',data_name)[-1]:imp_train_result(data_name,
-                                                          model_path,
-                                                          kwargs,
-                                                          user_kwargs,
-                                                          fasta_kwargs)})
+            if datasets is None:
+                datasets = imp_result(data_name, kwargs, user_kwargs, fasta_kwargs)
+            results[data_name] = train_result(data_name,
+                                              datasets,
+                                              model_path,
+                                              kwargs)
+            if store is not None:
+                store.add(run_key(data_name, kwargs, fasta_kwargs), results[data_name])
+        
+        for data_name in data_names:
+            score_dict.update({re.split('/',data_name)[-1]:results[data_name]})
         
         if score_dict.keys():
             print(f'Scores are written to score path: {kwargs["score_path"]}\n\n'
@@ -287,9 +657,15 @@ if __name__ == '__main__':
     r = args.ratio
     if len(r) == 1: r = r[0]
     
+    axes = {}
+    for axis in ['ml_type', 'scale_type', 'protein_feature']:
+        axes[axis] = getattr(args, axis)
+        if len(axes[axis]) == 1: axes[axis] = axes[axis][0]
+    
     
     fasta_kwargs = dict(place_protein_id = args.place_protein_id,
-                        max_len = args.max_len)
+                        max_len = args.max_len,
+                        similarity_threshold = args.similarity_threshold)
     
     user_kwargs = dict(delimiter = args.delimiter,
                        name = args.name,
@@ -298,15 +674,22 @@ if __name__ == '__main__':
     kwargs = dict(
         isUser = args.isUser,
         isFasta = args.isFasta,
-        ml_type = args.ml_type,
-        scale_type = args.scale_type,
+        ml_type = axes['ml_type'],
+        scale_type = axes['scale_type'],
         score_path = args.score_path,
         model_path = args.model_path,
         ratio = r,
         output_fasta = args.output_fasta,
-        protein_feature = args.protein_feature,
+        protein_feature = axes['protein_feature'],
         pre_determined = args.pre_determined,
-        set_type = args.set_type
+        set_type = args.set_type,
+        prefetch = args.prefetch,
+        workers = args.workers,
+        results_store = args.results_store,
+        search = args.search,
+        cv_budget = args.cv_budget,
+        fit_cache = args.fit_cache,
+        seed = args.seed
         ) 
         
     loop_trough(args.file_name,
@@ -7,12 +7,20 @@ Created on Tue Mar  9 01:00:05 2021
 
 import os, sys, re
 import random
-from zipfile import ZipFile
-from ..utils import separator,  self_data, _classif_data_import, download_data
+import requests
+import numpy as np
+from zipfile import ZipFile, is_zipfile
+from concurrent.futures import ThreadPoolExecutor
+from sklearn.utils import check_random_state
+from ..utils import separator,  self_data, _classif_data_import, _classif_split_import, download_data
+from ..utils import _classif_batch_import, _classif_split_rows, _take_stacked, split_indices, Split
+
+SERVER_PATH = "https://liverdb.kansil.org/profab"
 
 class cls_data_loader():
     
-    def __init__(self,ratio,protein_feature,main_set,set_type,label,pre_determined):
+    def __init__(self,ratio,protein_feature,main_set,set_type,label,pre_determined,dtype = 'float64',
+                 cache = False):
         
         """
         Description:
@@ -40,14 +48,23 @@ class cls_data_loader():
             label: {None, 'positive','negative'}, (default = None): If None, data
                     is given directly, if 'negative', only negative set is given,
                     If 'positive', only positive set is given.
+            dtype: {'float32','float64'}, (default = 'float64'): type of
+                    returned feature matrices
+            cache: bool, (default = False), if True, parsed feature matrices
+                    are saved as memory-mappable .npy files next to the
+                    zip file of data and reused in later imports. Returned
+                    matrices are then read only memory-mapped arrays, copy
+                    them with np.array to modify.
         """
         self.ratio = ratio
+        self.dtype = dtype
+        self.cache = cache
         self.protein_feature = protein_feature
         self.set_type = set_type
         self.label = label
         self.pre_determined = pre_determined
         self.main_set = main_set#{ec_dataset,go_dataset}: Indicated which data folder will be opened.
-        self.server_path = "https://liverdb.kansil.org/profab"
+        self.server_path = SERVER_PATH
         self.raiser()
         
         
@@ -70,6 +87,9 @@ class cls_data_loader():
         if self.label not in [None,'positive','negative','positive_negative']:
             raise AttributeError('Please enter correct label. Options are: "None, positive, negative"')
         
+        if self.dtype not in ['float32','float64']:
+            raise AttributeError('Please enter correct dtype. Options are: "float32, float64"')
+        
         
         if self.pre_determined:
             if type(self.ratio) not in [None,float]:
@@ -82,44 +102,25 @@ class cls_data_loader():
                     'Please enter ratio value in true type. Options: "None, float and list" for pre_determined = False')
         
         
-    def get_data(self,data_name):
+    def get_data(self,data_name,random_state = None):
         
         """
         Description:
             Take attributes  and return applicable datasets. If no data is available at local, then is dowloaded
         Parameters:
             data_name: {string}, name of dataset to get
+            random_state: {int, RandomState}, (default = None), seed of
+                shuffling and splitting. If None, global numpy random state
+                is used. A RandomState of its own keeps an import
+                reproducible when other threads draw random numbers.
         Return:
             Multiple arrays that contains training, test and validation dataset and 
-            their labels. {numpy array, list}
+            their labels. {numpy array}
             
         """
         
-        #Check whether given data name and its family are matched
-        if self.main_set[:2].lower() != data_name[:2].lower():
-            
-            raise FileNotFoundError(f'Please enter a correct data name: {data_name} not found in {self.main_set[:2].upper()} sets')
-        
-        pPath = os.path.split(os.path.realpath(__file__))[0]
-        
-        #Check whether there is save folder
-        if not os.path.exists(self.main_set):
-            os.makedirs(self.main_set)
-        #Check whether there is a folder named main set
-        if os.path.isfile(self.main_set + '/' + data_name + '.zip'):
-            data_path = self.main_set + '/' + data_name + '.zip'
-
-            
-        #If no given data name, then data will be downloaded from the server to folder of main set.
-        #This condition also looks for if data is available in server.
-        else:
-            print(f'No local dataset for {data_name} is available. Downloading from server ...')
-            
-            data_server_path = self.server_path + '/' + self.main_set + '/' + data_name + '.zip'
-            
-            data_path = self.main_set + '/' + data_name + '.zip'
-            
-            download_data(data_server_path,data_path)
+        data_path = self.data_path(data_name)
+        rng = check_random_state(random_state)
             
         #Rest is checking wheter files are optional and preparing datasets
         if not self.pre_determined:
@@ -130,8 +131,11 @@ class cls_data_loader():
             if pos_file not in ZipFile(data_path).namelist() or neg_file not in ZipFile(data_path).namelist():
                 self.look_options(ZipFile(data_path).namelist(), data_name)
 
+            #Positive and negative sets are not concatenated, sets are taken from them at once
             pX,nX,X,y = _classif_data_import(zip_data = data_path, pos_file = 
-                                               pos_file, neg_file = neg_file, label = self.label)
+                                               pos_file, neg_file = neg_file,
+                                               label = self.label or 'positive_negative',
+                                               dtype = self.dtype, cache = self.cache)
 
 
             if self.label == 'positive':
@@ -140,14 +144,14 @@ class cls_data_loader():
                 return nX
             
             else:
-                trdn = list(zip(X,y))
-                random.shuffle(trdn)
-                X,y = zip(*(trdn))
+                y = np.concatenate([np.ones(len(pX), dtype = int), -np.ones(len(nX), dtype = int)])
                 
                 if not self.ratio:
-                    return X,y
+                    perm = rng.permutation(len(y))
+                    return _take_stacked([pX,nX], perm),y[perm]
                 if self.ratio is not None:
-                    return separator(ratio = self.ratio,X = X,y =y)
+                    return separator(ratio = self.ratio,X = [pX,nX],y = y,random_state = rng,
+                                     stacked = True)
                 else:
                     raise AttributeError(
                         'Please enter ratio value in true type. Options: "None, float and list" for pre_determined = False')
@@ -163,73 +167,153 @@ class cls_data_loader():
                 
             
             
-            train_pos_idx = data_name + '/' + self.set_type + '_positive_train_indices.txt'
-            train_neg_idx = data_name + '/' + self.set_type + '_negative_train_indices.txt'
-
-            test_pos_idx = data_name + '/' + self.set_type + '_positive_test_indices.txt'
-            test_neg_idx = data_name + '/' + self.set_type + '_negative_test_indices.txt'
-                        
-
-            tpX,tnX,tX,ty = _classif_data_import(zip_data = data_path, pos_file = pos_file,
-                                                         neg_file = neg_file, pos_indices = train_pos_idx,
-                                                         neg_indices = train_neg_idx,
-                                                         label = self.label)
-            tepX,tenX,teX,tey = _classif_data_import(zip_data = data_path, pos_file = pos_file,
-                                                               neg_file = neg_file,
-                                                               pos_indices = test_pos_idx,
-                                                               neg_indices = test_neg_idx,
-                                                               label = self.label)
-                
-
-            return_pos = [tpX,tepX]
-            return_neg = [tnX,tenX]
-            
+            parts = ['train','test']
             if self.set_type == 'temporal':
-                valid_pos_idx = data_name + '/' + self.set_type + '_positive_validation_indices.txt'
-                valid_neg_idx = data_name + '/' + self.set_type + '_negative_validation_indices.txt'
+                parts.append('validation')
+            
+            indices = [(data_name + '/' + self.set_type + '_positive_' + part + '_indices.txt',
+                        data_name + '/' + self.set_type + '_negative_' + part + '_indices.txt') for part in parts]
+            
+            if self.label is not None:
                 
-                vpX,vnX,vX,vy = _classif_data_import(zip_data = data_path,pos_file = pos_file, neg_file = neg_file, 
-                    pos_indices = valid_pos_idx,neg_indices = valid_neg_idx,
-                    label = self.label)            
+                #Feature files are parsed once and all partitions are sliced from them
+                sets = _classif_split_import(zip_data = data_path, pos_file = pos_file,
+                                             neg_file = neg_file, label = self.label,
+                                             indices = indices, dtype = self.dtype,
+                                             cache = self.cache)
                 
-                return_pos.extend([vpX])
-                return_neg.extend([vnX])
-
+                return_pos = [pX for pX,nX,X,y in sets]
+                return_neg = [nX for pX,nX,X,y in sets]
             
             if self.label == 'positive':
                 return return_pos
             elif self.label == 'negative':
                 return return_neg
             elif self.label == 'positive_negative':
-                return return_pos.extend(return_neg)
+                return return_pos + return_neg
             else:
                 
-                trdn = list(zip(tX,ty))
-                random.shuffle(trdn)
-                tX,ty = zip(*trdn)
-            
-                terdn = list(zip(teX,tey))
-                random.shuffle(terdn) 
-                teX,tey = zip(*terdn)
+                #Partitions are formed as shuffled rows of stacked positive and negative sets
+                #and each of them is taken from feature matrices at once
+                pX,nX,rows = _classif_split_rows(zip_data = data_path, pos_file = pos_file,
+                                                 neg_file = neg_file, indices = indices,
+                                                 dtype = self.dtype, cache = self.cache)
+                rows = [(idx[perm],y[perm]) for idx,y in rows
+                        for perm in [rng.permutation(len(y))]]
+                (t_idx,ty),(te_idx,tey) = rows[:2]
             
                 if self.set_type == 'temporal':
-                    vrdn = list(zip(vX,vy))
-                    random.shuffle(vrdn)
-                    vX,vy = zip(*vrdn)
-                    return tX,teX,vX,ty,tey,vy
+                    v_idx,vy = rows[2]
+                    return tuple(Split(t_idx,te_idx,v_idx).take([pX,nX], stacked = True) + [ty,tey,vy])
             
             
                 if self.ratio is None:
-                    return tX,teX,ty,tey
+                    return tuple(Split(t_idx,te_idx).take([pX,nX], stacked = True) + [ty,tey])
                     
                 if type(self.ratio) == float:
-                    tX,vX,ty,vy = separator(ratio = self.ratio,X = tX,y = ty)
-                    return tX,teX,vX,ty,tey,vy
+                    split = split_indices(ty, self.ratio, random_state = rng)
+                    tX,teX,vX = Split(t_idx[split.train],te_idx,t_idx[split.test]).take([pX,nX], stacked = True)
+                    return tX,teX,vX,ty[split.train],tey,ty[split.test]
                 
                 else:
                     raise AttributeError(
                         'Please enter ratio value in true type. Options: "None, float" for pre_determined = True')
                     
+    def data_path(self,data_name):
+        
+        """
+        Description:
+            Path of zip file of dataset. If no data is available at local,
+            then it is downloaded.
+        Parameters:
+            data_name: {string}, name of dataset
+        Return:
+            data_path: {string}, path of zip file
+        """
+        
+        #Check whether given data name and its family are matched
+        if self.main_set[:2].lower() != data_name[:2].lower():
+            
+            raise FileNotFoundError(f'Please enter a correct data name: {data_name} not found in {self.main_set[:2].upper()} sets')
+        
+        #Check whether there is save folder
+        if not os.path.exists(self.main_set):
+            os.makedirs(self.main_set)
+        
+        data_path = self.main_set + '/' + data_name + '.zip'
+        
+        #If no given data name, then data will be downloaded from the server to folder of main set.
+        #This condition also looks for if data is available in server.
+        if not is_zipfile(data_path):
+            print(f'No local dataset for {data_name} is available. Downloading from server ...')
+            
+            data_server_path = self.server_path + '/' + self.main_set + '/' + data_name + '.zip'
+            
+            download_data(data_server_path,data_path)
+        
+        return data_path
+    
+    def get_batches(self,data_name,batch_size = 1024,part = 'train',shuffle = True,
+                    random_state = 0):
+        
+        """
+        Description:
+            Give a part of dataset as mini-batches for out-of-core training
+            (see model_learn.incremental_methods). Feature files are read
+            block by block, so memory is bounded by batch_size rather than
+            dataset size. With cache = True, feature files are written to
+            binary cache block by block and batches are read memory-mapped.
+        Parameters:
+            data_name: {string}, name of dataset to get
+            batch_size: {int}, (default = 1024), number of proteins in a batch
+            part: {'train','test','validation'}, (default = 'train'), part of
+                dataset. If pre_determined is True, it is read from index
+                files of dataset and 'validation' part of 'random' and
+                'similarity' sets is split from training set with respect
+                to ratio. If pre_determined is False, parts are formed by
+                ratio (stratified) and all data is given if ratio is None.
+            shuffle: {bool}, (default = True), If True, batches are shuffled
+                in each call
+            random_state: {int}, (default = 0), seed of split by ratio. It
+                must be the same for all parts of a dataset.
+        Return:
+            Generator of (X, y) batches {numpy array}, y is 1 for positive
+            and -1 for negative proteins.
+        """
+        
+        if part not in ['train','test','validation']:
+            raise AttributeError('Please enter correct part. Options are: "train, test, validation"')
+        
+        data_path = self.data_path(data_name)
+        
+        pos_file = data_name + '/' + self.set_type + '_positive_' + self.protein_feature + '.txt'
+        neg_file = data_name + '/' + self.set_type + '_negative_' + self.protein_feature + '.txt'
+        
+        names = ZipFile(data_path).namelist()
+        if pos_file not in names or neg_file not in names:
+            self.look_options(names, data_name)
+        
+        indices, ratio = None, self.ratio
+        if self.pre_determined:
+            ratio, file_part = None, part
+            if self.set_type != 'temporal' and part != 'test':
+                if part == 'validation' and self.ratio is None:
+                    raise AttributeError(f'Part "{part}" is not available for ratio = None')
+                #validation set is split from training set as in get_data
+                if self.ratio is not None:
+                    file_part, ratio = 'train', self.ratio
+                    part = 'test' if part == 'validation' else part
+            indices = (data_name + '/' + self.set_type + '_positive_' + file_part + '_indices.txt',
+                       data_name + '/' + self.set_type + '_negative_' + file_part + '_indices.txt')
+        
+        elif ratio is None and part != 'train':
+            raise AttributeError(f'Part "{part}" is not available for ratio = None')
+        
+        return _classif_batch_import(zip_data = data_path, pos_file = pos_file, neg_file = neg_file,
+                                     batch_size = batch_size, indices = indices, ratio = ratio,
+                                     part = part, dtype = self.dtype, cache = self.cache,
+                                     shuffle = shuffle, random_state = random_state)
+    
     def look_options(self,name_list,data_name):
         """
         Description:
@@ -283,6 +367,72 @@ class cls_data_loader():
         return avai_sets, avai_prots
 
 
+def _main_set(data_name):
+    
+    """
+        Folder of dataset with respect to its name: go_dataset or ec_dataset
+    """
+    if data_name[:2].lower() == 'go':
+        return 'go_dataset'
+    elif data_name[:2].lower() == 'ec':
+        return 'ec_dataset'
+    raise FileNotFoundError(f'Please enter a correct data name: {data_name} is neither GO nor EC set')
+
+def prefetch_data(data_names, n_workers = 4, checksums = None):
+    
+    """
+    Description:
+        Download multiple GO and EC datasets concurrently over a pooled
+        session. Datasets that are already available at local are skipped.
+        Each file is downloaded as in get_data: resumed if interrupted and
+        verified before it is saved to its main set folder.
+    Parameters:
+        data_names: {string, list}, names of datasets or name of a file that
+            includes a dataset name in each line such as sample_inputs.txt
+        n_workers: {int}, (default = 4), number of concurrent downloads
+        checksums: {dict}, (default = None), expected hashes of datasets as
+            {data_name: "<algorithm>:<hex digest>"}
+    Return:
+        failed: {dict}, names of datasets that could not be downloaded and
+            reasons of failure
+    """
+    
+    if type(data_names) == str:
+        with open(data_names) as f:
+            data_names = [row.strip() for row in f if row.strip() != '']
+    checksums = checksums or {}
+    
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections = n_workers, pool_maxsize = n_workers)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    
+    def fetch(data_name):
+        main_set = _main_set(data_name)
+        data_path = main_set + '/' + data_name + '.zip'
+        if is_zipfile(data_path):
+            return
+        os.makedirs(main_set, exist_ok = True)
+        try:
+            download_data(SERVER_PATH + '/' + main_set + '/' + data_name + '.zip', data_path,
+                          checksum = checksums.get(data_name), session = session, progress = False)
+        except SystemExit:
+            raise FileNotFoundError(f'{data_name} is not available in server')
+    
+    failed = {}
+    with ThreadPoolExecutor(max_workers = n_workers) as executor:
+        futures = {data_name:executor.submit(fetch, data_name) for data_name in data_names}
+        for data_name,future in futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                failed[data_name] = e
+                print(f'{data_name} could not be downloaded: {e}')
+    session.close()
+    
+    return failed
+
+
 class casual_importer():
     
     def __init__(self,delimiter, name, label):
@@ -6,6 +6,7 @@ Created on Mon Mar  8 22:32:37 2021
 """
 
 from . import data_importer
+from .data_importer import prefetch_data
     
 class ECNO(data_importer.cls_data_loader):
     '''
@@ -34,20 +35,30 @@ class ECNO(data_importer.cls_data_loader):
         label: {None, 'positive','negative'}, (default = None): If None, data
                 is given directly, if 'negative', only negative set is given,
                 If 'positive', only positive set is given.
+        dtype: {'float32','float64'}, (default = 'float64'): type of returned
+                feature matrices
+        cache: bool, (default = False), if True, parsed feature matrices are
+                saved as memory-mappable .npy files next to the zip file of
+                data and reused in later imports. Returned matrices are then
+                read only memory-mapped arrays, copy them with np.array to
+                modify.
     
     Returns:
         Multiple arrays that contains training, test and validation dataset and 
-        their labels. {numpy array, list}
+        their labels. {numpy array}
     '''
     def __init__(self,protein_feature = 'paac',
                  set_type = 'random',
                  ratio = 0.2,
                  label = None,
-                 pre_determined = True):
+                 pre_determined = True,
+                 dtype = 'float64',
+                 cache = False):
 
         super().__init__(ratio = ratio, protein_feature = protein_feature,
                          set_type = set_type,label = label,
-                         pre_determined = pre_determined, main_set = 'ec_dataset') 
+                         pre_determined = pre_determined, main_set = 'ec_dataset',
+                         dtype = dtype, cache = cache) 
 
 class GOID(data_importer.cls_data_loader):
     '''
@@ -76,20 +87,30 @@ class GOID(data_importer.cls_data_loader):
         label: {None, 'positive','negative'}, (default = None): If None, data
                 is given directly, if 'negative', only negative set is given,
                 If 'positive', only positive set is given.
+        dtype: {'float32','float64'}, (default = 'float64'): type of returned
+                feature matrices
+        cache: bool, (default = False), if True, parsed feature matrices are
+                saved as memory-mappable .npy files next to the zip file of
+                data and reused in later imports. Returned matrices are then
+                read only memory-mapped arrays, copy them with np.array to
+                modify.
                 
     Returns:
         Multiple arrays that contains training, test and validation dataset and 
-        their labels. {numpy array, list}
+        their labels. {numpy array}
     '''
     def __init__(self,protein_feature = 'paac',
                  set_type = 'random',
                  ratio = 0.2,
                  label = None,
-                 pre_determined = False):
+                 pre_determined = False,
+                 dtype = 'float64',
+                 cache = False):
         
         super().__init__(ratio = ratio, protein_feature = protein_feature,
                          set_type = set_type,label = label,
-                         pre_determined = pre_determined, main_set = 'go_dataset')       
+                         pre_determined = pre_determined, main_set = 'go_dataset',
+                         dtype = dtype, cache = cache)       
 
 class SelfGet(data_importer.casual_importer):
     
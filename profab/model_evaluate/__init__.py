@@ -6,5 +6,6 @@ Created on Sat Aug  7 23:15:02 2021
 """
 
 
-from .evaluation_metrics import evaluate_score
-from .form_table import *
\ No newline at end of file
+from .evaluation_metrics import evaluate_score, evaluate_batch_score
+from .form_table import *
+from .result_store import ResultStore
\ No newline at end of file
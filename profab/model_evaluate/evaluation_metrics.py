@@ -433,3 +433,35 @@ def evaluate_score(model,X,y, preds = False, learning_method = 'classif', isDeep
     if preds:
         return Scores,f
     return Scores
+
+
+def evaluate_batch_score(model, batches, preds = False):
+    
+    """
+    Description:
+        Predict labels of mini-batches and evaluate classification scoring
+        metrics over all of them. Only labels are kept in memory, so data
+        that does not fit in memory can be evaluated.
+        
+    Parameters
+        model: model type used to predict new label
+        batches: {iterable}, (X, y) batches such as given by get_batches
+        preds: {bool}, default = False, if True, function returns true and
+            predicted labels, too
+    Returns
+        Scores: {dict}, recall, precision, f1, acc, f 0.5, mcc scores
+        y: {numpy array}, true labels in order of batches
+        f: {numpy array}, predicted labels
+    """
+    
+    y, f = [], []
+    for X_batch, y_batch in batches:
+        y.append(np.ravel(y_batch))
+        f.append(model.predict(X_batch))
+    y, f = np.concatenate(y), np.concatenate(f)
+    
+    Scores = cl_prec_rec_f1_acc_mcc(y,f)
+    
+    if preds:
+        return Scores,y,f
+    return Scores
@@ -5,7 +5,7 @@ Created on Sat Aug  7 23:00:39 2021
 @author: Sameitos
 """
 
-from ..utils.imp_split_form import _classif_form_table, _rgr_form_table, multiform_table
+from ..utils.imp_split_form import _classif_form_table, _rgr_form_table, multiform_table, tidy_table
 
 def form_table(scores, learning_method = 'classif',path = 'score_path.csv'):
 
@@ -23,7 +23,7 @@ def form_table(scores, learning_method = 'classif',path = 'score_path.csv'):
     form_methods = {'classif':_classif_form_table,'rgr':_rgr_form_table}
     form_methods[learning_method](scores = scores, score_path = path)    
     
-def multiple_form_table(score_dict, score_path = 'score_path.csv'):
+def multiple_form_table(score_dict, score_path = 'score_path.csv', header = True, end_table = True):
     
     '''
     Description:
@@ -33,9 +33,32 @@ def multiple_form_table(score_dict, score_path = 'score_path.csv'):
         score_dict: A dict of scores includes results of multiple data,
         score_path: 'score_path.csv', A destination where scores are 
                         saved. It must be .csv file.
+        header: default = True, If True, column names are written first.
+                        Set False to append scores of next datasets to
+                        the same table.
+        end_table: default = True, If True, an empty line is written
+                        after scores to close the table.
     '''
     
-    multiform_table(score_dict, score_path)
+    multiform_table(score_dict, score_path, header = header, end_table = end_table)
+
+def tidy_form_table(records, score_path = 'score_path.csv', header = True):
+    
+    '''
+    Description:
+        This function saves scores as a tidy table, one row for each
+        record. It is used when scores of many datasets, protein features,
+        scaling types and models are compared in a single table.
+    Parameters:
+        records: A list of dicts, each includes values of a row such as
+                        {'Dataset Name':..., 'ML Type':..., 'Set':...,
+                        'Precision':..., ...}
+        score_path: 'score_path.csv', A destination where scores are 
+                        saved. It must be .csv file.
+        header: default = True, If True, column names are written first.
+    '''
+    
+    tidy_table(records, score_path, header = header)
     
     
     
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:12:40 2026
+
+@author: Sameitos
+"""
+
+import os
+import json
+from ..utils.imp_split_form import multiform_table
+
+KEY_FIELDS = ('data_name', 'set_type', 'protein_feature', 'scale_type', 'ml_type', 'ratio', 'seed',
+              'search', 'cv_budget', 'pre_determined', 'similarity_threshold')
+#Values of fields added later, so that older stores keep their keys
+KEY_DEFAULTS = dict(search = 'random', pre_determined = False, similarity_threshold = 0.3)
+
+class ResultStore():
+    
+    def __init__(self, path = 'results.jsonl'):
+        '''
+        Description:
+            Persistent store of scores of benchmark runs. Each finished run
+            is appended to a JSON lines file as a single line, keyed by
+            (data_name, set_type, protein_feature, scale_type, ml_type,
+            ratio, seed, search, cv_budget, pre_determined,
+            similarity_threshold). Runs found in the store can be skipped
+            when a benchmark is restarted.
+        Parameters:
+            path: {string}, (default = 'results.jsonl'), file where results
+                are kept. If it exists, stored results are loaded.
+        '''
+        self.path = path
+        self.results = {}
+        
+        if os.path.isfile(path):
+            with open(path) as f:
+                for row in f:
+                    try:
+                        record = json.loads(row)
+                    except ValueError:
+                        #last line can be incomplete if a run was killed while writing
+                        continue
+                    self.results[self.key(**record['key'])] = record['scores']
+    
+    @staticmethod
+    def key(**kwargs):
+        '''
+        Description:
+            Form key of a run from its parameters. Parameters that are not
+            in KEY_FIELDS are ignored, missing ones are None or their value
+            in KEY_DEFAULTS. similarity_threshold is kept only for
+            similarity splits, it does not change other runs.
+        '''
+        ratio = kwargs.get('ratio')
+        if type(ratio) in [list, tuple]:
+            ratio = tuple(float(r) for r in ratio)
+        #cv_budget dict is kept as sorted (key, value) pairs, JSON gives them as lists
+        cv_budget = kwargs.get('cv_budget')
+        if cv_budget:
+            cv_budget = tuple(sorted(tuple(item) for item in (cv_budget.items()
+                                     if type(cv_budget) == dict else cv_budget)))
+        values = dict(KEY_DEFAULTS, **kwargs)
+        values['ratio'] = ratio
+        values['cv_budget'] = cv_budget or None
+        values['pre_determined'] = bool(values['pre_determined'])
+        values['similarity_threshold'] = (float(values['similarity_threshold'])
+                                          if values.get('set_type') == 'similarity' else None)
+        return tuple(values.get(field) for field in KEY_FIELDS)
+    
+    def __contains__(self, key):
+        return key in self.results
+    
+    def __len__(self):
+        return len(self.results)
+    
+    def get(self, key, default = None):
+        return self.results.get(key, default)
+    
+    def add(self, key, scores):
+        '''
+        Description:
+            Save scores of a run. Line is flushed to disk before returning
+            so that it survives if process is killed afterwards.
+        Parameters:
+            key: {tuple}, key of run formed by ResultStore.key
+            scores: {dict}, scores of sets, e.g. {'train':{...},'test':{...}}
+        '''
+        scores = {sc:{metric:value.item() if hasattr(value, 'item') else value
+                      for metric,value in scores[sc].items()} for sc in scores}
+        record = {'key':dict(zip(KEY_FIELDS, key)), 'scores':scores}
+        
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(record) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self.results[key] = scores
+    
+    def to_csv(self, score_path = 'score_path.csv', keys = None):
+        '''
+        Description:
+            Write stored scores in the layout of multiple_form_table.
+        Parameters:
+            score_path: {string}, (default = 'score_path.csv'), destination
+                of table
+            keys: {list}, (default = None), keys of runs to be written in
+                order, If None, all runs are written.
+        '''
+        keys = list(self.results.keys()) if keys is None else keys
+        score_dict = {}
+        for key in keys:
+            if key in self.results:
+                name = os.path.basename(os.path.normpath(key[0]))
+                score_dict[name] = self.results[key]
+        
+        if score_dict:
+            multiform_table(score_dict, score_path)
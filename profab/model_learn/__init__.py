@@ -8,6 +8,8 @@ Created on Tue Mar  9 14:41:51 2021
 
 from .classifications import classification_methods
 from .regressions import regression_methods
+from .fit_cache import FitCache
+from .incremental import incremental_methods
 
 
 
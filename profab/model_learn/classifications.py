@@ -7,9 +7,11 @@ Created on Tue May 26 18:45:38 2020
 
 import os, sys
 import numpy as np
-from sklearn.model_selection import RandomizedSearchCV,RepeatedStratifiedKFold, PredefinedSplit
+from sklearn.model_selection import RepeatedStratifiedKFold, PredefinedSplit
 import pickle
 from .deep_classification import cnn_classifier, rnn_classifier
+from .search import search_cv, cv_budget_of, SEARCH_TYPES, SEARCH_ML_TYPES
+from .fit_cache import FitCache
 import warnings
 warnings.filterwarnings("ignore")
 
@@ -17,7 +19,8 @@ warnings.filterwarnings("ignore")
 class classifiers(object):
 
     
-    def __init__(self,path):     
+    def __init__(self,path,n_jobs = -1,search = 'random',cv_budget = None,
+                 fit_cache = None):     
         
         """
         Description: In class,6 different machine learning methods for regression 
@@ -27,6 +30,17 @@ class classifiers(object):
     
         Parameters:
             path: {string}, A destination point where model is saved.
+            n_jobs: {int}, (default = -1), Number of parallel jobs in
+                hyperparameter search. -1 means all processors.
+            search: {'random','halving','hyperband','path','precomputed'},
+                (default = 'random'),
+                Strategy of hyperparameter search.
+            cv_budget: {dict}, (default = None), Budget of cross-validation
+                in hyperparameter search with keys n_folds, n_repeats,
+                max_time, max_fits, min_folds and abort_margin. Missing keys
+                take their values from search.CV_BUDGET.
+            fit_cache: {string, FitCache}, (default = None), Folder or
+                FitCache where fits of hyperparameter search are cached.
             X_train: Feature matrix, {list, numpy array}
             y_train: (default = None), Label matrix, type = {list, numpy array}
             X_valid: (default = None), Validation Set, type = {list,numpy array}
@@ -37,8 +51,14 @@ class classifiers(object):
         
         self.path = path
         
-        self.n_folds = 10
-        self.n_jobs = -1
+        self.cv_budget = cv_budget_of(cv_budget)
+        self.n_folds = self.cv_budget['n_folds']
+        self.n_repeats = self.cv_budget['n_repeats']
+        self.n_jobs = n_jobs
+        self.search = search
+        self.fit_cache = FitCache(fit_cache) if type(fit_cache) == str else fit_cache
+        self.resource = 'n_samples'
+        self.path_param = None
         self.random_state = 0
 
       
@@ -48,7 +68,7 @@ class classifiers(object):
 
         if X_valid is None: 
             
-            cv = RepeatedStratifiedKFold(n_splits= self.n_folds,n_repeats = 5, random_state= self.random_state)
+            cv = RepeatedStratifiedKFold(n_splits= self.n_folds,n_repeats = self.n_repeats, random_state= self.random_state)
             
         else:
             
@@ -73,9 +93,13 @@ class classifiers(object):
             
             cv = PredefinedSplit(test_fold)
 
-        clf = RandomizedSearchCV(model,self.parameters,n_iter = 10,
-                                     n_jobs=self.n_jobs, cv = cv,
-                                     scoring="f1", random_state = self.random_state)
+        clf = search_cv(model,self.parameters,cv = cv,scoring = "f1",
+                        search = self.search, resource = self.resource,
+                        n_iter = 10, n_jobs = self.n_jobs,
+                        random_state = self.random_state,
+                        cv_budget = self.cv_budget,
+                        fit_cache = self.fit_cache,
+                        path_param = self.path_param)
 
         if y_train is not None:
             clf.fit(X_train,y_train)
@@ -97,6 +121,7 @@ class classifiers(object):
         from .hyperparameters import cls_logistic_regression_params as lrp
 
         self.parameters = lrp
+        self.path_param = 'C'
         model = LogisticRegression()
         return self.get_best_model(model, X_train, y_train,X_valid, y_valid)
         
@@ -106,6 +131,7 @@ class classifiers(object):
         from .hyperparameters import cls_ridge_class_params as rcp
 
         self.parameters = rcp
+        self.path_param = 'alpha'
         model = RidgeClassifier()
         return self.get_best_model(model, X_train, y_train,X_valid, y_valid)
 
@@ -133,6 +159,7 @@ class classifiers(object):
         from .hyperparameters import cls_random_forest_params as rfp
         
         self.parameters = rfp
+        self.resource = 'n_estimators'
         model = RandomForestClassifier()   
         return  self.get_best_model(model, X_train, y_train,X_valid, y_valid)
 
@@ -142,6 +169,7 @@ class classifiers(object):
         from .hyperparameters import cls_mlp_params as mlpp
 
         self.parameters = mlpp
+        self.resource = 'max_iter'
         model = MLPClassifier()
         return self.get_best_model(model, X_train, y_train,X_valid, y_valid)
 
@@ -160,6 +188,7 @@ class classifiers(object):
         from .hyperparameters import cls_gradient_boosting as gbp
         
         self.parameters = gbp
+        self.resource = 'n_estimators'
         model = GBC()
         return self.get_best_model(model, X_train, y_train,X_valid, y_valid)
 
@@ -210,7 +239,11 @@ class classifiers(object):
 def classification_methods(X_train,y_train = None,
                            X_valid = None,y_valid = None,
                            ml_type = 'SVM', 
-                           path = None
+                           path = None,
+                           n_jobs = -1,
+                           search = 'random',
+                           cv_budget = None,
+                           fit_cache = None
                            ):
     
     """
@@ -229,6 +262,43 @@ def classification_methods(X_train,y_train = None,
         y_train: (default = None), Label matrix, type = {list, numpy array}
         X_valid: (default = None), Validation Set, type = {list,numpy array}
         y_valid: (default = None), Validation Label, type = {list,numpy array}
+        n_jobs: {int}, (default = -1), Number of parallel jobs in hyperparameter
+                search. -1 means all processors. Set it lower when several
+                models are trained in parallel.
+        search: {'random','halving','hyperband','path','precomputed'},
+                (default = 'random'),
+                Strategy of hyperparameter search. 'random' trains 10 random
+                candidates on all folds. 'halving' trains many candidates
+                on small subsamples (or few trees/iterations for
+                random_forest, gradient_boosting and MLP) and gives three
+                times more to the best third of them at each iteration.
+                'hyperband' runs halving with several starting budgets.
+                'path' is for logistic_reg and ridge_class: every C/alpha of
+                the grid is evaluated, logistic regression is warm-started
+                along sorted C values and ridge is solved for all alpha
+                values from one SVD per fold. 'precomputed' is for SVM:
+                kernels (kernel, gamma) are sampled first with several C
+                values each, and kernel matrix of each kernel is computed
+                once for all its C values and folds.
+        cv_budget: {dict}, (default = None), Budget of cross-validation in
+                hyperparameter search. Keys are:
+                    n_folds: (default = 10), number of folds
+                    n_repeats: (default = 5), number of repeats of folds
+                    max_time: (default = None), seconds after which no new
+                        fold is started
+                    max_fits: (default = None), number of fits after which
+                        search stops
+                    min_folds: (default = 3), folds evaluated before a
+                        candidate can be aborted
+                    abort_margin: (default = None), a candidate is aborted
+                        when its mean score is lower than score of best
+                        finished candidate minus abort_margin
+                max_time, max_fits and abort_margin are used only by 'random'
+                search.
+        fit_cache: {string, FitCache}, (default = None), Folder or FitCache
+                where scores of cross-validation folds are cached. Repeated
+                searches on the same data skip folds found in it. It is used
+                by 'random' search.
         
     Returns:
         model: Parameters of fitted model
@@ -247,8 +317,15 @@ def classification_methods(X_train,y_train = None,
         pass
     else:
         raise ValueError(f'Data must be binary: {{1,-1}} or {{1,0}}')
-
-    c = classifiers(path)
+    
+    if search not in SEARCH_TYPES:
+        raise AttributeError(f'search must be one of {SEARCH_TYPES}, not {search!r}')
+    if search in SEARCH_ML_TYPES and ml_type not in SEARCH_ML_TYPES[search]:
+        raise AttributeError(f"search = '{search}' is available for {', '.join(SEARCH_ML_TYPES[search])}, "
+                             f"not {ml_type}")
+
+    c = classifiers(path, n_jobs = n_jobs, search = search, cv_budget = cv_budget,
+                    fit_cache = fit_cache)
     
     machine_methods = {'logistic_reg':c.logistic_regression,'ridge_class':c.ridge_class,
                      'KNN':c.KNN,'SVM':c.SVM,'random_forest':c.random_forest,
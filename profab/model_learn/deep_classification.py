@@ -18,7 +18,8 @@ from tqdm import tqdm
 
 device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
 #device = 'cpu'
-print(torch.cuda.get_device_name(device))
+#get_device_name fails on machines without a GPU
+print(torch.cuda.get_device_name(device) if device.type == 'cuda' else device)
 
 
 
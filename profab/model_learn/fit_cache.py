@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:20:44 2026
+
+@author: Sameitos
+"""
+
+import os
+import json
+import pickle
+import hashlib
+import numpy as np
+import sklearn
+
+
+class FitCache():
+
+    def __init__(self, path = 'fit_cache', max_size = 2**30, store_models = False, low_water = 0.9):
+        '''
+        Description:
+            Disk cache of fits of hyperparameter search. Score of each fold
+            is saved under a hash of training data, labels, estimator,
+            parameters, scoring and fold indices, so a repeated search on
+            the same data does not fit the same candidate again. Fitted
+            models can also be saved. When size of cache exceeds max_size,
+            least recently used entries are removed until it is below
+            low_water of max_size. Failed fits are not saved, so they are
+            tried again in later searches.
+        Parameters:
+            path: {string}, (default = 'fit_cache'), folder of cache
+            max_size: {int}, (default = 2**30), size limit of cache in bytes
+            store_models: {bool}, (default = False), If True, fitted models
+                of folds and refitted best models are saved as well
+            low_water: {float}, (default = 0.9), fraction of max_size that
+                cache is reduced to when it is full, so that the folder is
+                not scanned again at each following insert
+        '''
+        self.path = path
+        self.max_size = max_size
+        self.store_models = store_models
+        self.low_water = low_water
+        os.makedirs(path, exist_ok = True)
+        self.size = sum(os.path.getsize(f) for f in self._files())
+
+    def _files(self):
+
+        for folder in os.listdir(self.path):
+            folder = os.path.join(self.path, folder)
+            if os.path.isdir(folder):
+                for name in os.listdir(folder):
+                    if not name.endswith('.tmp'):
+                        yield os.path.join(folder, name)
+
+    def _file(self, key, suffix):
+
+        return os.path.join(self.path, key[:2], key + suffix)
+
+    @staticmethod
+    def data_hash(X, y = None):
+        '''
+        Description:
+            Hash of training matrix and labels. It is computed once per
+            search and given to FitCache.key.
+        '''
+        h = hashlib.sha1()
+        for array in [X, y]:
+            if array is None:
+                h.update(b'None')
+                continue
+            array = np.ascontiguousarray(array)
+            h.update(f'{array.dtype}{array.shape}'.encode())
+            h.update(array.tobytes())
+        return h.hexdigest()
+
+    @staticmethod
+    def key(data_hash, estimator, parameters, scoring, train = None, test = None):
+        '''
+        Description:
+            Key of a fit. If train and test are None, it is the key of a
+            model fitted on whole data.
+        '''
+        h = hashlib.sha1()
+        h.update(data_hash.encode())
+        h.update(f'{type(estimator).__module__}.{type(estimator).__qualname__}'.encode())
+        h.update(sklearn.__version__.encode())
+        h.update(repr(sorted(estimator.get_params().items())).encode())
+        h.update(repr(sorted(parameters.items())).encode())
+        h.update(repr(scoring).encode())
+        for index in [train, test]:
+            h.update(b'None' if index is None else np.ascontiguousarray(index).tobytes())
+        return h.hexdigest()
+
+    def _touch(self, file):
+
+        try:
+            os.utime(file)
+        except OSError:
+            pass
+
+    def get(self, key):
+        '''
+        Description:
+            Return score of a fold, None if it is not in cache.
+        '''
+        file = self._file(key, '.json')
+        try:
+            with open(file) as f:
+                score = json.load(f)['score']
+        except (OSError, ValueError):
+            return None
+        #failed fits saved by earlier versions are fitted again
+        if score is None:
+            return None
+        self._touch(file)
+        return score
+
+    def get_model(self, key):
+        '''
+        Description:
+            Return fitted model, None if it is not in cache.
+        '''
+        file = self._file(key, '.pkl')
+        try:
+            with open(file, 'rb') as f:
+                model = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        self._touch(file)
+        return model
+
+    def _write(self, file, data):
+
+        os.makedirs(os.path.dirname(file), exist_ok = True)
+        tmp = f'{file}.{os.getpid()}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        old = os.path.getsize(file) if os.path.isfile(file) else 0
+        os.replace(tmp, file)
+        self.size += len(data) - old
+
+    def put(self, key, score, model = None):
+        '''
+        Description:
+            Save score of a fold and, if store_models is True, its model.
+            A failed fit (nan score) can be transient, such as a
+            MemoryError or an interrupted worker, so it is not saved.
+        '''
+        if score is None or np.isnan(score):
+            return
+        self._write(self._file(key, '.json'), json.dumps({'score':float(score)}).encode())
+        if model is not None:
+            self.put_model(key, model)
+        self.evict()
+
+    def put_model(self, key, model):
+
+        if self.store_models:
+            self._write(self._file(key, '.pkl'), pickle.dumps(model))
+            self.evict()
+
+    def evict(self):
+        '''
+        Description:
+            If cache exceeds max_size, remove least recently used files
+            until it fits in low_water of max_size. Directory is scanned
+            only then, so the scan is shared by many inserts.
+        '''
+        if self.size <= self.max_size:
+            return
+
+        #other processes can share the cache, so size is counted again
+        files = []
+        for file in self._files():
+            try:
+                stat = os.stat(file)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, file))
+        self.size = sum(size for _,size,_ in files)
+
+        for _,size,file in sorted(files):
+            if self.size <= self.low_water*self.max_size:
+                break
+            try:
+                os.remove(file)
+            except OSError:
+                continue
+            self.size -= size
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 22:05:18 2026
+
+@author: Sameitos
+"""
+
+import os, sys
+import pickle
+import numpy as np
+from sklearn.pipeline import Pipeline
+from ..model_preprocess.streaming_scaler import streaming_scaler
+
+INCREMENTAL_ML_TYPES = ('SGD_logistic', 'SGD_hinge', 'multinomial_NB', 'gaussian_NB', 'MLP')
+INCREMENTAL_SCALE_TYPES = ('standard', 'max_abs', 'min_max', 'robust', 'normalizer', None)
+
+
+def _estimator(ml_type, parameters, random_state):
+
+    from sklearn.linear_model import SGDClassifier
+    from sklearn.naive_bayes import MultinomialNB, GaussianNB
+    from sklearn.neural_network import MLPClassifier
+
+    if ml_type == 'SGD_logistic':
+        #'log' is renamed as 'log_loss' in newer scikit-learn versions
+        loss = 'log_loss' if 'log_loss' in SGDClassifier.loss_functions else 'log'
+        model = SGDClassifier(loss = loss, random_state = random_state)
+    elif ml_type == 'SGD_hinge':
+        model = SGDClassifier(loss = 'hinge', random_state = random_state)
+    elif ml_type == 'multinomial_NB':
+        model = MultinomialNB()
+    elif ml_type == 'gaussian_NB':
+        model = GaussianNB()
+    else:
+        model = MLPClassifier(random_state = random_state)
+    return model.set_params(**(parameters or {}))
+
+
+def incremental_methods(batches, ml_type = 'SGD_logistic', scale_type = 'standard',
+                        n_epochs = 5, parameters = None, classes = (-1,1), path = None,
+                        random_state = 0):
+
+    """
+    Description:
+        Out-of-core training of a classifier on mini-batches. Scaler and
+        model are updated with partial_fit batch by batch, so memory used
+        is bounded by batch size rather than data size. Scaler is fitted in
+        a first pass over batches, then model is trained for n_epochs
+        passes. Hyperparameters are not searched, they are given by
+        parameters.
+
+    Parameters:
+        batches: {callable, list}, function that returns a new iterator of
+                (X, y) batches in each call, such as
+                lambda: data.get_batches(data_name), or a list of batches.
+        ml_type: {'SGD_logistic','SGD_hinge','multinomial_NB','gaussian_NB',
+                'MLP'}, (default = 'SGD_logistic'), type of machine learning
+                algorithm. 'SGD_logistic' and 'SGD_hinge' are logistic
+                regression and linear SVM trained by SGDClassifier.
+        scale_type: {'standard','max_abs','min_max','robust','normalizer',
+                None}, (default = 'standard'), method to scale data. Scalers
+                of model_preprocess.streaming_scaler are used, quantiles of
+                'robust' are approximated by a sketch. 'multinomial_NB'
+                needs non-negative features, so it can not be used with
+                'standard' and 'robust'.
+        n_epochs: {int}, (default = 5), number of passes over batches to
+                train model. Naive bayes models are trained in one pass.
+        parameters: {dict}, (default = None), hyperparameters of model
+        classes: {tuple}, (default = (-1,1)), all labels of data
+        path: {string}, (default = None), A destination point where model
+                is saved.
+        random_state: {int}, (default = 0), seed of model
+
+    Returns:
+        model: fitted Pipeline of scaler and model
+    """
+
+    if ml_type not in INCREMENTAL_ML_TYPES:
+        raise AttributeError(f'ml_type must be one of {INCREMENTAL_ML_TYPES}, not {ml_type!r}')
+    if scale_type not in INCREMENTAL_SCALE_TYPES:
+        raise AttributeError(f'scale_type must be one of {INCREMENTAL_SCALE_TYPES}, not {scale_type!r}')
+    if ml_type == 'multinomial_NB' and scale_type in ['standard', 'robust']:
+        raise AttributeError("multinomial_NB needs non-negative features, use scale_type = "
+                             "'min_max', 'max_abs' or None")
+    if not callable(batches):
+        if iter(batches) is batches:
+            raise AttributeError('batches is an iterator and can be read only once. Please give '
+                                 'a function that returns a new iterator of batches.')
+        batches = (lambda data: lambda: data)(batches)
+
+    if path is not None and os.path.isfile(path):
+        print(f'Model path {path} is already exist.'
+              f'To not lose model please provide new model path name or leave path as None')
+        sys.exit(1)
+
+    scaler = streaming_scaler(scale_type) if scale_type is not None else None
+    if scaler is not None:
+        for X,y in batches():
+            scaler.partial_fit(X)
+
+    model = _estimator(ml_type, parameters, random_state)
+    classes = np.array(classes)
+    n_epochs = 1 if ml_type in ['multinomial_NB', 'gaussian_NB'] else n_epochs
+    for epoch in range(n_epochs):
+        for X,y in batches():
+            if scaler is not None:
+                X = scaler.transform(X)
+            model.partial_fit(X, np.ravel(y), classes = classes)
+
+    model = Pipeline([('scaler', scaler if scaler is not None else 'passthrough'),
+                      ('model', model)])
+    print(model)
+
+    if path is not None:
+        with open(path, 'wb') as f:
+            pickle.dump(model, f)
+
+    return model
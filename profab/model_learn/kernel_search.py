@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 21:10:52 2026
+
+@author: Sameitos
+"""
+
+import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
+from sklearn.base import clone
+from sklearn.metrics import check_scoring
+from sklearn.model_selection import ParameterSampler, ParameterGrid
+from sklearn.utils import gen_batches, get_chunk_n_rows, check_random_state
+
+#parameters which change kernel matrix of SVC
+KERNEL_PARAMS = ('kernel', 'gamma', 'degree', 'coef0')
+
+
+def _resolve_gamma(gamma, X):
+
+    if gamma == 'scale':
+        var = X.var()
+        return 1.0/(X.shape[1]*var) if var != 0 else 1.0
+    if gamma == 'auto':
+        return 1.0/X.shape[1]
+    return float(gamma)
+
+
+def gram_matrix(X, kernel = 'rbf', gamma = 'scale', degree = 3, coef0 = 0.0,
+                working_memory = None):
+    '''
+    Description:
+        Kernel matrix of X with itself as computed by SVC. Rows are computed
+        in blocks so that temporary arrays of a block fit in working_memory.
+    Parameters:
+        X: {numpy array}, feature matrix
+        kernel: {'linear','poly','rbf','sigmoid'}, (default = 'rbf')
+        gamma: {float,'scale','auto'}, (default = 'scale'), 'scale' and
+            'auto' are computed from whole X
+        degree: {int}, (default = 3), degree of 'poly'
+        coef0: {float}, (default = 0.0), independent term of 'poly' and
+            'sigmoid'
+        working_memory: {int}, (default = None), memory of a block in MiB.
+            If None, working_memory of scikit-learn config is used.
+    Returns:
+        K: {numpy array}, (n_samples, n_samples) kernel matrix
+    '''
+    X = np.asarray(X, dtype = float)
+    n = len(X)
+    gamma = _resolve_gamma(gamma, X)
+    squared = (X**2).sum(axis = 1) if kernel == 'rbf' else None
+
+    K = np.empty((n, n))
+    #a block needs its rows of K and a temporary of same size
+    n_rows = get_chunk_n_rows(row_bytes = 2*8*n, working_memory = working_memory)
+    for rows in gen_batches(n, n_rows):
+        block = X[rows] @ X.T
+        if kernel == 'rbf':
+            block *= -2
+            block += squared[rows,None]
+            block += squared[None,:]
+            np.maximum(block, 0, out = block)
+            block *= -gamma
+            np.exp(block, out = block)
+        elif kernel == 'poly':
+            block *= gamma
+            block += coef0
+            block **= degree
+        elif kernel == 'sigmoid':
+            block *= gamma
+            block += coef0
+            np.tanh(block, out = block)
+        elif kernel != 'linear':
+            raise AttributeError(f'Kernel {kernel!r} can not be precomputed')
+        K[rows] = block
+    return K
+
+
+def _sample(distributions, n, rng):
+
+    if not distributions:
+        return [{}]
+    #grids of lists have at most as many candidates as their combinations
+    if not any(hasattr(v, 'rvs') for v in distributions.values()):
+        n = min(n, len(ParameterGrid(distributions)))
+    return list(ParameterSampler(distributions, n, random_state = rng))
+
+
+def _fit_and_score_gram(estimator, parameters, data, y, train, test, scorer, precomputed = True):
+
+    model = clone(estimator).set_params(**parameters)
+    try:
+        if precomputed:
+            model.fit(data[np.ix_(train, train)], y[train])
+            return scorer(model, data[np.ix_(test, train)], y[test])
+        model.fit(data[train], y[train])
+        return scorer(model, data[test], y[test])
+    except Exception:
+        #failed fits are scored as nan like in scikit-learn searches
+        return np.nan
+
+
+class PrecomputedSVMSearchCV(object):
+
+    def __init__(self, estimator, param_distributions, cv, scoring, n_iter = 10,
+                 n_per_kernel = None, max_memory = 2**32, working_memory = None,
+                 n_jobs = -1, random_state = None):
+        '''
+        Description:
+            Randomized search of SVC or SVR with precomputed kernels.
+            Kernel parameters (kernel, gamma, degree, coef0) are sampled
+            first, then several values of the other parameters (C, ...) are
+            sampled for each kernel, so n_iter candidates are about
+            n_iter/n_per_kernel kernels with n_per_kernel C values each.
+            Candidates therefore differ from those of RandomizedSearchCV,
+            which samples all parameters jointly and would give nearly every
+            kernel a single C. Kernel matrix of whole data is computed once
+            per kernel, then every C and fold of it is fitted on slices of
+            the matrix. Best candidate is refitted on whole data with its
+            own kernel.
+        Parameters:
+            estimator: SVC or SVR
+            param_distributions: {dict}, hyperparameter grid
+            cv: cross-validation splitter
+            scoring: {string}, scoring metric
+            n_iter: {int}, (default = 10), number of candidates
+            n_per_kernel: {int}, (default = None), number of candidates of
+                a kernel. If None, it is square root of n_iter, rounded.
+            max_memory: {int}, (default = 2**32), total memory budget of
+                precomputed kernels in bytes. It covers kernel matrix of
+                whole data and train x train and test x train slices that
+                each parallel fit copies from it. Number of parallel jobs
+                is lowered until they fit the budget, and groups are fitted
+                without precomputed kernel if even one job does not fit.
+            working_memory: {int}, (default = None), memory of a block of
+                kernel computation in MiB
+            n_jobs: {int}, (default = -1), number of parallel jobs
+            random_state: {int}, (default = None), seed of candidate sampling
+        '''
+        self.estimator = estimator
+        self.param_distributions = param_distributions
+        self.cv = cv
+        self.scoring = scoring
+        self.n_iter = n_iter
+        self.n_per_kernel = n_per_kernel
+        self.max_memory = max_memory
+        self.working_memory = working_memory
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+
+    def _group(self, parameters):
+
+        params = dict(self.estimator.get_params(), **parameters)
+        kernel = params['kernel']
+        key = [kernel]
+        if kernel != 'linear':
+            key.append(params['gamma'])
+        if kernel in ['poly', 'sigmoid']:
+            key.append(params['coef0'])
+        if kernel == 'poly':
+            key.append(params['degree'])
+        return tuple(key)
+
+    def _candidates(self):
+        '''
+        Description:
+            Kernels are sampled first and n_iter candidates are shared
+            among distinct kernels, each kernel gets its own sample of the
+            other parameters.
+        '''
+        rng = check_random_state(self.random_state)
+        kernel_params = {k:v for k,v in self.param_distributions.items() if k in KERNEL_PARAMS}
+        other_params = {k:v for k,v in self.param_distributions.items() if k not in KERNEL_PARAMS}
+
+        n_per_kernel = self.n_per_kernel or max(1, int(round(np.sqrt(self.n_iter))))
+        kernels = {}
+        for parameters in _sample(kernel_params, int(np.ceil(self.n_iter/n_per_kernel)), rng):
+            kernels.setdefault(self._group(parameters), parameters)
+
+        sizes = np.full(len(kernels), self.n_iter//len(kernels))
+        sizes[:self.n_iter % len(kernels)] += 1
+        return [dict(kernel, **parameters) for kernel, size in zip(kernels.values(), sizes)
+                for parameters in _sample(other_params, int(size), rng)]
+
+    def _precompute_jobs(self, n_samples, splits, n_tasks):
+        '''
+        Description:
+            Number of parallel jobs whose kernel slices fit in max_memory
+            together with kernel matrix of whole data, at most n_jobs. It
+            is 0 if kernels can not be precomputed.
+        '''
+        gram = 8*n_samples**2
+        #a fit copies its train x train matrix and scores a test x train one
+        slices = max(8*len(train)*(len(train) + len(test)) for train, test in splits)
+        n_jobs = min(effective_n_jobs(self.n_jobs), n_tasks)
+        return int(max(0, min(n_jobs, (self.max_memory - gram)//slices)))
+
+    def fit(self, X, y):
+
+        scorer = check_scoring(self.estimator, scoring = self.scoring)
+        X = np.asarray(X, dtype = float)
+        y = np.ravel(y)
+        splits = list(self.cv.split(X, y))
+
+        candidates = self._candidates()
+        groups = {}
+        for i,parameters in enumerate(candidates):
+            groups.setdefault(self._group(parameters), []).append(i)
+
+        scores = np.full((len(candidates), len(splits)), np.nan)
+        n_tasks = max(len(members) for members in groups.values())*len(splits)
+        n_jobs = self._precompute_jobs(len(X), splits, n_tasks)
+        precompute = n_jobs > 0
+        with Parallel(n_jobs = n_jobs if precompute else self.n_jobs) as parallel:
+            for members in groups.values():
+                params = dict(self.estimator.get_params(), **candidates[members[0]])
+                if precompute:
+                    data = gram_matrix(X, params['kernel'], params['gamma'], params['degree'],
+                                       params['coef0'], working_memory = self.working_memory)
+                    fit_params = [{k:v for k,v in candidates[i].items() if k not in KERNEL_PARAMS}
+                                  for i in members]
+                    for p in fit_params:
+                        p['kernel'] = 'precomputed'
+                else:
+                    data = X
+                    fit_params = [candidates[i] for i in members]
+
+                results = parallel(delayed(_fit_and_score_gram)(
+                    self.estimator, p, data, y, train, test, scorer, precompute)
+                    for p in fit_params for train, test in splits)
+                scores[members] = np.array(results).reshape(len(members), len(splits))
+
+        means = scores.mean(axis = 1)
+        self.cv_results_ = dict(params = candidates, mean_test_score = list(means))
+        best = 0 if np.all(np.isnan(means)) else int(np.nanargmax(means))
+        self.best_score_ = means[best]
+        self.best_params_ = candidates[best]
+
+        self.best_estimator_ = clone(self.estimator).set_params(**self.best_params_)
+        self.best_estimator_.fit(X, y)
+        return self
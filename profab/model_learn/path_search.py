@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 20:02:37 2026
+
+@author: Sameitos
+"""
+
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.metrics import check_scoring
+from sklearn.utils import _safe_indexing
+from sklearn.utils.class_weight import compute_sample_weight
+from sklearn.linear_model import RidgeClassifier, LogisticRegression, LogisticRegressionCV
+from sklearn.model_selection import ParameterGrid
+
+
+class _FixedOutput(object):
+    '''
+    Description:
+        Stand-in of a fitted binary classifier whose decision values are
+        already computed, so that a scorer can be called without a model.
+    '''
+    _estimator_type = 'classifier'
+
+    def __init__(self, classes, decision):
+        self.classes_ = classes
+        self.decision = decision
+        self.used_decision = False
+
+    def decision_function(self, X):
+        self.used_decision = True
+        return self.decision
+
+    def predict(self, X):
+        return self.classes_[(self.decision > 0).astype(int)]
+
+
+def _ridge_path(model, X_train, y_train, X_test, y_test, alphas, scorer):
+    '''
+    Description:
+        Scores of RidgeClassifier for all alphas from one SVD of training
+        set. Model is fitted once to find its classes, then decision values
+        of all alphas are computed from closed-form solutions. If scorer
+        uses only predictions, alphas giving the same predictions are
+        scored once.
+    '''
+    model.set_params(alpha = alphas[0]).fit(X_train, y_train)
+    y = model._label_binarizer.transform(y_train)[:,0].astype(float)
+
+    X = np.array(X_train, dtype = float)
+    params = model.get_params()
+    X_offset, y_offset = np.zeros(X.shape[1]), 0.0
+    X_scale = np.ones(X.shape[1])
+    if params['fit_intercept']:
+        X_offset = X.mean(axis = 0)
+        X -= X_offset
+        #normalize is 'deprecated' by default in recent scikit-learn
+        if params.get('normalize') is True:
+            X_scale = np.sqrt((X**2).sum(axis = 0))
+            #constant features are not scaled
+            X_scale[X_scale <= 10*np.finfo(float).eps*np.sqrt(len(X))] = 1.0
+            X /= X_scale
+        y_offset = y.mean()
+        y = y - y_offset
+
+    U, s, Vt = np.linalg.svd(X, full_matrices = False)
+    Uty = U.T @ y
+
+    #coefficients of all alphas, (n_features, n_alphas)
+    alphas = np.asarray(alphas, dtype = float)
+    coefs = Vt.T @ ((s*Uty)[:,None]/(s[:,None]**2 + alphas[None,:]))
+    coefs /= X_scale[:,None]
+    decisions = np.asarray(X_test, dtype = float) @ coefs + (y_offset - X_offset @ coefs)
+
+    scores, scored = [], {}
+    for k in range(len(alphas)):
+        output = _FixedOutput(model.classes_, decisions[:,k])
+        predictions = output.predict(X_test).tobytes()
+        if predictions in scored:
+            scores.append(scored[predictions])
+            continue
+        scores.append(scorer(output, X_test, y_test))
+        if not output.used_decision:
+            scored[predictions] = scores[-1]
+    return scores
+
+
+def _fold_ridge_path(estimator, parameters, alphas, X, y, train, test, scorer):
+
+    model = clone(estimator).set_params(**parameters)
+    X_train, X_test = _safe_indexing(X, train), _safe_indexing(X, test)
+    y_train, y_test = _safe_indexing(y, train), _safe_indexing(y, test)
+    try:
+        return _ridge_path(model, X_train, y_train, X_test, y_test, alphas, scorer)
+    except Exception:
+        #failed fits are scored as nan like in scikit-learn searches
+        return [np.nan]*len(alphas)
+
+
+def _solver_rank(solver):
+
+    rank = ['lbfgs', 'newton-cg', 'liblinear', 'sag', 'saga']
+    return rank.index(solver) if solver in rank else len(rank)
+
+
+class PathSearchCV(object):
+
+    def __init__(self, estimator, param_distributions, path_param, cv, scoring,
+                 n_paths = None, n_jobs = -1, random_state = None):
+        '''
+        Description:
+            Search over whole regularization path. For each combination of
+            other parameters, all values of path_param (C of logistic_reg,
+            alpha of ridge_class) are evaluated on each fold. Logistic
+            regression is fitted along sorted C values with warm starts by
+            LogisticRegressionCV, ridge classifier is solved for all alphas
+            from one SVD. Best candidate is refitted on whole data.
+        Parameters:
+            estimator: LogisticRegression or RidgeClassifier
+            param_distributions: {dict}, hyperparameter grid
+            path_param: {string}, regularization parameter of path
+            cv: cross-validation splitter
+            scoring: {string}, scoring metric
+            n_paths: {int}, (default = None), number of combinations of
+                other parameters sampled from grid. If None, all of them
+                are used.
+            n_jobs: {int}, (default = -1), number of parallel jobs
+            random_state: {int}, (default = None), seed of sampling of
+                combinations
+        '''
+        self.estimator = estimator
+        self.param_distributions = param_distributions
+        self.path_param = path_param
+        self.cv = cv
+        self.scoring = scoring
+        self.n_paths = n_paths
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+
+    def _combinations(self, binary):
+
+        others = {k:v for k,v in self.param_distributions.items() if k != self.path_param}
+        combinations = list(ParameterGrid(others))
+
+        if isinstance(self.estimator, LogisticRegression):
+            combinations = self._logistic_combinations(combinations, binary)
+
+        if self.n_paths is not None and self.n_paths < len(combinations):
+            rng = np.random.RandomState(self.random_state)
+            chosen = rng.choice(len(combinations), self.n_paths, replace = False)
+            combinations = [combinations[i] for i in sorted(chosen)]
+        return combinations
+
+    def _logistic_combinations(self, combinations, binary):
+        '''
+        Description:
+            With l2 penalty all solvers reach the same optimum, and 'auto'
+            is 'ovr' for binary labels, so such combinations give the same
+            path. One of them is kept, with the fastest solver.
+        '''
+        base = self.estimator.get_params()
+        unique = {}
+        for c in combinations:
+            params = dict(base, **c)
+            if params['penalty'] != 'l2':
+                unique[tuple(sorted((k,repr(v)) for k,v in c.items()))] = c
+                continue
+            key = {k:v for k,v in c.items() if k != 'solver'}
+            if binary and key.get('multi_class') == 'auto':
+                key['multi_class'] = 'ovr'
+            key = tuple(sorted((k,repr(v)) for k,v in key.items()))
+            if key not in unique or _solver_rank(params['solver']) < _solver_rank(
+                    dict(base, **unique[key])['solver']):
+                unique[key] = c
+        return list(unique.values())
+
+    def _logistic_path(self, parameters, values, X, y, splits):
+        '''
+        Description:
+            Scores of folds and C values, (n_folds, n_values). Balanced
+            class weights are computed from whole y by LogisticRegressionCV
+            but from training fold by other searches, so then each fold is
+            fitted alone with weights of its training set.
+        '''
+        lrcv_params = LogisticRegressionCV().get_params()
+        params = dict(clone(self.estimator).set_params(**parameters).get_params())
+        params = {k:v for k,v in params.items()
+                  if k in lrcv_params and k not in ['Cs','cv','scoring','refit','n_jobs']}
+        if params.get('class_weight') != 'balanced':
+            return self._logistic_folds(params, values, X, y, splits)
+
+        params['class_weight'] = None
+        scores = []
+        for train, test in splits:
+            #only weights of training samples are used by the fit of a fold
+            sample_weight = np.zeros(len(y))
+            sample_weight[train] = compute_sample_weight('balanced', y[train])
+            scores.append(self._logistic_folds(params, values, X, y, [(train, test)], sample_weight))
+        return np.concatenate(scores)
+
+    def _logistic_folds(self, params, values, X, y, splits, sample_weight = None):
+
+        model = LogisticRegressionCV(Cs = list(values), cv = splits, scoring = self.scoring,
+                                     refit = False, n_jobs = self.n_jobs, **params)
+        try:
+            model.fit(X, y, sample_weight = sample_weight)
+        except Exception:
+            return np.full((len(splits), len(values)), np.nan)
+        return list(model.scores_.values())[0]
+
+    def fit(self, X, y):
+
+        scorer = check_scoring(self.estimator, scoring = self.scoring)
+        if not hasattr(X, 'shape'):
+            X = np.asarray(X)
+        y = np.ravel(y)
+        splits = list(self.cv.split(X, y))
+        values = np.sort(np.unique(self.param_distributions[self.path_param]))
+        combinations = self._combinations(binary = len(np.unique(y)) == 2)
+
+        #scores of (combination, fold, value)
+        if isinstance(self.estimator, LogisticRegression):
+            scores = [self._logistic_path(c, values, X, y, splits) for c in combinations]
+        elif isinstance(self.estimator, RidgeClassifier):
+            scores = Parallel(n_jobs = self.n_jobs)(delayed(_fold_ridge_path)(
+                self.estimator, c, values, X, y, train, test, scorer)
+                for c in combinations for train, test in splits)
+        else:
+            raise AttributeError(f'Path search is available for LogisticRegression and '
+                                 f'RidgeClassifier, not {type(self.estimator).__name__}')
+        scores = np.array(scores, dtype = float).reshape(len(combinations), len(splits), len(values))
+        means = scores.mean(axis = 1)
+
+        self.cv_results_ = dict(params = [], mean_test_score = [])
+        for i,c in enumerate(combinations):
+            for j,value in enumerate(values):
+                self.cv_results_['params'].append(dict(c, **{self.path_param:value}))
+                self.cv_results_['mean_test_score'].append(means[i,j])
+
+        i, j = (0, 0)
+        if not np.all(np.isnan(means)):
+            i, j = np.unravel_index(np.nanargmax(means), means.shape)
+        self.best_score_ = means[i,j]
+        self.best_params_ = dict(combinations[i], **{self.path_param:values[j]})
+
+        self.best_estimator_ = clone(self.estimator).set_params(**self.best_params_)
+        self.best_estimator_.fit(X, y)
+        return self
@@ -8,8 +8,10 @@ Created on Tue May 26 16:39:12 2020
 
 import os, sys
 import numpy as np
-from sklearn.model_selection import RandomizedSearchCV,RepeatedKFold, PredefinedSplit
+from sklearn.model_selection import RepeatedKFold, PredefinedSplit
 import pickle
+from .search import search_cv, cv_budget_of, SEARCH_TYPES, SEARCH_ML_TYPES
+from .fit_cache import FitCache
 
 import warnings
 warnings.filterwarnings("ignore")
@@ -18,7 +20,8 @@ warnings.filterwarnings("ignore")
 class regressors(object):
 
 
-    def __init__(self,path):
+    def __init__(self,path,n_jobs = -1,search = 'random',cv_budget = None,
+                 fit_cache = None):
         
         """
         Description: 
@@ -29,6 +32,16 @@ class regressors(object):
 
         Parameters:
             path: {string}, A destination point where model is saved.
+            n_jobs: {int}, (default = -1), Number of parallel jobs in
+                hyperparameter search. -1 means all processors.
+            search: {'random','halving','hyperband'}, (default = 'random'),
+                Strategy of hyperparameter search.
+            cv_budget: {dict}, (default = None), Budget of cross-validation
+                in hyperparameter search with keys n_folds, n_repeats,
+                max_time, max_fits, min_folds and abort_margin. Missing keys
+                take their values from search.CV_BUDGET.
+            fit_cache: {string, FitCache}, (default = None), Folder or
+                FitCache where fits of hyperparameter search are cached.
             X_train: Feature matrix, {list, numpy array}
             y_train: (default = None), Label matrix, type = {list, numpy array}
             X_valid: (default = None), Validation Set, type = {list,numpy array}
@@ -40,7 +53,11 @@ class regressors(object):
         
         self.path = path
         self.parameters = None
-        self.n_jobs = -1
+        self.cv_budget = cv_budget_of(cv_budget)
+        self.n_jobs = n_jobs
+        self.search = search
+        self.fit_cache = FitCache(fit_cache) if type(fit_cache) == str else fit_cache
+        self.resource = 'n_samples'
         self.random_state = 0
       
     
@@ -48,7 +65,9 @@ class regressors(object):
 
         if X_valid is None: 
             
-            cv = RepeatedKFold(n_splits=10,n_repeats = 5,random_state= self.random_state)
+            cv = RepeatedKFold(n_splits = self.cv_budget['n_folds'],
+                               n_repeats = self.cv_budget['n_repeats'],
+                               random_state= self.random_state)
             
         else:
             
@@ -67,9 +86,11 @@ class regressors(object):
             cv = PredefinedSplit(test_fold)
 
 
-        clf = RandomizedSearchCV(model,self.parameters,n_iter = 10,
-                                     n_jobs=self.n_jobs, cv = cv,
-                                     scoring="f1")
+        clf = search_cv(model,self.parameters,cv = cv,scoring = "f1",
+                        search = self.search, resource = self.resource,
+                        n_iter = 10, n_jobs = self.n_jobs,
+                        cv_budget = self.cv_budget,
+                        fit_cache = self.fit_cache)
 
         
         if y_train is not None:
@@ -109,6 +130,7 @@ class regressors(object):
         from .hyperparameters import rgr_random_forest_params as rfp
         
         self.parameters = rfp
+        self.resource = 'n_estimators'
         model = RandomForestRegressor()   
         return self.get_best_model(model, X_train, y_train,X_valid, y_valid)
 
@@ -118,6 +140,7 @@ class regressors(object):
         from .hyperparameters import rgr_mlp_params as mlpp
         
         self.parameters = mlpp
+        self.resource = 'max_iter'
         model = MLPRegressor()
         return self.get_best_model(model, X_train, y_train,X_valid, y_valid)
     
@@ -134,11 +157,13 @@ class regressors(object):
         from .hyperparameters import rgr_gradient_boosting_params as gbp
 
         self.parameters = gbp
+        self.resource = 'n_estimators'
         model = GBR()
         return self.get_best_model(model, X_train, y_train,X_valid, y_valid)
 
 
-def regression_methods(X_train,ml_type = "SVM", y_train = None ,X_valid = None,y_valid = None, path = None):
+def regression_methods(X_train,ml_type = "SVM", y_train = None ,X_valid = None,y_valid = None, path = None,
+                       n_jobs = -1, search = 'random', cv_budget = None, fit_cache = None):
 
     """
     Description: 
@@ -156,6 +181,33 @@ def regression_methods(X_train,ml_type = "SVM", y_train = None ,X_valid = None,y
         y_train: (default = None), Label matrix, type = {list, numpy array}
         X_valid: (default = None), Validation Set, type = {list,numpy array}
         y_valid: (default = None), Validation Label, type = {list,numpy array}
+        n_jobs: {int}, (default = -1), Number of parallel jobs in hyperparameter
+                search. -1 means all processors.
+        search: {'random','halving','hyperband','precomputed'}, (default = 'random'),
+                Strategy of hyperparameter search. 'halving' and 'hyperband'
+                use successive halving over samples, or over trees and
+                iterations for random_forest, gradient_boosting and MLP.
+                'precomputed' shares kernel matrices between candidates of
+                SVM.
+        cv_budget: {dict}, (default = None), Budget of cross-validation in
+                hyperparameter search. Keys are:
+                    n_folds: (default = 10), number of folds
+                    n_repeats: (default = 5), number of repeats of folds
+                    max_time: (default = None), seconds after which no new
+                        fold is started
+                    max_fits: (default = None), number of fits after which
+                        search stops
+                    min_folds: (default = 3), folds evaluated before a
+                        candidate can be aborted
+                    abort_margin: (default = None), a candidate is aborted
+                        when its mean score is lower than score of best
+                        finished candidate minus abort_margin
+                max_time, max_fits and abort_margin are used only by 'random'
+                search.
+        fit_cache: {string, FitCache}, (default = None), Folder or FitCache
+                where scores of cross-validation folds are cached. Repeated
+                searches on the same data skip folds found in it. It is used
+                by 'random' search.
         
     Returns:
         model: Parameters of fitted model
@@ -170,8 +222,15 @@ def regression_methods(X_train,ml_type = "SVM", y_train = None ,X_valid = None,y
             
     if set(y_train) == {1,-1} or set(y_train) == {1,0}:
         raise ValueError('Data must be continous not binary')
-
-    r = regressors(path)
+    
+    if search not in SEARCH_TYPES:
+        raise AttributeError(f'search must be one of {SEARCH_TYPES}, not {search!r}')
+    if search in SEARCH_ML_TYPES and ml_type not in SEARCH_ML_TYPES[search]:
+        raise AttributeError(f"search = '{search}' is available for {', '.join(SEARCH_ML_TYPES[search])}, "
+                             f"not {ml_type}")
+
+    r = regressors(path, n_jobs = n_jobs, search = search, cv_budget = cv_budget,
+                   fit_cache = fit_cache)
     
     machine_methods = {
                         'linear_reg':r.linear_regression,
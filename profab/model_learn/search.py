@@ -0,0 +1,459 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:05:21 2026
+
+@author: Sameitos
+"""
+
+import math
+import time
+import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
+from sklearn.base import clone, is_classifier
+from sklearn.metrics import check_scoring
+from sklearn.utils import _safe_indexing
+from sklearn.experimental import enable_halving_search_cv
+from sklearn.model_selection import RandomizedSearchCV, HalvingRandomSearchCV, ParameterSampler
+from .path_search import PathSearchCV
+from .kernel_search import PrecomputedSVMSearchCV
+
+SEARCH_TYPES = ('random', 'halving', 'hyperband', 'path', 'precomputed')
+#searches that are available only for some ml types
+SEARCH_ML_TYPES = dict(
+            path = ['logistic_reg', 'ridge_class'],
+            precomputed = ['SVM']
+            )
+
+#Cross-validation budget of hyperparameter search
+CV_BUDGET = dict(
+            n_folds = 10,
+            n_repeats = 5,
+            max_time = None,
+            max_fits = None,
+            min_folds = 3,
+            abort_margin = None
+            )
+
+
+def cv_budget_of(cv_budget):
+    '''
+    Description:
+        Fill missing keys of cv_budget with CV_BUDGET defaults.
+    '''
+    cv_budget = dict(cv_budget or {})
+    unknown = set(cv_budget) - set(CV_BUDGET)
+    if unknown:
+        raise AttributeError(f'Unknown cv_budget keys: {sorted(unknown)}, '
+                             f'valid keys are {list(CV_BUDGET)}')
+    return dict(CV_BUDGET, **cv_budget)
+
+
+def _split_resource(estimator, parameters, resource, max_resources):
+    '''
+    Description:
+        If resource is an estimator parameter such as n_estimators or
+        max_iter, it is removed from parameters since halving sets it.
+        Largest value of it in parameters is used as max_resources, else
+        value of estimator is used.
+    '''
+    if resource == 'n_samples':
+        return parameters, max_resources
+
+    parameters = dict(parameters)
+    values = parameters.pop(resource, None)
+    if max_resources == 'auto':
+        if values is not None:
+            max_resources = int(np.max(values))
+        else:
+            max_resources = int(estimator.get_params()[resource])
+    return parameters, max_resources
+
+
+def _min_resources(estimator, cv, resource, y):
+    '''
+    Description:
+        Smallest resource given to candidates. For n_samples, each fold of a
+        repeat must see at least 2 samples of each class and subsamples have
+        at least 20 samples of each class, since they are not stratified.
+        For other resources it is 10.
+    '''
+    if resource != 'n_samples':
+        return 10
+
+    #folds of a single repeat, RepeatedKFold would give n_splits*n_repeats
+    n_splits = getattr(cv, 'cvargs', {}).get('n_splits') or cv.get_n_splits()
+    min_resources = max(2*n_splits, 20)
+    if is_classifier(estimator) and y is not None:
+        min_resources *= len(np.unique(y))
+    return min_resources
+
+
+class HalvingSearchCV(HalvingRandomSearchCV):
+    '''
+    Description:
+        HalvingRandomSearchCV whose smallest resource is counted from folds
+        of a single repeat of cv. Default of scikit-learn counts all folds
+        of RepeatedStratifiedKFold, then halving can not start below whole
+        training set of ProFAB datasets. Smallest resource is computed for
+        the data of each fit and given in min_resources_, min_resources
+        parameter stays 'smallest'.
+    '''
+
+    def fit(self, X, y = None, **fit_params):
+
+        if self.min_resources != 'smallest':
+            return super().fit(X, y, **fit_params)
+
+        max_resources = len(X) if self.max_resources == 'auto' else self.max_resources
+        #scikit-learn reads min_resources during fit, it is restored afterwards
+        self.min_resources = min(_min_resources(self.estimator, self.cv, self.resource, y),
+                                 max_resources)
+        try:
+            return super().fit(X, y, **fit_params)
+        finally:
+            self.min_resources = 'smallest'
+
+
+class HyperbandSearchCV(object):
+
+    def __init__(self, estimator, param_distributions, cv, scoring,
+                 resource = 'n_samples', max_resources = 'auto', factor = 3,
+                 n_jobs = -1, random_state = None):
+        '''
+        Description:
+            Hyperband search: successive halving is run in several brackets.
+            Brackets start from many candidates with small resource to few
+            candidates with full resource, so that both exploration and
+            reliable scores of candidates are covered. Best estimator of
+            all brackets is refitted on whole data.
+        Parameters:
+            estimator: model whose hyperparameters are searched
+            param_distributions: {dict}, hyperparameter grid
+            cv: cross-validation splitter
+            scoring: {string}, scoring metric
+            resource: {string}, (default = 'n_samples'), resource increased
+                at each halving iteration, 'n_samples' or a parameter of
+                estimator such as 'n_estimators' or 'max_iter'
+            max_resources: {int, 'auto'}, (default = 'auto'), resource given
+                to candidates in last iteration
+            factor: {int}, (default = 3), ratio of candidates eliminated at
+                each iteration
+            n_jobs: {int}, (default = -1), number of parallel jobs
+            random_state: {int}, (default = None), seed of candidate sampling
+        '''
+        self.estimator = estimator
+        self.param_distributions = param_distributions
+        self.cv = cv
+        self.scoring = scoring
+        self.resource = resource
+        self.max_resources = max_resources
+        self.factor = factor
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+
+    def fit(self, X, y = None):
+
+        max_resources = self.max_resources
+        if max_resources == 'auto':
+            max_resources = len(X)
+        min_resources = min(_min_resources(self.estimator, self.cv, self.resource, y), max_resources)
+
+        s_max = int(math.floor(math.log(max_resources/min_resources, self.factor) + 1e-9))
+
+        self.best_score_ = -np.inf
+        self.best_params_ = None
+        self.brackets_ = []
+        for s in range(s_max, -1, -1):
+            n_candidates = int(math.ceil((s_max + 1)/(s + 1)*self.factor**s))
+            bracket = HalvingRandomSearchCV(self.estimator, self.param_distributions,
+                                            n_candidates = n_candidates,
+                                            factor = self.factor,
+                                            resource = self.resource,
+                                            min_resources = max(min_resources, max_resources//self.factor**s),
+                                            max_resources = max_resources,
+                                            cv = self.cv, scoring = self.scoring,
+                                            refit = False, n_jobs = self.n_jobs,
+                                            random_state = None if self.random_state is None else self.random_state + s)
+            bracket.fit(X, y)
+            self.brackets_.append(bracket)
+            #scores can be nan if all fits of a bracket fail
+            if self.best_params_ is None or bracket.best_score_ > self.best_score_:
+                self.best_score_ = bracket.best_score_
+                self.best_params_ = bracket.best_params_
+
+        best_params = dict(self.best_params_)
+        if self.resource != 'n_samples':
+            best_params[self.resource] = max_resources
+        self.best_estimator_ = clone(self.estimator).set_params(**best_params)
+        if y is not None:
+            self.best_estimator_.fit(X, y)
+        else:
+            self.best_estimator_.fit(X)
+        return self
+
+
+def _fit_and_score_fold(estimator, parameters, X, y, train, test, scorer, return_model = False):
+
+    model = clone(estimator).set_params(**parameters)
+    X_train, X_test = _safe_indexing(X, train), _safe_indexing(X, test)
+    try:
+        if y is None:
+            model.fit(X_train)
+            score = scorer(model, X_test)
+        else:
+            y_train, y_test = _safe_indexing(y, train), _safe_indexing(y, test)
+            model.fit(X_train, y_train)
+            score = scorer(model, X_test, y_test)
+    except Exception:
+        #failed fits are scored as nan like in scikit-learn searches
+        score, model = np.nan, None
+    return score, model if return_model else None
+
+
+def _is_better(score, best):
+
+    if best is None or np.isnan(best[0]):
+        return True
+    return score > best[0]
+
+
+class BudgetSearchCV(object):
+
+    def __init__(self, estimator, param_distributions, cv, scoring, n_iter = 10,
+                 max_time = None, max_fits = None, min_folds = 3, abort_margin = None,
+                 n_jobs = -1, random_state = None, fit_cache = None):
+        '''
+        Description:
+            Randomized search whose candidates are evaluated fold by fold.
+            After min_folds folds, a candidate is aborted when its mean
+            score so far is lower than mean score of best finished candidate
+            minus abort_margin. Search stops when max_time seconds passed or
+            max_fits models are fitted. Best candidate is refitted on whole
+            data. If fit_cache is given, scores of folds found in it are not
+            computed again.
+        Parameters:
+            estimator: model whose hyperparameters are searched
+            param_distributions: {dict}, hyperparameter grid
+            cv: cross-validation splitter
+            scoring: {string}, scoring metric
+            n_iter: {int}, (default = 10), number of candidates
+            max_time: {float}, (default = None), wall-clock budget of search
+                in seconds. If None, there is no limit.
+            max_fits: {int}, (default = None), number of fits of search. If
+                None, there is no limit.
+            min_folds: {int}, (default = 3), number of folds evaluated before
+                a candidate can be aborted. Folds are evaluated in chunks of
+                max(min_folds, n_jobs).
+            abort_margin: {float}, (default = None), a candidate is aborted
+                if its mean score is below best mean score minus margin. If
+                None, candidates are not aborted.
+            n_jobs: {int}, (default = -1), number of parallel jobs
+            random_state: {int}, (default = None), seed of candidate sampling
+            fit_cache: {FitCache}, (default = None), disk cache of fits
+        '''
+        self.estimator = estimator
+        self.param_distributions = param_distributions
+        self.cv = cv
+        self.scoring = scoring
+        self.n_iter = n_iter
+        self.fit_cache = fit_cache
+        self.max_time = max_time
+        self.max_fits = max_fits
+        self.min_folds = min_folds
+        self.abort_margin = abort_margin
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+
+    def _out_of_budget(self, start):
+
+        if self.max_time is not None and time.time() - start >= self.max_time:
+            return True
+        return self.max_fits is not None and self.n_fits_ >= self.max_fits
+
+    def fit(self, X, y = None):
+
+        start = time.time()
+        scorer = check_scoring(self.estimator, scoring = self.scoring)
+        if not hasattr(X, 'shape'):
+            X = np.asarray(X)
+        if y is not None and not hasattr(y, 'shape'):
+            y = np.asarray(y)
+        #y of shape (n,1) is accepted by estimators but not by stratified splitters
+        splits = list(self.cv.split(X, None if y is None else np.ravel(y)))
+        chunk = max(self.min_folds, effective_n_jobs(self.n_jobs))
+        cache = self.fit_cache
+        if cache is not None:
+            data_hash = cache.data_hash(X, y)
+
+        candidates = ParameterSampler(self.param_distributions, self.n_iter,
+                                      random_state = self.random_state)
+        self.cv_results_ = dict(params = [], mean_test_score = [], n_folds = [], status = [])
+        self.n_fits_ = 0
+        best_complete, best_partial = None, None
+
+        with Parallel(n_jobs = self.n_jobs) as parallel:
+            for parameters in candidates:
+                if self._out_of_budget(start):
+                    break
+
+                scores, status = [], 'done'
+                while len(scores) < len(splits):
+                    if self._out_of_budget(start):
+                        status = 'budget'
+                        break
+                    n = min(chunk, len(splits) - len(scores))
+                    if self.max_fits is not None:
+                        n = min(n, self.max_fits - self.n_fits_)
+                    folds = splits[len(scores):len(scores) + n]
+                    scores.extend(self._score_folds(parallel, parameters, X, y, folds, scorer,
+                                                    data_hash if cache is not None else None))
+
+                    mean = np.mean(scores)
+                    can_abort = (self.abort_margin is not None and best_complete is not None
+                                 and not np.isnan(best_complete[0])
+                                 and self.min_folds <= len(scores) < len(splits))
+                    if can_abort and not mean >= best_complete[0] - self.abort_margin:
+                        status = 'aborted'
+                        break
+
+                mean = np.mean(scores) if scores else np.nan
+                self.cv_results_['params'].append(parameters)
+                self.cv_results_['mean_test_score'].append(mean)
+                self.cv_results_['n_folds'].append(len(scores))
+                self.cv_results_['status'].append(status)
+
+                if status == 'done' and _is_better(mean, best_complete):
+                    best_complete = (mean, parameters)
+                elif status == 'budget' and scores and _is_better(mean, best_partial):
+                    best_partial = (mean, parameters)
+
+        #a candidate cut by budget is used only if no candidate is finished
+        best = best_complete or best_partial
+        if best is None:
+            best = (np.nan, next(iter(ParameterSampler(self.param_distributions, 1,
+                                                       random_state = self.random_state))))
+        self.best_score_, self.best_params_ = best
+
+        key = None
+        if cache is not None and cache.store_models:
+            key = cache.key(data_hash, self.estimator, self.best_params_, self.scoring)
+            self.best_estimator_ = cache.get_model(key)
+            if self.best_estimator_ is not None:
+                return self
+
+        self.best_estimator_ = clone(self.estimator).set_params(**self.best_params_)
+        if y is not None:
+            self.best_estimator_.fit(X, y)
+        else:
+            self.best_estimator_.fit(X)
+        if key is not None:
+            cache.put_model(key, self.best_estimator_)
+        return self
+
+    def _score_folds(self, parallel, parameters, X, y, folds, scorer, data_hash = None):
+        '''
+        Description:
+            Scores of candidate on folds. Folds found in fit cache are not
+            fitted, the others are fitted in parallel and saved to cache.
+        '''
+        cache = self.fit_cache
+        scores = [None]*len(folds)
+        if cache is not None:
+            keys = [cache.key(data_hash, self.estimator, parameters, self.scoring, train, test)
+                    for train, test in folds]
+            scores = [cache.get(key) for key in keys]
+
+        missing = [i for i,score in enumerate(scores) if score is None]
+        return_model = cache is not None and cache.store_models
+        fits = parallel(delayed(_fit_and_score_fold)(
+            self.estimator, parameters, X, y, folds[i][0], folds[i][1], scorer, return_model)
+            for i in missing)
+        self.n_fits_ += len(missing)
+
+        for i,(score, model) in zip(missing, fits):
+            scores[i] = score
+            if cache is not None:
+                cache.put(keys[i], score, model)
+        return scores
+
+
+def search_cv(estimator, parameters, cv, scoring, search = 'random', resource = 'n_samples',
+              max_resources = 'auto', n_iter = 10, n_jobs = -1, random_state = None,
+              cv_budget = None, fit_cache = None, path_param = None):
+    '''
+    Description:
+        Form hyperparameter search of estimator. 'random' is randomized
+        search with n_iter candidates, each trained on all folds of cv.
+        'halving' is successive halving: many candidates are trained with
+        small resource and only best third of them continue with three
+        times more resource. 'hyperband' runs successive halving in
+        several brackets with different starting resources. 'path'
+        evaluates whole regularization path of path_param, see
+        PathSearchCV. 'precomputed' is randomized search of SVM whose
+        kernel matrices are shared by candidates, see
+        PrecomputedSVMSearchCV.
+    Parameters:
+        estimator: model whose hyperparameters are searched
+        parameters: {dict}, hyperparameter grid, e.g. from hyperparameters.py
+        cv: cross-validation splitter
+        scoring: {string}, scoring metric
+        search: {'random','halving','hyperband','path','precomputed'},
+            (default = 'random')
+        resource: {string}, (default = 'n_samples'), resource of halving,
+            'n_samples' or a parameter of estimator such as 'n_estimators'
+            or 'max_iter'. If it is in parameters, it is removed from them
+            and its largest value is used as max_resources.
+        max_resources: {int, 'auto'}, (default = 'auto')
+        n_iter: {int}, (default = 10), number of candidates of 'random'
+        n_jobs: {int}, (default = -1), number of parallel jobs
+        random_state: {int}, (default = None)
+        cv_budget: {dict}, (default = None), max_time, max_fits, min_folds
+            and abort_margin of 'random' search, see CV_BUDGET and
+            BudgetSearchCV. Folds and repeats are taken from cv.
+        fit_cache: {FitCache}, (default = None), disk cache of fits. It is
+            used by 'random' search, halving searches are not cached.
+        path_param: {string}, (default = None), regularization parameter
+            swept by 'path' search, e.g. 'C' or 'alpha'
+    Returns:
+        search object that has fit method and best_estimator_ after fitting
+    '''
+    if search not in SEARCH_TYPES:
+        raise AttributeError(f'search must be one of {SEARCH_TYPES}, not {search!r}')
+
+    if search == 'path':
+        if path_param is None:
+            raise AttributeError(f"search = 'path' needs a regularization parameter, "
+                                 f"it is available for logistic_reg and ridge_class")
+        return PathSearchCV(estimator, parameters, path_param, cv = cv, scoring = scoring,
+                            n_jobs = n_jobs, random_state = random_state)
+
+    if search == 'precomputed':
+        return PrecomputedSVMSearchCV(estimator, parameters, cv = cv, scoring = scoring,
+                                      n_iter = n_iter, n_jobs = n_jobs,
+                                      random_state = random_state)
+
+    cv_budget = cv_budget_of(cv_budget)
+    if search == 'random' and (cv_budget['max_time'] is not None or cv_budget['max_fits'] is not None
+                               or cv_budget['abort_margin'] is not None or fit_cache is not None):
+        return BudgetSearchCV(estimator, parameters, cv = cv, scoring = scoring, n_iter = n_iter,
+                              max_time = cv_budget['max_time'], max_fits = cv_budget['max_fits'],
+                              min_folds = cv_budget['min_folds'],
+                              abort_margin = cv_budget['abort_margin'],
+                              n_jobs = n_jobs, random_state = random_state,
+                              fit_cache = fit_cache)
+
+    if search == 'random':
+        return RandomizedSearchCV(estimator, parameters, n_iter = n_iter,
+                                  n_jobs = n_jobs, cv = cv,
+                                  scoring = scoring, random_state = random_state)
+
+    parameters, max_resources = _split_resource(estimator, parameters, resource, max_resources)
+
+    if search == 'halving':
+        return HalvingSearchCV(estimator, parameters, factor = 3, resource = resource,
+                               max_resources = max_resources, cv = cv, scoring = scoring,
+                               n_jobs = n_jobs, random_state = random_state)
+
+    return HyperbandSearchCV(estimator, parameters, cv = cv, scoring = scoring,
+                             resource = resource, max_resources = max_resources,
+                             n_jobs = n_jobs, random_state = random_state)
@@ -8,5 +8,7 @@ Created on Tue Mar  9 14:41:51 2021
 
 from .scaler import scale_methods
 from .splitter import ttv_split
+from ..utils import Split
 from .extracter import extract_protein_feature
+from .similarity import similarity_groups, fasta_groups
 
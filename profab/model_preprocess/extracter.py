@@ -39,6 +39,13 @@ def extract_protein_feature(protein_feature,
                           
                           or
                           
+                          a list of descriptors of POSSUM and iFeature or descriptors joined by '+'
+                          (e.g. 'AAC+CTDT+aac_pssm'). Features of all descriptors are computed in one
+                          pass and saved in one file. Column group index of descriptors is saved as
+                          fasta_file_name_protein_feature.groups next to it.
+                          
+                          or
+                          
                           one of BERT, T5XL transformer model.
                           
 
@@ -78,6 +85,10 @@ def extract_protein_feature(protein_feature,
 
         return feat_ext.extract_iFeature_feature()
 
+    elif not isinstance(protein_feature, str) or '+' in protein_feature:
+
+        return feat_ext.extract_features()
+
     
 
     else:
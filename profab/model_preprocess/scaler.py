@@ -68,7 +68,7 @@ class ScalerNormalizer():
         return scaled_train,scaler 
         
 
-def scale_methods(X_train,scale_type = 'standard'):
+def scale_methods(X_train,scale_type = 'standard',chunk_size = None,copy = True):
     
     '''
     Description:
@@ -78,12 +78,30 @@ def scale_methods(X_train,scale_type = 'standard'):
         -**X_train**: type = {list, numpy array}, A data to train scaling functions
         -**scale_type**: {'normalizer','standard','max_abs','min_max','robust'}, 
                         default = 'standard, determines the method to scale the data.
+        -**chunk_size**: {int}, default = None, If given, streaming scaler of
+                        streaming_scaler is fitted over chunks of chunk_size
+                        rows and data is transformed chunk by chunk. 'robust'
+                        quantiles are then approximated by a sketch.
+        -**copy**: {bool}, default = True, If False and chunk_size is given,
+                        X_train is scaled in place when it is a writable
+                        float array, so its type (e.g. float32) is kept and
+                        no copy of it is formed.
     Return:
         X_train: type = {list, numpy array}, Transformed data.
         scaler: A fitting function to transform other datasets.
     '''
 
-
+    if scale_type not in ['normalizer','standard','max_abs','min_max','robust']:
+        raise AttributeError('Please enter correct scale_type. Options are: '
+                             '"normalizer, standard, max_abs, min_max, robust"')
+    
+    if chunk_size is not None:
+        from .streaming_scaler import streaming_scaler
+        
+        scaler = streaming_scaler(scale_type, chunk_size = chunk_size, copy = copy)
+        X_train = scaler.fit_transform(X_train)
+        return X_train,scaler
+    
     s = ScalerNormalizer()
 
     scaler_ways = {'normalizer':s.normalizer,'standard':s.standard_scaler,
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 00:12:36 2026
+
+@author: Sameitos
+"""
+
+import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+AMINO_ACIDS = 'ACDEFGHIKLMNPQRSTVWY'
+#universal hashing (a*x + b) mod p, p is the Mersenne prime 2**31 - 1
+_PRIME = np.uint64((1 << 31) - 1)
+_MAX_HASH = np.uint32(np.iinfo(np.uint32).max)
+
+_CODES = np.full(256, len(AMINO_ACIDS), dtype = np.uint64)
+_CODES[np.frombuffer(AMINO_ACIDS.encode(), dtype = np.uint8)] = np.arange(len(AMINO_ACIDS))
+_CODES[np.frombuffer(AMINO_ACIDS.lower().encode(), dtype = np.uint8)] = np.arange(len(AMINO_ACIDS))
+
+
+def _kmer_codes(sequence, k):
+
+    codes = _CODES[np.frombuffer(sequence.encode(), dtype = np.uint8)]
+    n = len(codes) - k + 1
+    if n <= 0:
+        return codes[:0]
+    kmers = np.zeros(n, dtype = np.uint64)
+    for i in range(k):
+        kmers *= np.uint64(len(AMINO_ACIDS) + 1)
+        kmers += codes[i:i + n]
+    return kmers
+
+
+def _signatures(sequences, k, a, b, block_size = 1 << 16):
+    '''
+    Description:
+        MinHash signatures of sequences. Sequences are sorted by length and
+        k-mers of sequences of similar length are put in a matrix of about
+        block_size values, padded with their first k-mer. Each distinct k-mer
+        of the matrix is hashed once and running minimum is taken over
+        columns, so all sequences of the matrix are hashed together.
+    '''
+    signatures = np.full((len(sequences), len(a)), _MAX_HASH, dtype = np.uint32)
+    kmers = [_kmer_codes(sequence, k) for sequence in sequences]
+    lengths = np.array([len(kmer) for kmer in kmers], dtype = int)
+    order = np.argsort(lengths, kind = 'stable')
+    order = order[lengths[order] > 0]
+
+    start = 0
+    while start < len(order):
+        stop = start + 1
+        while stop < len(order) and (stop - start + 1)*lengths[order[stop]] <= block_size:
+            stop += 1
+        rows = order[start:stop]
+
+        matrix = np.empty((len(rows), lengths[rows[-1]]), dtype = np.uint64)
+        for i,row in enumerate(rows):
+            matrix[i,:lengths[row]] = kmers[row]
+            matrix[i,lengths[row]:] = kmers[row][0]
+        codes, inverse = np.unique(matrix, return_inverse = True)
+        inverse = inverse.reshape(matrix.shape)
+        table = ((codes[:,None]*a[None,:] + b[None,:]) % _PRIME).astype(np.uint32)
+
+        signature = table[inverse[:,0]]
+        for column in inverse.T[1:]:
+            np.minimum(signature, table[column], out = signature)
+        signatures[rows] = signature
+        start = stop
+    return signatures
+
+
+def minhash_signatures(sequences, k = 3, num_perm = 128, random_state = 0, n_jobs = -1):
+    '''
+    Description:
+        MinHash signatures of k-mer sets of protein sequences. Fraction of
+        equal values of two signatures estimates Jaccard similarity of their
+        k-mer sets. Sequences shorter than k have signatures of maximum
+        values.
+    Parameters:
+        sequences: {list}, protein sequences
+        k: {int}, (default = 3), length of k-mers, at most 6
+        num_perm: {int}, (default = 128), number of hash functions
+        random_state: {int}, (default = 0), seed of hash functions
+        n_jobs: {int}, (default = -1), number of parallel jobs. -1 means
+            all processors.
+    Returns:
+        signatures: {numpy array}, (n_sequences, num_perm) uint32 matrix
+    '''
+    if not 1 <= k <= 6:
+        raise AttributeError('k must be between 1 and 6')
+
+    rng = np.random.RandomState(random_state)
+    a = rng.randint(1, int(_PRIME), size = num_perm).astype(np.uint64)
+    b = rng.randint(0, int(_PRIME), size = num_perm).astype(np.uint64)
+
+    n_chunks = min(effective_n_jobs(n_jobs), max(1, len(sequences)//1000))
+    if n_chunks == 1:
+        return _signatures(sequences, k, a, b)
+    bounds = np.linspace(0, len(sequences), n_chunks + 1).astype(int)
+    parts = Parallel(n_jobs = n_jobs)(delayed(_signatures)(sequences[i:j], k, a, b)
+                                      for i,j in zip(bounds[:-1], bounds[1:]))
+    return np.concatenate(parts)
+
+
+def _bands(num_perm, threshold, recall = 0.95):
+    '''
+    Description:
+        Number of bands and rows of a band of LSH. Rows is the largest one
+        for which a pair of similarity threshold is a candidate with
+        probability, 1 - (1 - threshold**rows)**bands, at least recall.
+    '''
+    for rows in range(num_perm, 0, -1):
+        bands = num_perm//rows
+        if 1 - (1 - threshold**rows)**bands >= recall:
+            return bands, rows
+    return num_perm, 1
+
+
+def similarity_groups(sequences, threshold = 0.3, k = 3, num_perm = 128, random_state = 0,
+                      n_jobs = -1):
+    '''
+    Description:
+        Cluster protein sequences by similarity of their k-mer sets without
+        alignment. MinHash signatures are split into bands, sequences that
+        have an equal band are candidates (locality sensitive hashing), and
+        a candidate pair is linked if its estimated Jaccard similarity is at
+        least threshold. Clusters are connected components of links, so a
+        sequence is in the same cluster as all sequences similar to it.
+    Parameters:
+        sequences: {list}, protein sequences
+        threshold: {float}, (default = 0.3), Jaccard similarity of k-mer
+            sets above which two sequences are in the same cluster
+        k: {int}, (default = 3), length of k-mers, at most 6
+        num_perm: {int}, (default = 128), number of hash functions
+        random_state: {int}, (default = 0), seed of hash functions
+        n_jobs: {int}, (default = -1), number of parallel jobs
+    Returns:
+        groups: {numpy array}, cluster label of each sequence
+    '''
+    n = len(sequences)
+    signatures = minhash_signatures(sequences, k = k, num_perm = num_perm,
+                                    random_state = random_state, n_jobs = n_jobs)
+    valid = ~(signatures == _MAX_HASH).all(axis = 1)
+
+    n_bands, rows = _bands(num_perm, threshold)
+    pairs = []
+    for band in range(n_bands):
+        block = signatures[:, band*rows:(band + 1)*rows].astype(np.uint64)
+        #band is reduced to one key, collisions are removed by checking similarity
+        key = np.zeros(n, dtype = np.uint64)
+        for column in block.T:
+            key = key*np.uint64(0x100000001B3) + column
+        _,first,inverse = np.unique(key, return_index = True, return_inverse = True)
+        representative = first[inverse]
+        linked = np.flatnonzero((representative != np.arange(n)) & valid)
+        pairs.append(linked.astype(np.int64)*n + representative[linked])
+
+    #candidate pairs are kept as one integer, they are checked in chunks
+    pairs = np.unique(np.concatenate(pairs)) if pairs else np.empty(0, dtype = np.int64)
+    edges = []
+    for start in range(0, len(pairs), 1 << 14):
+        first, second = np.divmod(pairs[start:start + (1 << 14)], n)
+        similarity = (signatures[first] == signatures[second]).mean(axis = 1)
+        edges.append(np.stack([first, second])[:, similarity >= threshold])
+    edges = np.concatenate(edges, axis = 1) if edges else np.empty((2,0), dtype = int)
+
+    graph = coo_matrix((np.ones(edges.shape[1]), (edges[0], edges[1])), shape = (n, n))
+    return connected_components(graph, directed = False)[1]
+
+
+def read_fasta(file_name, place_protein_id = 1):
+    '''
+    Description:
+        Read protein ids and sequences of a fasta file. Protein id is taken
+        from header as in feature extraction.
+    Parameters:
+        file_name: {string}, path of fasta file
+        place_protein_id: {int}, (default = 1), place of protein id in fasta
+            header separated by '|'
+    Returns:
+        ids: {list}, protein ids
+        sequences: {list}, protein sequences
+    '''
+    ids, sequences = [], []
+    with open(file_name) as f:
+        for line in f:
+            if line.startswith('>'):
+                prot_id = line.strip().split('|')[place_protein_id]
+                ids.append(prot_id[1:] if place_protein_id == 0 else prot_id)
+                sequences.append([])
+            elif sequences:
+                sequences[-1].append(line.strip())
+    return ids, [''.join(s) for s in sequences]
+
+
+def fasta_groups(fasta_files, place_protein_id = 1, protein_ids = None, threshold = 0.3,
+                 k = 3, num_perm = 128, random_state = 0, n_jobs = -1):
+    '''
+    Description:
+        Similarity clusters of proteins of fasta files (e.g. positive and
+        negative sets), to be given to ttv_split as groups.
+    Parameters:
+        fasta_files: {list}, paths of fasta files
+        place_protein_id: {int}, (default = 1), place of protein id in fasta
+            header separated by '|'
+        protein_ids: {list}, (default = None), ids of rows of feature
+            matrices, such as first column of extracted feature files. If
+            given, groups are returned in their order. Otherwise they are in
+            order of sequences in fasta files.
+        threshold, k, num_perm, random_state, n_jobs: see similarity_groups
+    Returns:
+        groups: {numpy array}, cluster label of each protein
+    '''
+    ids, sequences = [], []
+    for fasta_file in fasta_files:
+        file_ids, file_sequences = read_fasta(fasta_file, place_protein_id)
+        ids.extend(file_ids)
+        sequences.extend(file_sequences)
+
+    groups = similarity_groups(sequences, threshold = threshold, k = k, num_perm = num_perm,
+                               random_state = random_state, n_jobs = n_jobs)
+    if protein_ids is None:
+        return groups
+
+    index = {prot_id:i for i,prot_id in enumerate(ids)}
+    missing = [prot_id for prot_id in protein_ids if prot_id not in index]
+    if missing:
+        raise ValueError(f'{len(missing)} protein ids are not found in fasta files, e.g. {missing[0]}')
+    return groups[[index[prot_id] for prot_id in protein_ids]]
@@ -5,16 +5,18 @@ Created on Tue Jan 11 18:26:00 2022
 @author: Sameitos
 """
 
-from ..utils import separator
+from ..utils import split_indices
 import numpy as np
-import random
 
-def ttv_split(X = None,y = None, ratio = 0.2, X_pos = None, X_neg = None):
+def ttv_split(X = None,y = None, ratio = 0.2, X_pos = None, X_neg = None,
+              stratify = False, random_state = None, return_split = False, groups = None):
     
     '''
     Description:
         This function splits X and y randomly to train, test and validation
-        sets according to ratio value
+        sets according to ratio value. Split is formed as index arrays, so
+        each row is copied once into its set. Positive and negative sets
+        are not concatenated, rows of sets are taken from them directly.
         
     Parameters:
         X: default = None, feature matrix. If X_pos and X_neg are not None,
@@ -31,6 +33,22 @@ def ttv_split(X = None,y = None, ratio = 0.2, X_pos = None, X_neg = None):
         in (0,1), train, test and validation sets are formed according to 
         them. If a = 0.2 and b = 0.1, train fraction is 0.7, test fraction 
         is 0.2 and validation fraction is 0.1 of all dataset size. 
+        stratify: {bool}, (default = False), If True, each label is split
+            with respect to ratio, so all sets have the same fraction of
+            positive and negative data.
+        random_state: {int}, (default = None), seed of split. The same
+            random_state gives the same split. If None, global numpy random
+            state is used, so np.random.seed determines the split.
+        return_split: {bool}, (default = False), If True, only a Split
+            object of index arrays is returned and no set is formed. Its
+            indices are of rows of X, or of rows of X_pos followed by rows
+            of X_neg, and its labels are in split.y. Sets can be formed
+            later by split.apply(X) or split.apply([X_pos, X_neg], stacked = True).
+        groups: {array}, (default = None), group label of each row, such as
+            similarity clusters of model_preprocess.similarity.fasta_groups.
+            If given, all rows of a group are put into the same set, so no
+            test protein is similar to a training protein. Sets have about
+            ratio of rows. stratify is not used with groups.
     
     Returns:
         X_train: {numpy array}: training dataset
@@ -40,27 +58,20 @@ def ttv_split(X = None,y = None, ratio = 0.2, X_pos = None, X_neg = None):
         y_test: {numpy array}: test dataset's labels
         y_validation: {numpy array}: validation dataset's labels, returns if ratio is list
     '''
-    if X is not None and y is not None:
-        return separator(X,y, ratio)
-
-    elif X is not None and y is None:
+    if X is not None and y is None:
         raise ValueError('While X is not None, y cannot be None.')
 
-    elif X is None and X_pos is not None:
-        if type(X_pos) == np.ndarray:
-            X_pos = X_pos.tolist()
-            X_neg = X_neg.tolist()
-        y_pos = [1 for i in range(len(X_pos))]
-        y_neg = [-1 for i in range(len(X_neg))]
-
-        X = X_pos + X_neg
-        y = y_pos + y_neg
-        trdn = list(zip(X,y))
-        random.shuffle(trdn)
-        X,y = zip(*(trdn))
+    elif X is None and (X_pos is None or X_neg is None):
+        raise ValueError('X, X_pos and X_neg data cannot be None at the same time.')
 
-        return separator(X,y, ratio)
+    stacked = X is None
+    if stacked:
+        X = [X_pos if hasattr(X_pos, 'shape') else np.asarray(X_pos, dtype = float),
+             X_neg if hasattr(X_neg, 'shape') else np.asarray(X_neg, dtype = float)]
+        y = np.concatenate([np.ones(len(X[0]), dtype = int), -np.ones(len(X[1]), dtype = int)])
 
-    elif X is None and X_neg is None and X_pos is None:
-        raise ValueError('X, X_pos and X_neg data cannot be None at the same time.')
-    
+    split = split_indices(y, ratio, stratify = stratify, random_state = random_state,
+                          groups = groups)
+    if return_split:
+        return split
+    return split.apply(X, stacked = stacked)
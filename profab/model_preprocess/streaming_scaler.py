@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:02:41 2026
+
+@author: Sameitos
+"""
+
+import numpy as np
+from sklearn.base import BaseEstimator, TransformerMixin
+
+
+def _chunks(n, chunk_size):
+
+    for start in range(0, n, chunk_size):
+        yield slice(start, min(start + chunk_size, n))
+
+
+def _handle_zeros(scale):
+
+    #constant features are not scaled as in scikit-learn
+    scale[scale < 10*np.finfo(scale.dtype).eps] = 1.0
+    return scale
+
+
+class _StreamingScaler(BaseEstimator, TransformerMixin):
+    '''
+    Description:
+        Base of scalers that are fitted over chunks of rows with partial_fit
+        and transform data chunk by chunk. Statistics are accumulated in
+        float64. If copy is False and data is a writable float array, it is
+        transformed in place, so its type (e.g. float32) is kept and no
+        second matrix is formed.
+    '''
+
+    def __init__(self, chunk_size = 4096, copy = True):
+        self.chunk_size = chunk_size
+        self.copy = copy
+
+    def fit(self, X, y = None):
+
+        self._reset()
+        return self.partial_fit(X)
+
+    def partial_fit(self, X, y = None):
+
+        if not hasattr(self, 'n_samples_seen_'):
+            self._reset()
+        if not hasattr(X, 'shape'):
+            X = np.asarray(X, dtype = float)
+        for rows in _chunks(len(X), self.chunk_size):
+            chunk = np.asarray(X[rows], dtype = np.float64)
+            self._update(chunk)
+            self.n_samples_seen_ += len(chunk)
+        self.n_features_in_ = X.shape[1]
+        self._finalize()
+        return self
+
+    def _reset(self):
+
+        params = self.get_params()
+        for name in list(vars(self)):
+            if name not in params:
+                delattr(self, name)
+        self.n_samples_seen_ = 0
+
+    def _writable(self, X, copy):
+
+        copy = self.copy if copy is None else copy
+        if (copy or not isinstance(X, np.ndarray) or X.dtype.kind != 'f'
+                or not X.flags.writeable):
+            dtype = X.dtype if isinstance(X, np.ndarray) and X.dtype.kind == 'f' else np.float64
+            return np.array(X, dtype = dtype)
+        return X
+
+    def transform(self, X, copy = None):
+
+        X = self._writable(X, copy)
+        for rows in _chunks(len(X), self.chunk_size):
+            self._transform_chunk(X[rows])
+        return X
+
+    def fit_transform(self, X, y = None, copy = None):
+
+        return self.fit(X).transform(X, copy = copy)
+
+
+class StreamingStandardScaler(_StreamingScaler):
+
+    def __init__(self, chunk_size = 4096, copy = True):
+        '''
+        Description:
+            Standard scaler whose mean and variance are merged over chunks
+            by Welford's (Chan's parallel) update.
+        Parameters:
+            chunk_size: {int}, (default = 4096), number of rows of a chunk
+            copy: {bool}, (default = True), If False, data is scaled in place
+        '''
+        super().__init__(chunk_size = chunk_size, copy = copy)
+
+    def _update(self, chunk):
+
+        n_a, n_b = self.n_samples_seen_, len(chunk)
+        if n_b == 0:
+            return
+        mean_b = chunk.mean(axis = 0)
+        m2_b = ((chunk - mean_b)**2).sum(axis = 0)
+        if n_a == 0:
+            self.mean_, self._m2 = mean_b, m2_b
+            return
+        n = n_a + n_b
+        delta = mean_b - self.mean_
+        self.mean_ = self.mean_ + delta*n_b/n
+        self._m2 = self._m2 + m2_b + delta**2*n_a*n_b/n
+
+    def _finalize(self):
+
+        self.var_ = self._m2/self.n_samples_seen_
+        self.scale_ = _handle_zeros(np.sqrt(self.var_))
+
+    def _transform_chunk(self, chunk):
+
+        chunk -= self.mean_.astype(chunk.dtype)
+        chunk /= self.scale_.astype(chunk.dtype)
+
+    def inverse_transform(self, X, copy = None):
+
+        X = self._writable(X, copy)
+        return X*self.scale_.astype(X.dtype) + self.mean_.astype(X.dtype)
+
+
+class StreamingMaxAbsScaler(_StreamingScaler):
+
+    def __init__(self, chunk_size = 4096, copy = True):
+        '''
+        Description:
+            Max-abs scaler with running maximum of absolute values.
+        Parameters:
+            chunk_size: {int}, (default = 4096), number of rows of a chunk
+            copy: {bool}, (default = True), If False, data is scaled in place
+        '''
+        super().__init__(chunk_size = chunk_size, copy = copy)
+
+    def _update(self, chunk):
+
+        max_abs = np.abs(chunk).max(axis = 0) if len(chunk) else 0
+        self.max_abs_ = np.maximum(getattr(self, 'max_abs_', 0), max_abs)
+
+    def _finalize(self):
+
+        self.scale_ = _handle_zeros(np.array(self.max_abs_, dtype = np.float64))
+
+    def _transform_chunk(self, chunk):
+
+        chunk /= self.scale_.astype(chunk.dtype)
+
+
+class StreamingMinMaxScaler(_StreamingScaler):
+
+    def __init__(self, feature_range = (0, 1), chunk_size = 4096, copy = True):
+        '''
+        Description:
+            Min-max scaler with running minimum and maximum.
+        Parameters:
+            feature_range: {tuple}, (default = (0, 1)), range of scaled data
+            chunk_size: {int}, (default = 4096), number of rows of a chunk
+            copy: {bool}, (default = True), If False, data is scaled in place
+        '''
+        self.feature_range = feature_range
+        super().__init__(chunk_size = chunk_size, copy = copy)
+
+    def _update(self, chunk):
+
+        if not len(chunk):
+            return
+        self.data_min_ = np.minimum(getattr(self, 'data_min_', np.inf), chunk.min(axis = 0))
+        self.data_max_ = np.maximum(getattr(self, 'data_max_', -np.inf), chunk.max(axis = 0))
+
+    def _finalize(self):
+
+        low, high = self.feature_range
+        self.data_range_ = self.data_max_ - self.data_min_
+        self.scale_ = (high - low)/_handle_zeros(self.data_range_.copy())
+        self.min_ = low - self.data_min_*self.scale_
+
+    def _transform_chunk(self, chunk):
+
+        chunk *= self.scale_.astype(chunk.dtype)
+        chunk += self.min_.astype(chunk.dtype)
+
+
+class StreamingRobustScaler(_StreamingScaler):
+
+    def __init__(self, quantile_range = (25.0, 75.0), sketch_size = 1024,
+                 chunk_size = 4096, copy = True, random_state = 0):
+        '''
+        Description:
+            Robust scaler whose median and quantile range are estimated by a
+            streaming quantile sketch. Sketch keeps levels of sorted values
+            of all features at once. When a level is full, every other of
+            its values is promoted to next level with twice weight, so
+            memory is about sketch_size*log2(n_samples/sketch_size) values
+            per feature. Until sketch_size rows are seen, quantiles are
+            exact and equal to those of RobustScaler.
+        Parameters:
+            quantile_range: {tuple}, (default = (25.0, 75.0)), quantiles of
+                scale in percent
+            sketch_size: {int}, (default = 1024), capacity of a level of
+                sketch. Rank error of quantiles is about 1/sketch_size.
+            chunk_size: {int}, (default = 4096), number of rows of a chunk
+            copy: {bool}, (default = True), If False, data is scaled in place
+            random_state: {int}, (default = 0), seed of compactions
+        '''
+        self.quantile_range = quantile_range
+        self.sketch_size = sketch_size
+        self.random_state = random_state
+        super().__init__(chunk_size = chunk_size, copy = copy)
+
+    def _update(self, chunk):
+
+        if not hasattr(self, '_levels'):
+            self._levels = [np.empty((0, chunk.shape[1]))]
+            self._rng = np.random.RandomState(self.random_state)
+        self._levels[0] = np.concatenate([self._levels[0], chunk])
+
+        level = 0
+        while level < len(self._levels) and len(self._levels[level]) >= self.sketch_size:
+            values = np.sort(self._levels[level], axis = 0)
+            #odd row is kept at level, pairs are compacted to one of them
+            keep = len(values) % 2
+            self._levels[level] = values[:keep]
+            promoted = values[keep + self._rng.randint(2)::2]
+            if level + 1 == len(self._levels):
+                self._levels.append(np.empty((0, values.shape[1])))
+            self._levels[level + 1] = np.concatenate([self._levels[level + 1], promoted])
+            level += 1
+
+    def _quantiles(self, q):
+
+        if len(self._levels) == 1:
+            return np.percentile(self._levels[0], q, axis = 0)
+
+        values = np.concatenate(self._levels)
+        weights = np.concatenate([np.full(len(v), 2.0**k) for k,v in enumerate(self._levels)])
+        order = np.argsort(values, axis = 0)
+        cumulative = np.cumsum(weights[order], axis = 0)
+        result = []
+        for p in q:
+            rank = p/100*cumulative[-1]
+            index = (cumulative < rank).sum(axis = 0).clip(max = len(values) - 1)
+            result.append(values[order[index, np.arange(values.shape[1])], np.arange(values.shape[1])])
+        return np.array(result)
+
+    def _finalize(self):
+
+        low, high = self.quantile_range
+        q_low, median, q_high = self._quantiles([low, 50.0, high])
+        self.center_ = median
+        self.scale_ = _handle_zeros(q_high - q_low)
+
+    def _transform_chunk(self, chunk):
+
+        chunk -= self.center_.astype(chunk.dtype)
+        chunk /= self.scale_.astype(chunk.dtype)
+
+
+class StreamingNormalizer(_StreamingScaler):
+
+    def __init__(self, norm = 'l2', chunk_size = 4096, copy = True):
+        '''
+        Description:
+            Normalizer of rows. It has no state, rows are normalized chunk by
+            chunk.
+        Parameters:
+            norm: {'l1','l2','max'}, (default = 'l2'), norm of rows
+            chunk_size: {int}, (default = 4096), number of rows of a chunk
+            copy: {bool}, (default = True), If False, data is scaled in place
+        '''
+        self.norm = norm
+        super().__init__(chunk_size = chunk_size, copy = copy)
+
+    def partial_fit(self, X, y = None):
+
+        self.n_features_in_ = np.shape(X)[1]
+        return self
+
+    def _transform_chunk(self, chunk):
+
+        if self.norm == 'l1':
+            norms = np.abs(chunk).sum(axis = 1)
+        elif self.norm == 'l2':
+            norms = np.sqrt((chunk.astype(np.float64)**2).sum(axis = 1))
+        else:
+            norms = np.abs(chunk).max(axis = 1)
+        norms[norms == 0] = 1.0
+        chunk /= norms.astype(chunk.dtype)[:,None]
+
+
+def streaming_scaler(scale_type, chunk_size = 4096, copy = True):
+    '''
+    Description:
+        Streaming scaler of scale_type
+    Parameters:
+        scale_type: {'normalizer','standard','max_abs','min_max','robust'}
+        chunk_size: {int}, (default = 4096), number of rows of a chunk
+        copy: {bool}, (default = True), If False, data is scaled in place
+    '''
+    scalers = {'normalizer':StreamingNormalizer, 'standard':StreamingStandardScaler,
+               'max_abs':StreamingMaxAbsScaler, 'min_max':StreamingMinMaxScaler,
+               'robust':StreamingRobustScaler}
+    return scalers[scale_type](chunk_size = chunk_size, copy = copy)
@@ -7,6 +7,7 @@ Created on Wed Jan 12 19:51:59 2022
 
 from .imp_split_form import *
 from .imp_split_form import _classif_form_table, _rgr_form_table
-from .imp_split_form import _classif_data_import
+from .imp_split_form import _classif_data_import, _classif_split_import, _classif_batch_import
+from .imp_split_form import _classif_split_rows, _take_stacked
 from .feature_extraction_module import feature_extracter
 from .feature_extraction_module.utils import bcolors
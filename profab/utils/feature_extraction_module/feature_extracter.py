@@ -6,6 +6,9 @@ Created on Mon January 3 00:03:05 2022
 
 import re
 from .utils import *
+from .ifeature_engine import IFEATURE_DESCRIPTORS, read_iFeature_fasta, encode_iFeature
+from .possum_engine import POSSUM_DESCRIPTORS, encode_POSSUM
+import numpy as np
 import warnings
 import pathlib, stat, subprocess
 
@@ -67,19 +70,23 @@ class feature_extracter(object):
         input_folder (str): it is the path to the folder that contains the fasta file.
 
         fasta_file_name (str): it is the name of the fasta file exclude the '.fasta' extension.
+
+        n_jobs (int): number of worker processes of iFeature descriptors, -1 means all processors.
     """
 
     def __init__(self, protein_feature='aac_pssm',
                  place_protein_id=1,
                  input_folder='input_folder',
                  output_folder= 'output_folder',
-                 fasta_file_name='sample'):
+                 fasta_file_name='sample',
+                 n_jobs=-1):
 
         self.protein_feature = protein_feature
         self.place_protein_id = place_protein_id
         self.input_folder = input_folder
         self.fasta_file_name = fasta_file_name
         self.output_folder = output_folder
+        self.n_jobs = n_jobs
 
         self.POSSUM_desc_list = {'aac_pssm', 'd_fpssm', 'smoothed_pssm', 'ab_pssm', 'pssm_composition',
                                   'rpm_pssm', 's_fpssm', 'dpc_pssm', 'k_separated_bigrams_pssm', 'eedp',
@@ -90,84 +97,128 @@ class feature_extracter(object):
                                    'Moran', 'Geary', 'NMBroto', 'CTDC', 'CTDD', 'CTDT', 'CTriad',
                                    'KSCTriad', 'SOCNumber', 'QSOrder', 'all_iFeature'}
 
-    def extract_POSSUM_feature(self):
-        """extract_POSSUM_feature is to extact protein features by using protein descriptors in POSSUM.
+    def descriptor_list(self):
+        """descriptor_list is to find protein descriptors to be extracted.
+
+        protein_feature can be a descriptor, a list of descriptors or descriptors joined
+        by '+' (e.g. 'AAC+CTDT+aac_pssm'). all_iFeature and all_POSSUM are replaced with
+        all descriptors of the tool.
 
         Returns:
-            str: full path to the output file that contains extracted protein features
+            list: names of protein descriptors in the order they are given
 
         """
-        fasta_dict,lst = read_fasta_to_dict(self.input_folder, self.fasta_file_name, self.place_protein_id)
-        
-        copy_form_pssm_matrices(fasta_dict)
-
-        list_desc = [self.protein_feature]
-
-        if self.protein_feature == 'all_POSSUM':
+        protein_feature = self.protein_feature
+        if isinstance(protein_feature, str):
+            protein_feature = protein_feature.split('+')
+
+        list_desc = []
+        for prot_feat in protein_feature:
+            if prot_feat == 'all_iFeature':
+                list_desc.extend(IFEATURE_DESCRIPTORS)
+            elif prot_feat == 'all_POSSUM':
+                list_desc.extend(POSSUM_DESCRIPTORS)
+            elif prot_feat in self.iFeature_desc_list or prot_feat in self.POSSUM_desc_list:
+                list_desc.append(prot_feat)
+            else:
+                raise AttributeError(f"{bcolors.FAIL}{prot_feat} is not a protein descriptor of POSSUM or iFeature{bcolors.ENDC}")
+        return list(dict.fromkeys(list_desc))
+
+    def extract_feature_matrix(self):
+        """extract_feature_matrix is to extract protein features of one or more descriptors as a matrix.
+
+        The fasta file is parsed once and PSSM of each protein is read once for all POSSUM
+        descriptors. Proteins are shared by worker processes, each worker computes all
+        descriptors of its proteins.
 
-            list_desc = self.POSSUM_desc_list - {'all_POSSUM'}
+        Returns:
+            numpy.ndarray: feature matrix, columns of descriptors follow each other
+            list: protein ids of rows
+            dict: column group index, descriptor name -> (start, stop) of its columns
 
+        """
+        list_desc = self.descriptor_list()
+        iFeature_desc = [prot_feat for prot_feat in list_desc if prot_feat in IFEATURE_DESCRIPTORS]
+        POSSUM_desc = [prot_feat for prot_feat in list_desc if prot_feat in POSSUM_DESCRIPTORS]
+        blocks = {}
+
+        if iFeature_desc:
+            fastas = read_iFeature_fasta('{}/{}.fasta'.format(self.input_folder, self.fasta_file_name))
+            protein_ids = [name.split('|')[self.place_protein_id] for name, sequence in fastas]
+            for prot_feat, (columns, features) in zip(iFeature_desc, encode_iFeature(fastas, iFeature_desc,
+                                                                                     self.n_jobs)):
+                blocks[prot_feat] = (protein_ids, features)
+
+        if POSSUM_desc:
+            fasta_dict = read_fasta_to_dict(self.input_folder, self.fasta_file_name, self.place_protein_id)
+            copy_form_pssm_matrices(fasta_dict)
+            pssm_files = ['{}/pssm_files/{}.pssm'.format(path_to_folder, prot_id) for prot_id in fasta_dict]
+            for prot_feat, features in zip(POSSUM_desc, encode_POSSUM(pssm_files, POSSUM_desc, self.n_jobs)):
+                # nan and inf values of POSSUM outputs are replaced with 0
+                blocks[prot_feat] = (list(fasta_dict), np.nan_to_num(features, nan = 0, posinf = 0, neginf = 0))
+
+        protein_ids = blocks[list_desc[0]][0]
+        matrices, column_groups, start = [], {}, 0
         for prot_feat in list_desc:
+            ids, features = blocks[prot_feat]
+            if ids != protein_ids:
+                index = {prot_id: i for i, prot_id in reversed(list(enumerate(ids)))}
+                features = features[[index[prot_id] for prot_id in protein_ids]]
+            matrices.append(features)
+            column_groups[prot_feat] = (start, start + features.shape[1])
+            start += features.shape[1]
 
-            temp_output_file = '{}/temp_folder/temp_output_folder/{}_{}.txt'.format(path_to_folder,
-                                                                                    self.fasta_file_name,
-                                                                                    prot_feat)
+        return np.hstack(matrices), protein_ids, column_groups
 
-            os.system('python {}/POSSUM_Standalone_Toolkit/src/possum.py -i {}/{}.fasta'\
-                      ' -o {} -t {} -p {}/pssm_files'.format(path_to_folder,
-                                                          self.input_folder,
-                                                          self.fasta_file_name,
-                                                          temp_output_file,
-                                                          prot_feat,
-                                                          path_to_folder))
-            
-            
-            ip = re.split('/',self.input_folder)[-1]
-            if not os.path.exists(self.output_folder + '/' + ip):
-            	os.makedirs(self.output_folder + '/' + ip)
-            
-            output_file = self.output_folder + '/' + ip + "/{}_{}.txt".format(
-                                                              self.fasta_file_name,
-                                                              prot_feat)
-
-            edit_extracted_features_POSSUM(temp_output_file, output_file, fasta_dict)
-
-            return output_file
-            
-    def extract_iFeature_feature(self):
-        """extract_iFeature_feature is to extract protein features by using protein descriptors in iFeature
+    def extract_features(self):
+        """extract_features is to extract protein features of one or more descriptors to one output file.
+
+        If more than one descriptor is extracted, their column group index is saved next to
+        the output file as fasta_file_name_protein_feature.groups, it can be read by
+        read_column_groups.
 
         Returns:
             str: full path to the output file that contains extracted protein features
 
         """
-        list_desc = [self.protein_feature]
+        features, protein_ids, column_groups = self.extract_feature_matrix()
+
+        ip = re.split('/',self.input_folder)[-1]
+        if not os.path.isdir(self.output_folder + '/' + ip):
+        	os.makedirs(self.output_folder + '/' + ip)
 
-        if self.protein_feature == 'all_iFeature':
+        name = self.protein_feature if isinstance(self.protein_feature, str) else '+'.join(self.protein_feature)
+        output_file = self.output_folder + '/' + ip + "/{}_{}.txt".format(
+                                                          self.fasta_file_name,
+                                                          name)
 
-            list_desc = self.iFeature_desc_list - {'all_iFeature'}
+        save_extracted_features(output_file, protein_ids, features)
+        if len(column_groups) > 1:
+            save_column_groups(output_file[:-len('.txt')] + '.groups', column_groups)
 
+        return output_file
 
-        for prot_feat in list_desc:
-            temp_output_file = '{}/temp_folder/temp_output_folder/{}_{}.txt'.format(path_to_folder,
-                                                                                    self.fasta_file_name,
-                                                                                    prot_feat)
-            os.system("python {}/iFeature/iFeature.py --file {}/{}.fasta --type {}" \
-                      " --out {}".format(path_to_folder,
-                                         self.input_folder,
-                                         self.fasta_file_name,
-                                         prot_feat,
-                                         temp_output_file))
+    def extract_POSSUM_feature(self):
+        """extract_POSSUM_feature is to extact protein features by using protein descriptors in POSSUM.
+
+        If protein_feature is all_POSSUM, all (21) descriptors are computed and saved in one
+        output file.
+
+        Returns:
+            str: full path to the output file that contains extracted protein features
 
-            ip = re.split('/',self.input_folder)[-1]
-            if not os.path.isdir(self.output_folder + '/' + ip):
-            	os.makedirs(self.output_folder + '/' + ip)
+        """
+        return self.extract_features()
 
-            output_file = self.output_folder + '/' + ip + "/{}_{}.txt".format(
-                                                              self.fasta_file_name,
-                                                              prot_feat)
+    def extract_iFeature_feature(self):
+        """extract_iFeature_feature is to extract protein features by using protein descriptors in iFeature
 
+        Descriptors are computed in this process by ifeature_engine, the fasta file is parsed
+        once and its records are shared by worker processes. If protein_feature is all_iFeature,
+        all (18) descriptors are computed in one pass and saved in one output file.
 
-            edit_extracted_features_iFeature(temp_output_file, output_file, self.place_protein_id)
+        Returns:
+            str: full path to the output file that contains extracted protein features
 
-            return output_file
+        """
+        return self.extract_features()
@@ -1,8 +1,10 @@
 #!/usr/bin/env python
 #_*_coding:utf-8_*_
 
-import re
-from collections import Counter
+import re, sys, os
+pPath = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(pPath)
+import kmerCount
 
 def AAC(fastas, **kw):
 	AA = kw['order'] if kw['order'] != None else 'ACDEFGHIKLMNPQRSTVWY'
@@ -13,13 +15,7 @@ def AAC(fastas, **kw):
 		header.append(i)
 	encodings.append(header)
 
-	for i in fastas:
-		name, sequence = i[0], re.sub('-', '', i[1])
-		count = Counter(sequence)
-		for key in count:
-			count[key] = count[key]/len(sequence)
-		code = [name]
-		for aa in AA:
-			code.append(count[aa])
-		encodings.append(code)
+	names, composition = kmerCount.kmerComposition(fastas, 1, AA, byLength=True)
+	for name, code in zip(names, composition.tolist()):
+		encodings.append([name] + code)
 	return encodings
\ No newline at end of file
@@ -8,6 +8,7 @@ sys.path.append(pPath)
 import readFasta
 import saveCode
 import checkFasta
+import kmerCount
 
 USAGE = """
 USAGE:
@@ -42,15 +43,8 @@ def CKSAAGP(fastas, gap = 5, **kw):
 		'uncharger': 'STCPNQ'
 	}
 
-	AA = 'ARNDCQEGHILKMFPSTWYV'
-
 	groupKey = group.keys()
 
-	index = {}
-	for key in groupKey:
-		for aa in group[key]:
-			index[aa] = key
-
 	gPairIndex = []
 	for key1 in groupKey:
 		for key2 in groupKey:
@@ -63,26 +57,9 @@ def CKSAAGP(fastas, gap = 5, **kw):
 			header.append(p+'.gap'+str(g))
 	encodings.append(header)
 
-	for i in fastas:
-		name, sequence = i[0], re.sub('-', '', i[1])
-		code = [name]
-		for g in range(gap + 1):
-			gPair = generateGroupPairs(groupKey)
-			sum = 0
-			for p1 in range(len(sequence)):
-				p2 = p1 + g + 1
-				if p2 < len(sequence) and sequence[p1] in AA and sequence[p2] in AA:
-					gPair[index[sequence[p1]]+'.'+index[sequence[p2]]] = gPair[index[sequence[p1]]+'.'+index[sequence[p2]]] + 1
-					sum = sum + 1
-
-			if sum == 0:
-				for gp in gPairIndex:
-					code.append(0)
-			else:
-				for gp in gPairIndex:
-					code.append(gPair[gp] / sum)
-
-		encodings.append(code)
+	names, composition = kmerCount.gappedPairComposition(fastas, gap, [group[key] for key in groupKey])
+	for name, code in zip(names, composition.tolist()):
+		encodings.append([name] + code)
 
 	return encodings
 
@@ -1,12 +1,13 @@
 #!/usr/bin/env python
 #_*_coding:utf-8_*_
 
-import sys, os
+import re, sys, os
 pPath = os.path.split(os.path.realpath(__file__))[0]
 sys.path.append(pPath)
 import readFasta
 import saveCode
 import checkFasta
+import kmerCount
 
 USAGE = """
 USAGE:
@@ -37,22 +38,9 @@ def CKSAAP(fastas, gap=5, **kw):
 		for aa in aaPairs:
 			header.append(aa + '.gap' + str(g))
 	encodings.append(header)
-	for i in fastas:
-		name, sequence = i[0], i[1]
-		code = [name]
-		for g in range(gap+1):
-			myDict = {}
-			for pair in aaPairs:
-				myDict[pair] = 0
-			sum = 0
-			for index1 in range(len(sequence)):
-				index2 = index1 + g + 1
-				if index1 < len(sequence) and index2 < len(sequence) and sequence[index1] in AA and sequence[index2] in AA:
-					myDict[sequence[index1] + sequence[index2]] = myDict[sequence[index1] + sequence[index2]] + 1
-					sum = sum + 1
-			for pair in aaPairs:
-				code.append(myDict[pair] / sum)
-		encodings.append(code)
+	names, composition = kmerCount.gappedPairComposition(fastas, gap, AA, removeGaps=False)
+	for name, code in zip(names, composition.tolist()):
+		encodings.append([name] + code)
 	return encodings
 
 if __name__ == '__main__':
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+#_*_coding:utf-8_*_
+
+import re
+import numpy as np
+
+group1 = {
+	'hydrophobicity_PRAM900101': 'RKEDQN',
+	'hydrophobicity_ARGP820101': 'QSTNGDE',
+	'hydrophobicity_ZIMJ680101': 'QNGSWTDERA',
+	'hydrophobicity_PONP930101': 'KPDESNQT',
+	'hydrophobicity_CASG920101': 'KDEQPSRNTG',
+	'hydrophobicity_ENGD860101': 'RDKENQHYP',
+	'hydrophobicity_FASG890101': 'KERSQD',
+	'normwaalsvolume': 'GASTPDC',
+	'polarity':        'LIFWCMVY',
+	'polarizability':  'GASDT',
+	'charge':          'KR',
+	'secondarystruct': 'EALMQKRH',
+	'solventaccess':   'ALFCGIVW'
+}
+group2 = {
+	'hydrophobicity_PRAM900101': 'GASTPHY',
+	'hydrophobicity_ARGP820101': 'RAHCKMV',
+	'hydrophobicity_ZIMJ680101': 'HMCKV',
+	'hydrophobicity_PONP930101': 'GRHA',
+	'hydrophobicity_CASG920101': 'AHYMLV',
+	'hydrophobicity_ENGD860101': 'SGTAW',
+	'hydrophobicity_FASG890101': 'NTPG',
+	'normwaalsvolume': 'NVEQIL',
+	'polarity':        'PATGS',
+	'polarizability':  'CPNVEQIL',
+	'charge':          'ANCQGHILMFPSTWYV',
+	'secondarystruct': 'VIYCWFT',
+	'solventaccess':   'RKQEND'
+}
+group3 = {
+	'hydrophobicity_PRAM900101': 'CLVIMFW',
+	'hydrophobicity_ARGP820101': 'LYPFIW',
+	'hydrophobicity_ZIMJ680101': 'LPFYI',
+	'hydrophobicity_PONP930101': 'YMFWLCVI',
+	'hydrophobicity_CASG920101': 'FIWC',
+	'hydrophobicity_ENGD860101': 'CVLIMF',
+	'hydrophobicity_FASG890101': 'AYHWVMFLIC',
+	'normwaalsvolume': 'MHKFRYW',
+	'polarity':        'HQRKNED',
+	'polarizability':  'KMHFRYW',
+	'charge':          'DE',
+	'secondarystruct': 'GNPSD',
+	'solventaccess':   'MSPTHY'
+}
+
+groups = [group1, group2, group3]
+property = (
+'hydrophobicity_PRAM900101', 'hydrophobicity_ARGP820101', 'hydrophobicity_ZIMJ680101', 'hydrophobicity_PONP930101',
+'hydrophobicity_CASG920101', 'hydrophobicity_ENGD860101', 'hydrophobicity_FASG890101', 'normwaalsvolume',
+'polarity', 'polarizability', 'charge', 'secondarystruct', 'solventaccess')
+
+CTDS = ('CTDC', 'CTDT', 'CTDD')
+# class id of residues in none of the groups of a property
+NO_GROUP = len(groups)
+
+def classTable():
+	# (len(property), 256) class id of each residue byte for each property
+	table = np.full((len(property), 256), NO_GROUP, dtype=np.int64)
+	for p in range(len(property)):
+		for g in range(len(groups)):
+			table[p, np.frombuffer(groups[g][property[p]].encode(), dtype=np.uint8)] = g
+	return table
+
+_classTable = classTable()
+
+def classMatrix(sequence):
+	# (len(property), len(sequence)) class id of each residue for each property, the sequence is mapped once
+	return _classTable[:, np.frombuffer(sequence.encode(), dtype=np.uint8)]
+
+def composition(classes):
+	# (len(property), 3) fraction of residues of group 1, 2 and the rest
+	L = classes.shape[1]
+	counts = np.stack([(classes == g).sum(axis=1) for g in range(2)], axis=1)
+	c1, c2 = counts[:, 0] / L, counts[:, 1] / L
+	return np.stack([c1, c2, 1 - c1 - c2], axis=1)
+
+def transition(classes):
+	# (len(property), 3) fraction of adjacent residue pairs between groups 1-2, 1-3 and 2-3 in either order
+	nClasses = NO_GROUP + 1
+	pairs = classes[:, :-1] * nClasses + classes[:, 1:]
+	ids = np.arange(len(property))[:, None] * nClasses ** 2 + pairs
+	counts = np.bincount(ids.ravel(), minlength=len(property) * nClasses ** 2).reshape(len(property), nClasses, nClasses)
+	counts = counts + counts.transpose(0, 2, 1)
+	return np.stack([counts[:, 0, 1], counts[:, 0, 2], counts[:, 1, 2]], axis=1) / pairs.shape[1]
+
+def distribution(classes):
+	# (len(property), 3, 5) positions (percent of length) where first, 25%, 50%, 75% and all residues of each group are reached
+	L = classes.shape[1]
+	cumulative = np.cumsum(classes[:, None, :] == np.arange(len(groups))[None, :, None], axis=2)
+	number = cumulative[:, :, -1]
+	cutoffNums = np.stack([np.ones_like(number), np.floor(0.25 * number), np.floor(0.50 * number),
+						   np.floor(0.75 * number), number], axis=2)
+	cutoffNums = np.maximum(cutoffNums, 1)
+	# first position whose cumulative count reaches the cutoff, 0 if the group has no residue
+	positions = (cumulative[:, :, None, :] >= cutoffNums[:, :, :, None]).argmax(axis=3)
+	return np.where(number[:, :, None] > 0, (positions + 1) / L * 100, 0)
+
+def CTDMatrices(sequences, descriptors=CTDS):
+	# CTDC, CTDT and CTDD matrices of sequences without gaps, each sequence is mapped to classes once for all of them
+	functions = {'CTDC': composition, 'CTDT': transition, 'CTDD': distribution}
+	rows = {descriptor: [] for descriptor in descriptors}
+	for sequence in sequences:
+		classes = classMatrix(sequence)
+		for descriptor in descriptors:
+			rows[descriptor].append(functions[descriptor](classes).ravel())
+	return {descriptor: np.array(rows[descriptor]) for descriptor in descriptors}
+
+def CTDEncodings(fastas, descriptors=CTDS):
+	# encodings of each of descriptors, all of them come from one pass over fastas
+	headers = {'CTDC': ['#'], 'CTDT': ['#'], 'CTDD': ['#']}
+	for p in property:
+		for g in range(1, len(groups) + 1):
+			headers['CTDC'].append(p + '.G' + str(g))
+		for tr in ('Tr1221', 'Tr1331', 'Tr2332'):
+			headers['CTDT'].append(p + '.' + tr)
+		for g in ('1', '2', '3'):
+			for d in ['0', '25', '50', '75', '100']:
+				headers['CTDD'].append(p + '.' + g + '.residue' + d)
+
+	matrices = CTDMatrices([re.sub('-', '', i[1]) for i in fastas], descriptors)
+	encodings = {}
+	for descriptor in descriptors:
+		encodings[descriptor] = [headers[descriptor]]
+		for i, row in zip(fastas, matrices[descriptor]):
+			encodings[descriptor].append([i[0]] + row.tolist())
+	return encodings
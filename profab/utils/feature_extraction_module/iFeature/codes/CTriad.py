@@ -7,7 +7,7 @@ import re
 import sys, platform
 
 def CTriad(fastas, **kw):
-	dataFile = sys.path[0] + r'\data\CTD.txt' if platform.system() == 'Windows' else sys.path[0] + '/data/CTD.txt'
+	dataFile = re.sub('codes$', '', os.path.split(os.path.realpath(__file__))[0]) + r'\data\CTD.txt' if platform.system() == 'Windows' else re.sub('codes$', '', os.path.split(os.path.realpath(__file__))[0]) + '/data/CTD.txt'
 	CTDIndex = {}
 	with open(dataFile) as f:
 		records = f.readlines()
@@ -1,8 +1,10 @@
 #!/usr/bin/env python
 #_*_coding:utf-8_*_
 
-import re
-from collections import Counter
+import re, sys, os
+pPath = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(pPath)
+import kmerCount
 
 def GAAC(fastas, **kw):
 	group = {
@@ -21,17 +23,8 @@ def GAAC(fastas, **kw):
 		header.append(key)
 	encodings.append(header)
 
-	for i in fastas:
-		name, sequence = i[0], re.sub('-', '', i[1])
-		code = [name]
-		count = Counter(sequence)
-		myDict = {}
-		for key in groupKey:
-			for aa in group[key]:
-				myDict[key] = myDict.get(key, 0) + count[aa]
-
-		for key in groupKey:
-			code.append(myDict[key]/len(sequence))
-		encodings.append(code)
+	names, composition = kmerCount.kmerComposition(fastas, 1, [group[key] for key in groupKey], byLength=True)
+	for name, code in zip(names, composition.tolist()):
+		encodings.append([name] + code)
 
 	return encodings
\ No newline at end of file
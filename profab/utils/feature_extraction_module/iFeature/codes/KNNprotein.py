@@ -10,7 +10,7 @@ from codes import readFasta, NeedlemanWunsch
 
 def CalculateSimilarity(sequence1, sequence2):
 	blosumFile = re.sub('codes$', '', os.path.split(os.path.realpath(__file__))[
-		0]) + r'\data\blosum62.txt' if platform.system() == 'Windows' else sys.path[0] + '/data/blosum62.txt'
+		0]) + r'\data\blosum62.txt' if platform.system() == 'Windows' else re.sub('codes$', '', os.path.split(os.path.realpath(__file__))[0]) + '/data/blosum62.txt'
 	gap = [-10, -1]
 	f = open(blosumFile)
 	raw_matrix = [line.split() for line in f]
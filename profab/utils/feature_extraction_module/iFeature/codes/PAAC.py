@@ -1,11 +1,11 @@
 #!/usr/bin/env python
 #_*_coding:utf-8_*_
 
-import re, sys, os, platform
-import math
+import re, sys, os
 pPath = os.path.split(os.path.realpath(__file__))[0]
 sys.path.append(pPath)
 import checkFasta
+import pseudoAAC
 import readFasta
 import saveCode
 
@@ -18,34 +18,12 @@ USAGE:
 	output:           the encoding file, default: 'encodings.tsv'
 """
 
-def Rvalue(aa1, aa2, AADict, Matrix):
-	return sum([(Matrix[i][AADict[aa1]] - Matrix[i][AADict[aa2]]) ** 2 for i in range(len(Matrix))]) / len(Matrix)
-
 def PAAC(fastas, lambdaValue=30, w=0.05, **kw):
 	if checkFasta.minSequenceLengthWithNormalAA(fastas) < lambdaValue + 1:
 		print('Error: all the sequence length should be larger than the lambdaValue+1: ' + str(lambdaValue + 1) + '\n\n')
 		return 0
 
-	dataFile = re.sub('codes$', '', os.path.split(os.path.realpath(__file__))[0]) + r'\data\PAAC.txt' if platform.system() == 'Windows' else re.sub('codes$', '', os.path.split(os.path.realpath(__file__))[0]) + '/data/PAAC.txt'
-	with open(dataFile) as f:
-		records = f.readlines()
-	AA = ''.join(records[0].rstrip().split()[1:])
-	AADict = {}
-	for i in range(len(AA)):
-		AADict[AA[i]] = i
-	AAProperty = []
-	AAPropertyNames = []
-	for i in range(1, len(records)):
-		array = records[i].rstrip().split() if records[i].rstrip() != '' else None
-		AAProperty.append([float(j) for j in array[1:]])
-		AAPropertyNames.append(array[0])
-
-	AAProperty1 = []
-	for i in AAProperty:
-		meanI = sum(i) / 20
-		fenmu = math.sqrt(sum([(j-meanI)**2 for j in i])/20)
-		AAProperty1.append([(j-meanI)/fenmu for j in i])
-
+	AA = pseudoAAC.PAACData()[0]
 	encodings = []
 	header = ['#']
 	for aa in AA:
@@ -54,20 +32,9 @@ def PAAC(fastas, lambdaValue=30, w=0.05, **kw):
 		header.append('Xc2.lambda' + str(n))
 	encodings.append(header)
 
-	for i in fastas:
-		name, sequence = i[0], re.sub('-', '', i[1])
-		code = [name]
-		theta = []
-		for n in range(1, lambdaValue + 1):
-			theta.append(
-				sum([Rvalue(sequence[j], sequence[j + n], AADict, AAProperty1) for j in range(len(sequence) - n)]) / (
-				len(sequence) - n))
-		myDict = {}
-		for aa in AA:
-			myDict[aa] = sequence.count(aa)
-		code = code + [myDict[aa] / (1 + w * sum(theta)) for aa in AA]
-		code = code + [(w * j) / (1 + w * sum(theta)) for j in theta]
-		encodings.append(code)
+	matrix = pseudoAAC.pseudoComposition([re.sub('-', '', i[1]) for i in fastas], 'PAAC', lambdaValue, w)
+	for i, row in zip(fastas, matrix):
+		encodings.append([i[0]] + row.tolist())
 	return encodings
 
 if __name__ == '__main__':
@@ -1,7 +1,10 @@
 #!/usr/bin/env python
 #_*_coding:utf-8_*_
 
-import re
+import re, sys, os
+pPath = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(pPath)
+import kmerCount
 
 def TPC(fastas, **kw):
 	AA = kw['order'] if kw['order'] != None else 'ACDEFGHIKLMNPQRSTVWY'
@@ -10,18 +13,7 @@ def TPC(fastas, **kw):
 	header = ['#'] + triPeptides
 	encodings.append(header)
 
-	AADict = {}
-	for i in range(len(AA)):
-		AADict[AA[i]] = i
-
-	for i in fastas:
-		name, sequence = i[0], re.sub('-', '', i[1])
-		code = [name]
-		tmpCode = [0] * 8000
-		for j in range(len(sequence) - 3 + 1):
-			tmpCode[AADict[sequence[j]] * 400 + AADict[sequence[j+1]]*20 + AADict[sequence[j+2]]] = tmpCode[AADict[sequence[j]] * 400 + AADict[sequence[j+1]]*20 + AADict[sequence[j+2]]] +1
-		if sum(tmpCode) != 0:
-			tmpCode = [i/sum(tmpCode) for i in tmpCode]
-		code = code + tmpCode
-		encodings.append(code)
+	names, composition = kmerCount.kmerComposition(fastas, 3, AA)
+	for name, code in zip(names, composition.tolist()):
+		encodings.append([name] + code)
 	return encodings
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+#_*_coding:utf-8_*_
+
+import sys, os, re
+import numpy as np
+pPath = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(pPath)
+import checkFasta
+import kmerCount
+
+AA = 'ARNDCQEGHILKMFPSTWYV'
+AUTOCORRELATIONS = ('Moran', 'Geary', 'NMBroto')
+DEFAULT_PROPS = ['CIDH920105', 'BHAR880101', 'CHAM820101', 'CHAM820102',
+				 'CHOC760101', 'BIGC670101', 'CHAM810101', 'DAYM780201']
+# sequences longer than this are correlated by FFT instead of shifted dot products
+FFT_LENGTH = 2048
+
+_AAidxTable = None
+
+def AAidxTable():
+	# property name -> its 20 values (strings, some are NA) in order of AA, data/AAidx.txt is parsed once per process
+	global _AAidxTable
+	if _AAidxTable is None:
+		fileAAidx = os.path.join(re.sub('codes$', '', pPath), 'data', 'AAidx.txt')
+		with open(fileAAidx) as f:
+			records = f.readlines()[1:]
+		_AAidxTable = {}
+		for i in records:
+			array = i.rstrip().split('\t')
+			_AAidxTable[array[0]] = array[1:]
+	return _AAidxTable
+
+def propertyMatrix(props):
+	# (len(props), 20) properties standardized to zero mean and unit (population) std, None if a property not exist
+	table = AAidxTable()
+	for i in props:
+		if i not in table:
+			print('"' + i + '" properties not exist.')
+			return None
+	AAidx = np.array([table[i] for i in props], dtype=float).reshape((len(props), 20))
+	return (AAidx - AAidx.mean(axis=1, keepdims=True)) / AAidx.std(axis=1, keepdims=True)
+
+def lagProducts(values, nlag):
+	# (P, nlag) sums of values[:, j] * values[:, j + n] for n = 1..nlag, all lags and properties at once
+	P, L = values.shape
+	if L > FFT_LENGTH:
+		# zero padded to at least L + nlag, so circular correlation of first nlag lags does not wrap
+		size = 1 << int(np.ceil(np.log2(L + nlag)))
+		spectrum = np.fft.rfft(values, size, axis=1)
+		return np.fft.irfft(spectrum * spectrum.conj(), size, axis=1)[:, 1:nlag + 1]
+	padded = np.concatenate([values, np.zeros((P, nlag))], axis=1)
+	shifted = np.lib.stride_tricks.sliding_window_view(padded, L, axis=1)[:, 1:nlag + 1]
+	return np.einsum('pl,pnl->pn', values, shifted)
+
+def autocorrelationEncodings(fastas, descriptors=AUTOCORRELATIONS, props=DEFAULT_PROPS, nlag=30):
+	# encodings of each of descriptors, all of them come from one pass over fastas
+	if checkFasta.minSequenceLengthWithNormalAA(fastas) < nlag + 1:
+		print('Error: all the sequence length should be larger than the nlag+1: ' + str(nlag + 1) + '\n\n')
+		return dict.fromkeys(descriptors, 0)
+
+	AAidx = propertyMatrix(props)
+	if AAidx is None:
+		return dict.fromkeys(descriptors, None)
+
+	header = ['#']
+	for p in props:
+		for n in range(1, nlag + 1):
+			header.append(p + '.lag' + str(n))
+	encodings = {descriptor: [header] for descriptor in descriptors}
+
+	lags = np.arange(1, nlag + 1)
+	sequences = [re.sub('-', '', i[1]) for i in fastas]
+	for i, code in zip(fastas, kmerCount.encodeSequences(sequences, AA)):
+		# residues not in AA take the value of the first one, as index.get(aa, 0)
+		code = np.where(code == kmerCount.NOT_IN_ALPHABET, 0, code)
+		N = len(code)
+		values = AAidx[:, code]
+		centered = values - values.mean(axis=1, keepdims=True)
+		cumulative = np.cumsum(centered ** 2, axis=1)
+		total = cumulative[:, -1:]
+		rows = {}
+		with np.errstate(divide='ignore', invalid='ignore'):
+			if 'Moran' in encodings or 'Geary' in encodings:
+				centeredProducts = lagProducts(centered, nlag)
+			if 'Moran' in encodings:
+				rows['Moran'] = (centeredProducts / (N - lags)) / (total / N)
+			if 'Geary' in encodings:
+				# sum of (x[j] - x[j + n]) ** 2 = sum of x[j] ** 2 for j < N - n, x[j] ** 2 for j >= n and -2 x[j] x[j + n]
+				squares = cumulative[:, N - lags - 1] + total - cumulative[:, lags - 1] - 2 * centeredProducts
+				rows['Geary'] = (N - 1) / (2 * (N - lags)) * (squares / total)
+			if 'NMBroto' in encodings:
+				rows['NMBroto'] = lagProducts(values, nlag) / (N - lags)
+		for descriptor in descriptors:
+			encodings[descriptor].append([i[0]] + rows[descriptor].ravel().tolist())
+	return encodings
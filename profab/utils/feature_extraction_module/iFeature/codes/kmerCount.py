@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+#_*_coding:utf-8_*_
+
+import numpy as np
+
+NOT_IN_ALPHABET = 255
+
+def encodingTable(alphabet):
+	# alphabet is a string of residues or a list of residue groups, residue -> its index
+	table = np.full(256, NOT_IN_ALPHABET, dtype=np.uint8)
+	for index, residues in enumerate(alphabet):
+		table[np.frombuffer(residues.encode(), dtype=np.uint8)] = index
+	return table
+
+def encodeSequences(sequences, alphabet):
+	# each sequence is encoded once to a uint8 array of residue (or group) indices
+	table = encodingTable(alphabet)
+	return [table[np.frombuffer(sequence.encode(), dtype=np.uint8)] for sequence in sequences]
+
+def kmerIds(encoded, k, base):
+	# id of k-mer at each position by rolling base arithmetic, k-mers with unknown residues are dropped
+	n = len(encoded) - k + 1
+	if n <= 0:
+		return np.zeros(0, dtype=np.int64)
+	ids = np.zeros(n, dtype=np.int64)
+	valid = np.ones(n, dtype=bool)
+	for i in range(k):
+		part = encoded[i:i + n]
+		ids = ids * base + part
+		valid &= part != NOT_IN_ALPHABET
+	return ids[valid]
+
+def kmerCounts(sequences, k, alphabet, batchSize=1024):
+	# (number of sequences, len(alphabet)**k) count matrix, ids of a batch of sequences are counted by one bincount
+	base = len(alphabet)
+	size = base ** k
+	encoded = encodeSequences(sequences, alphabet)
+	counts = np.zeros((len(sequences), size), dtype=np.int64)
+	for start in range(0, len(sequences), batchSize):
+		ids = [kmerIds(code, k, base) for code in encoded[start:start + batchSize]]
+		rows = np.repeat(np.arange(len(ids)), [len(i) for i in ids])
+		flat = np.bincount(rows * size + np.concatenate(ids + [np.zeros(0, dtype=np.int64)]), minlength=len(ids) * size)
+		counts[start:start + len(ids)] = flat.reshape(len(ids), size)
+	return counts
+
+def normalizeRows(counts, totals):
+	# counts / totals of each row, rows whose total is 0 are 0
+	totals = np.asarray(totals, dtype=float)
+	composition = np.zeros(counts.shape, dtype=float)
+	nonzero = totals != 0
+	composition[nonzero] = counts[nonzero] / totals[nonzero, None]
+	return composition
+
+def kmerComposition(fastas, k, alphabet, byLength=False):
+	# names and composition of k-mers of fastas, divided by sequence length if byLength else by number of k-mers
+	names = [i[0] for i in fastas]
+	sequences = [i[1].replace('-', '') for i in fastas]
+	counts = kmerCounts(sequences, k, alphabet)
+	totals = [len(sequence) for sequence in sequences] if byLength else counts.sum(axis=1)
+	return names, normalizeRows(counts, totals)
+
+def gappedPairCounts(sequences, gap, alphabet, batchSize=1024):
+	# (number of sequences, gap+1, len(alphabet)**2) counts of pairs of residues at i and i+g+1 for all g <= gap
+	# sequences of a batch are joined with gap+1 unknown residues between them, so no pair crosses two sequences
+	base = len(alphabet)
+	size = base ** 2
+	nGaps = gap + 1
+	encoded = encodeSequences(sequences, alphabet)
+	separator = np.full(nGaps, NOT_IN_ALPHABET, dtype=np.uint8)
+	counts = np.zeros((len(sequences), nGaps, size), dtype=np.int64)
+	for start in range(0, len(sequences), batchSize):
+		batch = encoded[start:start + batchSize]
+		joined = np.concatenate([part for code in batch for part in (code, separator)])
+		rows = np.repeat(np.arange(len(batch)), [len(code) + nGaps for code in batch])
+		# second residue of pairs of each gap, one strided view of the joined sequences
+		second = np.lib.stride_tricks.sliding_window_view(np.concatenate([joined[1:], separator]), len(joined))[:nGaps]
+		first = joined[None, :]
+		valid = (first != NOT_IN_ALPHABET) & (second != NOT_IN_ALPHABET)
+		ids = (rows[None, :] * nGaps + np.arange(nGaps)[:, None]) * size + first.astype(np.int64) * base + second
+		flat = np.bincount(ids[valid], minlength=len(batch) * nGaps * size)
+		counts[start:start + len(batch)] = flat.reshape(len(batch), nGaps, size)
+	return counts
+
+def gappedPairComposition(fastas, gap, alphabet, removeGaps=True):
+	# names and composition of gapped pairs of fastas, each gap is divided by its number of pairs
+	names = [i[0] for i in fastas]
+	sequences = [i[1].replace('-', '') if removeGaps else i[1] for i in fastas]
+	counts = gappedPairCounts(sequences, gap, alphabet)
+	composition = normalizeRows(counts.reshape(-1, counts.shape[2]), counts.sum(axis=2).ravel())
+	return names, composition.reshape(len(sequences), -1)
+
+def pairLagSums(encoded, table, nlag):
+	# sums of table[encoded[j], encoded[j + n]] over j for n = 1..nlag, pairs of all lags are gathered at once
+	# cumulative sums add pairs one by one in sequence order as Python sum does, so sums are equal bit for bit
+	L = len(encoded)
+	lags = np.arange(1, nlag + 1)
+	padded = np.concatenate([encoded, np.zeros(nlag, dtype=encoded.dtype)])
+	second = np.lib.stride_tricks.sliding_window_view(padded, L)[1:nlag + 1]
+	return np.cumsum(table[encoded[None, :], second], axis=1)[lags - 1, L - lags - 1]
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+#_*_coding:utf-8_*_
+
+import re, sys, os
+import math
+import numpy as np
+pPath = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(pPath)
+import kmerCount
+
+_PAACData = None
+_correlationTables = {}
+
+def PAACData():
+	# residues, property names and standardized properties of data/PAAC.txt, parsed once per process
+	global _PAACData
+	if _PAACData is None:
+		dataFile = os.path.join(re.sub('codes$', '', pPath), 'data', 'PAAC.txt')
+		with open(dataFile) as f:
+			records = f.readlines()
+		AA = ''.join(records[0].rstrip().split()[1:])
+		AAProperty = []
+		AAPropertyNames = []
+		for i in range(1, len(records)):
+			array = records[i].rstrip().split()
+			AAProperty.append([float(j) for j in array[1:]])
+			AAPropertyNames.append(array[0])
+
+		AAProperty1 = []
+		for i in AAProperty:
+			meanI = sum(i) / 20
+			fenmu = math.sqrt(sum([(j - meanI) ** 2 for j in i]) / 20)
+			AAProperty1.append([(j - meanI) / fenmu for j in i])
+		_PAACData = (AA, AAPropertyNames, AAProperty1)
+	return _PAACData
+
+def APAACProperties():
+	# APAAC reads data/PAAC.txt up to its last record, so it uses all properties but the last one
+	AA, AAPropertyNames, AAProperty1 = PAACData()
+	return AAPropertyNames[:-1], AAProperty1[:-1]
+
+def Rvalue(aa1, aa2, AADict, Matrix):
+	return sum([(Matrix[i][AADict[aa1]] - Matrix[i][AADict[aa2]]) ** 2 for i in range(len(Matrix))]) / len(Matrix)
+
+def correlationTable(descriptor):
+	# PAAC: (20, 20) Rvalue of residue pairs, APAAC: (20, 20, P) products of properties of residue pairs
+	if descriptor not in _correlationTables:
+		AA, AAPropertyNames, AAProperty1 = PAACData()
+		AADict = {}
+		for i in range(len(AA)):
+			AADict[AA[i]] = i
+		if descriptor == 'PAAC':
+			table = np.array([[Rvalue(aa1, aa2, AADict, AAProperty1) for aa2 in AA] for aa1 in AA])
+		else:
+			properties = np.array(APAACProperties()[1])
+			table = np.einsum('pi,pj->ijp', properties, properties)
+		_correlationTables[descriptor] = table
+	return _correlationTables[descriptor]
+
+def lagMeans(code, table, lambdaValue):
+	# means of table[code[j], code[j + n]] over j for n = 1..lambdaValue
+	sums = kmerCount.pairLagSums(code, table, lambdaValue)
+	return sums / (len(code) - np.arange(1, lambdaValue + 1)).reshape((-1,) + (1,) * (sums.ndim - 1))
+
+def pseudoComposition(sequences, descriptor='PAAC', lambdaValue=30, w=0.05):
+	# (len(sequences), 20 + number of theta) PAAC or APAAC matrix of sequences without gaps, each sequence is encoded once
+	AA = PAACData()[0]
+	table = correlationTable(descriptor)
+	nTheta = lambdaValue * (table.shape[2] if table.ndim == 3 else 1)
+	matrix = np.zeros((len(sequences), 20 + nTheta))
+	for row, code in zip(matrix, kmerCount.encodeSequences(sequences, AA)):
+		theta = lagMeans(code, table, lambdaValue).ravel()
+		denominator = 1 + w * sum(theta.tolist())
+		row[:20] = np.bincount(code, minlength=20) / denominator
+		row[20:] = (w * theta) / denominator
+	return matrix
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+#_*_coding:utf-8_*_
+
+import sys, os, re
+import numpy as np
+pPath = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(pPath)
+import checkFasta
+import kmerCount
+
+AA = 'ACDEFGHIKLMNPQRSTVWY'
+AA1 = 'ARNDCQEGHILKMFPSTWYV'
+SEQUENCE_ORDERS = ('SOCNumber', 'QSOrder')
+DISTANCES = ('Schneider-Wrede', 'Grantham')
+
+_distanceTables = {}
+
+def distanceTable(distance):
+	# (20, 20) squared distances of residue pairs in order of AA, data/<distance>.txt is parsed once per process
+	if distance not in _distanceTables:
+		dataFile = os.path.join(re.sub('codes$', '', pPath), 'data', distance + '.txt')
+		with open(dataFile) as f:
+			records = f.readlines()
+		order = records[0].rstrip().split()[1:]
+		rows = [[float(j) for j in i.rstrip().split()[1:]] for i in records[1:] if i.rstrip() != '']
+		# Schneider-Wrede is in order of AA and Grantham in order of AA1, both are reordered to AA
+		index = [order.index(aa) for aa in AA]
+		_distanceTables[distance] = (np.array(rows).reshape((20, 20))[np.ix_(index, index)]) ** 2
+	return _distanceTables[distance]
+
+def sequenceOrderMatrices(sequences, descriptors=SEQUENCE_ORDERS, nlag=30, w=0.1):
+	# SOCNumber and QSOrder matrices of sequences without gaps, sequences are encoded once and coupling sums are shared
+	tables = [distanceTable(distance) for distance in DISTANCES]
+	AA1Index = [AA.index(aa) for aa in AA1]
+	lags = np.arange(1, nlag + 1)
+	matrices = {}
+	if 'SOCNumber' in descriptors:
+		matrices['SOCNumber'] = np.zeros((len(sequences), 2 * nlag))
+	if 'QSOrder' in descriptors:
+		matrices['QSOrder'] = np.zeros((len(sequences), 40 + 2 * nlag))
+	for row, code in enumerate(kmerCount.encodeSequences(sequences, AA)):
+		sums = [kmerCount.pairLagSums(code, table, nlag) for table in tables]
+		if 'SOCNumber' in matrices:
+			matrices['SOCNumber'][row] = np.concatenate([s / (len(code) - lags) for s in sums])
+		if 'QSOrder' in matrices:
+			counts = np.bincount(code, minlength=20)[AA1Index]
+			denominators = [1 + w * sum(s.tolist()) for s in sums]
+			matrices['QSOrder'][row] = np.concatenate([counts / d for d in denominators] +
+													  [(w * s) / d for s, d in zip(sums, denominators)])
+	return matrices
+
+def sequenceOrderEncodings(fastas, descriptors=SEQUENCE_ORDERS, nlag=30, w=0.1):
+	# encodings of each of descriptors, all of them come from one pass over fastas
+	if checkFasta.minSequenceLengthWithNormalAA(fastas) < nlag + 1:
+		print('Error: all the sequence length should be larger than the nlag+1: ' + str(nlag + 1) + '\n\n')
+		return dict.fromkeys(descriptors, 0)
+
+	headers = {'SOCNumber': ['#'], 'QSOrder': ['#']}
+	for n in range(1, nlag + 1):
+		headers['SOCNumber'].append('Schneider.lag' + str(n))
+	for n in range(1, nlag + 1):
+		headers['SOCNumber'].append('gGrantham.lag' + str(n))
+	for aa in AA1:
+		headers['QSOrder'].append('Schneider.Xr.' + aa)
+	for aa in AA1:
+		headers['QSOrder'].append('Grantham.Xr.' + aa)
+	for n in range(1, nlag + 1):
+		headers['QSOrder'].append('Schneider.Xd.' + str(n))
+	for n in range(1, nlag + 1):
+		headers['QSOrder'].append('Grantham.Xd.' + str(n))
+
+	matrices = sequenceOrderMatrices([re.sub('-', '', i[1]) for i in fastas], descriptors, nlag, w)
+	encodings = {}
+	for descriptor in descriptors:
+		encodings[descriptor] = [headers[descriptor]]
+		for i, row in zip(fastas, matrices[descriptor]):
+			encodings[descriptor].append([i[0]] + row.tolist())
+	return encodings
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon October 19 10:14:52 2026
+@author: Gokhan Ozsari
+"""
+
+import os
+from importlib import import_module
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+IFEATURE_DESCRIPTORS = ('AAC', 'PAAC', 'APAAC', 'DPC', 'GAAC', 'CKSAAP', 'CKSAAGP', 'GDPC',
+                        'Moran', 'Geary', 'NMBroto', 'CTDC', 'CTDD', 'CTDT', 'CTriad',
+                        'KSCTriad', 'SOCNumber', 'QSOrder')
+
+# keyword arguments that iFeature.py gives to every descriptor
+_IFEATURE_KW = dict(path = None, train = None, label = None, order = 'ACDEFGHIKLMNPQRSTVWY')
+
+# descriptors that share one pass over sequences: module of iFeature/codes, its function
+# that encodes some of them together and the descriptors
+_SHARED_PASSES = (('autocorrelation', 'autocorrelationEncodings', ('Moran', 'Geary', 'NMBroto')),
+                  ('sequenceOrder', 'sequenceOrderEncodings', ('SOCNumber', 'QSOrder')),
+                  ('CTD', 'CTDEncodings', ('CTDC', 'CTDT', 'CTDD')))
+
+
+def _descriptor_function(descriptor):
+    """_descriptor_function imports the function of an iFeature descriptor from iFeature/codes.
+
+    Args:
+        descriptor (str): name of iFeature descriptor
+
+    Returns:
+        function: descriptor function that takes a list of [name, sequence] records
+
+    """
+    if descriptor not in IFEATURE_DESCRIPTORS:
+        raise AttributeError(f'{descriptor} is not one of iFeature descriptors {IFEATURE_DESCRIPTORS}')
+    module = import_module('{}.iFeature.codes.{}'.format(__package__, descriptor))
+    return getattr(module, descriptor)
+
+
+def read_iFeature_fasta(fasta_file):
+    """read_iFeature_fasta reads a fasta file as iFeature.py does.
+
+    Header is the first word after '>' and sequence is in upper case, non-standard
+    amino acids are replaced by '-'.
+
+    Args:
+        fasta_file (str): full path to the fasta file
+
+    Returns:
+        list: [header, sequence] records
+
+    """
+    from .iFeature.codes.readFasta import readFasta
+    return readFasta(fasta_file)
+
+
+def _encode_records(fastas, descriptors):
+    """_encode_records computes descriptors of a shard of fasta records in the current process.
+
+    Moran, Geary and NMBroto are computed together if more than one of them is given,
+    and so are SOCNumber and QSOrder, and CTDC, CTDT and CTDD.
+
+    Args:
+        fastas (list): [header, sequence] records
+        descriptors (list): names of iFeature descriptors
+
+    Returns:
+        list: (column names, feature matrix) of each descriptor
+
+    """
+    shared = {}
+    for module_name, function_name, group in _SHARED_PASSES:
+        together = [descriptor for descriptor in descriptors if descriptor in group]
+        if len(together) > 1:
+            module = import_module('{}.iFeature.codes.{}'.format(__package__, module_name))
+            shared.update(getattr(module, function_name)(fastas, together))
+
+    blocks = []
+    for descriptor in descriptors:
+        if descriptor in shared:
+            encodings = shared[descriptor]
+        else:
+            encodings = _descriptor_function(descriptor)(fastas, **_IFEATURE_KW)
+        if not encodings:
+            raise ValueError('{} could not be calculated for the sequences, they may be shorter '
+                             'than the descriptor needs.'.format(descriptor))
+        blocks.append((encodings[0][1:], np.array([code[1:] for code in encodings[1:]], dtype = float)))
+    return blocks
+
+
+def encode_iFeature(fastas, descriptors, n_jobs = -1):
+    """encode_iFeature computes iFeature descriptors of fasta records in one pass.
+
+    The records are parsed once and split into shards, each shard is encoded by all
+    descriptors in a worker process. Descriptor functions are imported once per worker
+    instead of running iFeature.py for each descriptor.
+
+    Args:
+        fastas (list): [header, sequence] records, e.g. output of read_iFeature_fasta
+        descriptors (list): names of iFeature descriptors
+        n_jobs (int): number of worker processes, -1 means all processors. If it is 1,
+        records are encoded in the current process.
+
+    Returns:
+        list: (column names, feature matrix) of each descriptor, rows are in order of fastas
+
+    """
+    for descriptor in descriptors:
+        _descriptor_function(descriptor)
+
+    n_jobs = os.cpu_count() if n_jobs == -1 else n_jobs
+    n_shards = min(n_jobs, len(fastas))
+    if n_shards <= 1:
+        return _encode_records(fastas, descriptors)
+
+    bounds = np.linspace(0, len(fastas), n_shards + 1).astype(int)
+    shards = [fastas[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+    with ProcessPoolExecutor(max_workers = n_shards) as executor:
+        results = list(executor.map(_encode_records, shards, [descriptors]*n_shards))
+
+    return [(results[0][i][0], np.concatenate([result[i][1] for result in results]))
+            for i in range(len(descriptors))]
+
+
+def extract_iFeature_matrix(fasta_file, descriptors, place_protein_id = 1, n_jobs = -1):
+    """extract_iFeature_matrix extracts iFeature descriptors of a fasta file as a matrix.
+
+    Args:
+        fasta_file (str): full path to the fasta file
+        descriptors (str or list): name or names of iFeature descriptors
+        place_protein_id (int): It indicates the place of protein id in fasta header.
+        e.g. fasta header: >sp|O27002|....|....|...., seperate the header wrt. '|' then >sp is
+        in the zeroth position, protein id in the first(1) position.
+        n_jobs (int): number of worker processes, -1 means all processors
+
+    Returns:
+        numpy.ndarray: feature matrix whose columns are features of descriptors in given order
+        list: protein ids of rows
+
+    """
+    descriptors = [descriptors] if isinstance(descriptors, str) else list(descriptors)
+    fastas = read_iFeature_fasta(fasta_file)
+    protein_ids = [name.split('|')[place_protein_id] for name, sequence in fastas]
+    blocks = encode_iFeature(fastas, descriptors, n_jobs = n_jobs)
+    return np.hstack([matrix for columns, matrix in blocks]), protein_ids
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon October 19 11:02:37 2026
+@author: Gokhan Ozsari
+"""
+
+import os, sys
+import pathlib
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+path_to_folder = pathlib.Path(__file__).parent.resolve()
+sys.path.append('{}/POSSUM_Standalone_Toolkit/src'.format(path_to_folder))
+
+POSSUM_DESCRIPTORS = ('aac_pssm', 'd_fpssm', 'smoothed_pssm', 'ab_pssm', 'pssm_composition',
+                      'rpm_pssm', 's_fpssm', 'dpc_pssm', 'k_separated_bigrams_pssm', 'tri_gram_pssm',
+                      'eedp', 'tpc', 'edp', 'rpssm', 'pse_pssm', 'dp_pssm', 'pssm_ac', 'pssm_cc',
+                      'aadp_pssm', 'aatp', 'medp')
+
+# number of (unused) arguments that possum.py gives to descriptors besides PSSM
+_POSSUM_ARGUMENTS = {'smoothed_pssm': 2, 'k_separated_bigrams_pssm': 1, 'pse_pssm': 1,
+                     'dp_pssm': 1, 'pssm_ac': 1, 'pssm_cc': 1}
+
+
+def read_pssm(pssm_file):
+    """read_pssm reads a PSSM file as possum.py does.
+
+    Args:
+        pssm_file (str): full path to the pssm file
+
+    Returns:
+        numpy.ndarray: rows of PSSM, each row is amino acid followed by its scores
+
+    """
+    from possum_ft import readToMatrix
+    with open(pssm_file) as fp:
+        return readToMatrix(fp.readlines())
+
+
+def _encode_pssms(pssm_files, descriptors):
+    """_encode_pssms computes POSSUM descriptors of a shard of proteins in the current process.
+
+    Each PSSM file is read once and all descriptors are computed from it.
+
+    Args:
+        pssm_files (list): full paths to pssm files of proteins
+        descriptors (list): names of POSSUM descriptors
+
+    Returns:
+        list: feature matrix of each descriptor
+
+    """
+    import possum_ft
+    rows = [[] for descriptor in descriptors]
+    for pssm_file in pssm_files:
+        pssm = read_pssm(pssm_file)
+        for i, descriptor in enumerate(descriptors):
+            arguments = [''] * _POSSUM_ARGUMENTS.get(descriptor, 0)
+            feature = getattr(possum_ft, descriptor)(pssm.copy(), *arguments)
+            rows[i].append(np.ravel(np.array(feature, dtype = float)))
+    return [np.array(row) for row in rows]
+
+
+def encode_POSSUM(pssm_files, descriptors, n_jobs = -1):
+    """encode_POSSUM computes POSSUM descriptors of proteins in one pass over their PSSMs.
+
+    Proteins are split into shards and each shard is encoded by all descriptors in a
+    worker process, so each PSSM file is read and parsed only once.
+
+    Args:
+        pssm_files (list): full paths to pssm files of proteins
+        descriptors (list): names of POSSUM descriptors
+        n_jobs (int): number of worker processes, -1 means all processors. If it is 1,
+        proteins are encoded in the current process.
+
+    Returns:
+        list: feature matrix of each descriptor, rows are in order of pssm_files
+
+    """
+    for descriptor in descriptors:
+        if descriptor not in POSSUM_DESCRIPTORS:
+            raise AttributeError(f'{descriptor} is not one of POSSUM descriptors {POSSUM_DESCRIPTORS}')
+
+    n_jobs = os.cpu_count() if n_jobs == -1 else n_jobs
+    n_shards = min(n_jobs, len(pssm_files))
+    if n_shards <= 1:
+        return _encode_pssms(pssm_files, descriptors)
+
+    bounds = np.linspace(0, len(pssm_files), n_shards + 1).astype(int)
+    shards = [pssm_files[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+    with ProcessPoolExecutor(max_workers = n_shards) as executor:
+        results = list(executor.map(_encode_pssms, shards, [descriptors]*n_shards))
+
+    return [np.concatenate([result[i] for result in results]) for i in range(len(descriptors))]
@@ -189,60 +189,53 @@ def copy_form_pssm_matrices(fasta_dict):
         form_missing_pssm_files(pssm_dir)
 
 
-def edit_extracted_features_POSSUM(temp_output_file, output_file, fasta_dict):
-    """edit_extracted_features_POSSUM function is to edit the output file of POSSUM.
+def save_extracted_features(output_file, protein_ids, features):
+    """save_extracted_features function is to save extracted features of proteins.
 
     The function forms a tab separated output file whose first column is protein ids and
     the rest of the columns are the extracted protein features.
 
     Args:
-         temp_output_file (str): It is the full path to the output file of POSSUM
-         output_file (str): It is the full path to the final output file (edited)
-         fasta_dict (dict): This is a dict of fasta file. The keys of fasta_dict are protein ids and
-         values are protein sequences.
+         output_file (str): It is the full path to the output file
+         protein_ids (list): protein ids of rows of features
+         features (numpy.ndarray): extracted protein features
 
     """
-    with open(temp_output_file, 'r') as fp:
-        fw = open(output_file, 'w')
-        for line, prot_id in zip(fp, fasta_dict):
-            fw.write('{}'.format(prot_id))
-            list_line = line.strip().split(',')
-            for item in list_line:
-                if item == 'nan' or item == 'inf' or item == '-inf':
-                    fw.write('\t0')
-                else:
-                    fw.write('\t{}'.format(item))
+    with open(output_file, 'w') as fw:
+        for protein_id, row in zip(protein_ids, features):
+            fw.write(protein_id)
+            for feature in row.tolist():
+                fw.write('\t{}'.format(feature))
             fw.write('\n')
-        fw.close()
-    fp.close()
-    os.remove(temp_output_file)
 
-def edit_extracted_features_iFeature(temp_output_file, output_file, place_protein_id):
-    """edit_extracted_features_iFeature function is to edit the output file of iFeature.
+def save_column_groups(groups_file, column_groups):
+    """save_column_groups function is to save column group index of a combined feature file.
 
-    The function forms a tab separated output file whose first column is protein ids and
-    the rest of the columns are the extracted protein features.
+    Each line of the file is name of a protein descriptor, first and last+1 column of its
+    features (protein id column is not counted), separated by tab.
+
+    Args:
+         groups_file (str): It is the full path to the column group index file
+         column_groups (dict): descriptor name -> (start, stop) of its columns
+
+    """
+    with open(groups_file, 'w') as fw:
+        for prot_feat, (start, stop) in column_groups.items():
+            fw.write('{}\t{}\t{}\n'.format(prot_feat, start, stop))
+
+def read_column_groups(groups_file):
+    """read_column_groups function is to read column group index of a combined feature file.
 
     Args:
-         temp_output_file (str): It is the full path to the output file of POSSUM
-         output_file (str): It is the full path to the final output file (edited)
-         place_protein_id (int): It indicates the place of protein id in fasta header.
-         e.g. fasta header: >sp|O27002|....|....|...., seperate the header wrt. '|' then >sp is
-         in the zeroth position, protein id in the first(1) position.
+         groups_file (str): It is the full path to the column group index file
+
+    Returns:
+        dict: descriptor name -> (start, stop) of its columns
 
     """
-    with open(temp_output_file, 'r') as fp:
-        fw = open(output_file, 'w')
+    column_groups = dict()
+    with open(groups_file, 'r') as fp:
         for line in fp:
-            if line[0] == '#':
-                continue
-            else:
-                line_split = line.strip().split('\t')
-                protein_id = line_split[0].split('|')[place_protein_id]
-                fw.write(protein_id)
-                for feature in line_split[1:]:
-                    fw.write('\t{}'.format(feature))
-                fw.write('\n')
-        fw.close()
-    fp.close()
-    os.remove(temp_output_file)
+            prot_feat, start, stop = line.strip().split('\t')
+            column_groups[prot_feat] = (int(start), int(stop))
+    return column_groups
@@ -9,54 +9,336 @@ import io
 import os
 import re
 import sys
+import shutil
+import struct
+import warnings
+import hashlib
 import random
 import requests
 import numpy as np
+from sklearn.utils import check_random_state
 from tqdm import tqdm
-from sklearn.model_selection import train_test_split
+import zipfile
 from zipfile import ZipFile
 
 import torch
 
-def download_data(server_path,save_path):
+def _chunk_size(total_byte):
     
     '''
     Description:
-        Download dataset from Kansil server
+        Chunk size of download with respect to file size. It is between
+        64 KiB and 4 MiB so that a file is read in about 256 chunks.
+    '''
+    
+    return int(min(max(total_byte // 256, 64*1024), 4*1024*1024))
+
+def _verify_download(file_path, total_byte, checksum = None):
+    
+    '''
+    Description:
+        Check whether downloaded file is complete. Size of file is compared
+        with the size given by server and its hash is compared with checksum.
+        If no checksum is given and file is a zip file, CRC values of all
+        members are checked.
+    Parameters:
+        file_path: {string}, path of downloaded file
+        total_byte: {int}, size of file given by server
+        checksum: {string}, (default = None), expected hash of file as
+            "<algorithm>:<hex digest>", e.g. "sha256:9f86...". If algorithm
+            is not given, sha256 is used.
+    '''
+    
+    if os.path.getsize(file_path) != total_byte:
+        raise IOError(f'Size of downloaded file {file_path} is {os.path.getsize(file_path)} bytes,'
+                      f' {total_byte} bytes expected')
+    
+    if checksum is not None:
+        algorithm,digest = checksum.split(':') if ':' in checksum else ('sha256',checksum)
+        h = hashlib.new(algorithm)
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+        if h.hexdigest() != digest.lower():
+            raise IOError(f'Checksum of downloaded file {file_path} does not match {checksum}')
+    
+    elif zipfile.is_zipfile(file_path):
+        with ZipFile(file_path) as f:
+            bad_member = f.testzip()
+        if bad_member is not None:
+            raise IOError(f'Downloaded file {file_path} is corrupted at {bad_member}')
+    
+    elif file_path.endswith('.zip') or file_path.endswith('.zip.part'):
+        raise IOError(f'Downloaded file {file_path} is not a valid zip file')
+
+def download_data(server_path,save_path,checksum = None,session = None,progress = True,retries = 3):
+    
+    '''
+    Description:
+        Download dataset from Kansil server. Data is written to
+        "<save_path>.part" and renamed to save_path after its size and
+        checksum are verified, so save_path exists only if download is
+        complete. Interrupted downloads are resumed from .part file with
+        HTTP Range requests if server supports them.
     Parameters:
         server_path: {string}, path of server where data is hold
         save_path: {string}, path to save dataset in local
+        checksum: {string}, (default = None), expected hash of file as
+            "<algorithm>:<hex digest>". If None, zip files are checked by
+            CRC values of their members.
+        session: {requests.Session}, (default = None), session to reuse
+            connections of, If None, a new session is used.
+        progress: {bool}, (default = True), If True, progress bar is shown
+        retries: {int}, (default = 3), number of times that a failed
+            transfer is resumed
     '''
     
-    headers=requests.head(server_path).headers
+    if session is None:
+        session = requests.Session()
+    
+    head = session.head(server_path, allow_redirects = True)
+    headers = head.headers
     #print(headers)
-    downloadable = 'Content-Length' in headers.keys()
-    if downloadable:
-        response = requests.get(server_path, stream = True)
-        
-        total_byte= int(response.headers.get('content-length', 0)) 
-        progress_bar = tqdm(total=total_byte, unit='iB', unit_scale=True)
-        with open(save_path, 'wb') as file:
-            for data in response.iter_content(chunk_size= 8*1024):
-                progress_bar.update(len(data))
-                file.write(data)
-        progress_bar.close()
-    else:
+    downloadable = head.ok and 'Content-Length' in headers.keys()
+    if not downloadable:
         print("No given dataset is available in server.")
         sys.exit(1)
+    
+    total_byte = int(headers['Content-Length'])
+    resumable = headers.get('Accept-Ranges', '').lower() == 'bytes'
+    part_path = save_path + '.part'
+    
+    for attempt in range(retries + 1):
+        
+        done = os.path.getsize(part_path) if os.path.isfile(part_path) else 0
+        if not resumable or done > total_byte:
+            done = 0
+        if done == total_byte:
+            break
+        
+        try:
+            range_header = {'Range': f'bytes={done}-'} if done else {}
+            with session.get(server_path, stream = True, headers = range_header,
+                             timeout = 60) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    done = 0
+                
+                progress_bar = tqdm(total=total_byte, initial = done, unit='iB',
+                                    unit_scale=True, disable = not progress)
+                with open(part_path, 'ab' if done else 'wb') as file:
+                    for data in response.iter_content(chunk_size = _chunk_size(total_byte)):
+                        progress_bar.update(len(data))
+                        file.write(data)
+                progress_bar.close()
+            
+            if os.path.getsize(part_path) >= total_byte:
+                break
+                
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                requests.exceptions.ChunkedEncodingError):
+            if attempt == retries:
+                raise
+    
+    try:
+        _verify_download(part_path, total_byte, checksum)
+    except IOError:
+        os.remove(part_path)
+        raise
+    os.replace(part_path, save_path)
+
+class Split():
+    
+    '''
+    Description:
+        Train, test and validation parts of a dataset as index arrays into
+        its rows. Parts of a matrix are formed with take or apply, each row
+        is copied once and no intermediate copy of data is formed.
+    Parameters:
+        train: {numpy array}, indices of training set
+        test: {numpy array}, indices of test set
+        validation: {numpy array}, (default = None), indices of validation set
+        y: {numpy array}, (default = None), labels of all rows
+    '''
+    
+    def __init__(self, train, test, validation = None, y = None):
+        self.train = train
+        self.test = test
+        self.validation = validation
+        self.y = y
+    
+    @property
+    def parts(self):
+        if self.validation is None:
+            return [self.train, self.test]
+        return [self.train, self.test, self.validation]
+    
+    def take(self, X, stacked = False):
+        '''
+        Description:
+            Parts of X in order of train, test and validation.
+        Parameters:
+            X: {numpy array, list}, matrix whose rows are indexed by split,
+                or a list of matrices if stacked is True
+            stacked: {bool}, (default = False), If True, X is a list of
+                matrices (such as positive and negative sets) whose stacked
+                rows are indexed by split. Stacked matrices are not
+                concatenated, rows are taken from each of them.
+        '''
+        if stacked:
+            return [_take_stacked(X, idx) for idx in self.parts]
+        X = _as_matrix(X)
+        return [X[idx] for idx in self.parts]
+    
+    def apply(self, X, y = None, stacked = False):
+        '''
+        Description:
+            Parts of X and y in order of separator: X_train, X_test,
+            (X_validation), y_train, y_test, (y_validation). If y is None,
+            labels of split are used. stacked is as in take.
+        '''
+        y = self.y if y is None else np.asarray(y)
+        return tuple(self.take(X, stacked = stacked) + [y[idx] for idx in self.parts])
+
+def _as_matrix(X):
+    
+    if hasattr(X, 'shape'):
+        return X
+    return np.asarray(X, dtype = float)
+
+def _take_stacked(blocks, idx):
+    
+    '''
+    Description:
+        Rows idx of vertically stacked blocks without concatenating them
+    '''
+    
+    #empty blocks do not shift indices
+    blocks = [block for block in blocks if len(block)] or blocks[:1]
+    X = np.empty((len(idx),) + blocks[0].shape[1:], dtype = np.result_type(*blocks))
+    offset = 0
+    for block in blocks:
+        inside = (idx >= offset) & (idx < offset + len(block))
+        X[inside] = block[idx[inside] - offset]
+        offset += len(block)
+    return X
+
+def _part_sizes(n, ratio):
+    
+    '''
+    Description:
+        Sizes of test and validation sets as in train_test_split
+    '''
+    
+    if type(ratio) == list:
+        n_test = int(np.ceil(ratio[0]*n))
+        return n_test, int(np.ceil(ratio[1]/(1-ratio[0])*(n - n_test)))
+    return int(np.ceil(ratio*n)), 0
+
+def _group_parts(groups, ratio, rng):
+    
+    '''
+    Description:
+        Assign whole groups to parts. Groups are shuffled and laid out one
+        after another, a group is in test set if its middle row is in first
+        n_test rows, in validation set if it is in next n_valid rows and in
+        training set otherwise. Sizes of parts are thus within half of a
+        group of the sizes given by ratio.
+    '''
+    
+    _,inverse = np.unique(groups, return_inverse = True)
+    sizes = np.bincount(inverse)
+    order = rng.permutation(len(sizes))
+    middle = np.empty(len(sizes))
+    middle[order] = np.cumsum(sizes[order]) - sizes[order]/2
+    
+    n_test, n_valid = _part_sizes(len(inverse), ratio)
+    part = np.where(middle < n_test, 1, np.where(middle < n_test + n_valid, 2, 0))[inverse]
+    return [np.flatnonzero(part == k) for k in range(3)]
+
+def split_indices(y, ratio, stratify = False, random_state = None, groups = None):
+    
+    '''
+    Description:
+        Randomly split rows into train, test and validation sets with
+        respect to ratio. Only index arrays are formed. Indices of each part
+        are in random order.
+    Parameters:
+        y: {numpy array, list, int}, labels of rows or number of rows
+        ratio: {float, list}, ratio of test set, or ratios of test and
+            validation sets, as in separator
+        stratify: {bool}, (default = False), If True, each label is split
+            with respect to ratio separately, so parts have the same
+            fraction of labels
+        random_state: {int, RandomState}, (default = None), seed of split.
+            The same random_state gives the same split. If None, global
+            numpy random state (np.random.seed) is used.
+        groups: {numpy array, list}, (default = None), group of each row
+            such as clusters of similar sequences. If given, all rows of a
+            group are put into the same part and sizes of parts follow
+            ratio approximately. stratify is not used with groups.
+    Returns:
+        split: {Split}, indices of parts
+    '''
+    
+    if type(ratio) not in [float, list]:
+        raise AttributeError('Please enter ratio value in true type. Options: "float, list"')
+    
+    #with None, global numpy generator is used, so np.random.seed determines the split
+    rng = check_random_state(random_state)
+    labels = None if isinstance(y, (int, np.integer)) else np.asarray(y).ravel()
+    n = y if labels is None else len(labels)
+    
+    if groups is not None:
+        if len(groups) != n:
+            raise ValueError(f'Number of groups ({len(groups)}) and rows ({n}) are different')
+        train, test, validation = [p[rng.permutation(len(p))]
+                                   for p in _group_parts(np.asarray(groups), ratio, rng)]
+        return Split(train, test, validation if type(ratio) == list else None, y = labels)
+    
+    strata = [np.arange(n)]
+    if stratify and labels is not None:
+        strata = [np.flatnonzero(labels == label) for label in np.unique(labels)]
+    
+    parts = [[],[],[]]
+    for rows in strata:
+        rows = rows[rng.permutation(len(rows))]
+        n_test, n_valid = _part_sizes(len(rows), ratio)
+        rest = rows[n_test:]
+        if type(ratio) == list:
+            #validation set is split from a new shuffle of the rest as by chained train_test_split
+            rest = rest[rng.permutation(len(rest))]
+        parts[1].append(rows[:n_test])
+        parts[2].append(rest[:n_valid])
+        parts[0].append(rest[n_valid:])
+    
+    train, test, validation = [np.concatenate(p) for p in parts]
+    if stratify and len(strata) > 1:
+        train, test, validation = [p[rng.permutation(len(p))] for p in [train, test, validation]]
+    
+    return Split(train, test, validation if type(ratio) == list else None, y = labels)
 
-def separator(X,y,ratio):
+def separator(X,y,ratio,stratify = False,random_state = None,stacked = False):
     '''
     Description:
         To split data into train, test and validation sets with respect to ratio
-        value
+        value. Split is formed as index arrays by split_indices and each set
+        is taken from X at once, so data is not copied more than once.
     Paramters:
+        X: {numpy array, list}, feature matrix, or list of matrices such as
+            [X_pos, X_neg] whose rows are stacked if stacked is True
+        y: {numpy array, list}, labels of rows of X
         ratio: {float, list}, used to split data into train, test, validation
             sets as given values. If ratio = a (float), then test will be a%
             of total data size. If ratio = [a,b] where a and b are in (0,1), 
             train, test and validation sets are formed according to them. For
             example, If a = 0.2 and b = 0.1, train fraction is 0.7, test
             fraction is 0.2 and validation fraction is 0.1 of all dataset size.
+        stratify: {bool}, (default = False), If True, split is stratified
+            by labels
+        random_state: {int}, (default = None), seed of split
+        stacked: {bool}, (default = False), If True, X is a list of
+            matrices whose rows are stacked, see Split.take
     Returns:
         X_train: {numpy array}: training dataset
         X_test: {numpy array}: test dataset
@@ -67,22 +349,372 @@ def separator(X,y,ratio):
         y_validation: {numpy array}: validation dataset's labels, returns if
             ratio is list
     '''
-    if type(ratio) == float:
+    
+    return split_indices(y, ratio, stratify = stratify,
+                         random_state = random_state).apply(X, stacked = stacked)
+    
 
-        return train_test_split(X,y, test_size = ratio)
+def _parse_values(text, dtype, sep):
+    
+    '''
+    Description:
+        Values of text separated by sep. Parsing stops at the first
+        malformed value and values parsed until then are returned (newer
+        NumPy raises instead, then nothing is returned), so callers check
+        their number.
+    '''
+    
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', DeprecationWarning)
+        try:
+            return np.fromstring(text, dtype = dtype, sep = sep)
+        except ValueError:
+            return np.empty(0, dtype = dtype)
 
-    elif type(ratio) == list:
+_ID_COLUMN = re.compile(rb'^[^\t\n]*\t', re.M)
 
-        X_train,X_test,y_train,y_test = train_test_split(X,y, test_size = ratio[0])
+def _parse_feature_block(buf, dtype, member = None):
+    
+    '''
+    Description:
+        Parse complete lines of a feature file into 2D array. First column
+        (protein id) of each line is dropped before parsing. Parsing stops
+        at the first malformed value, so number of parsed values is checked
+        against number of lines and columns.
+    Parameters:
+        buf: {bytes}, complete lines of tab separated feature file, each
+            ending with a newline
+        dtype: {'float32','float64'}, type of returned array
+        member: {string}, (default = None), name of feature file, used in
+            error message
+    '''
+    
+    buf = _ID_COLUMN.sub(b'', buf.replace(b'\r', b''))
+    n_lines = buf.count(b'\n')
+    n_cols = buf[:buf.find(b'\n')].count(b'\t') + 1
+    
+    values = _parse_values(buf.decode('utf-8'), dtype, '\t')
+    if values.size != n_lines*n_cols or buf.count(b'\t') != n_lines*(n_cols - 1):
+        raise ValueError(f'Feature file {member} has malformed rows: {n_lines} rows of {n_cols}'
+                         f' columns expected, {values.size} values are parsed')
+    
+    return values.reshape(n_lines, n_cols)
 
-        X_train,X_validation,y_train,y_validation = train_test_split(X_train,y_train,
-                                                                     test_size = ratio[1]/(
-                                                                         1-ratio[0]))
-            
-        return X_train,X_test,X_validation,y_train,y_test,y_validation
+def _feature_blocks(zf, member, dtype = 'float64', chunk_size = 1 << 24):
+
+    '''
+    Description:
+        Parse a feature file in zip file block by block. File is read in
+        chunks of chunk_size bytes and complete lines of each chunk are
+        parsed at once.
+    Parameters:
+        zf: {ZipFile}, opened zip file
+        member: {string}, name of feature file in zip file
+        dtype: {'float32','float64'}, (default = 'float64'), type of blocks
+        chunk_size: {int}, (default = 16 MiB), size of chunks in bytes
+    Yields:
+        block: {numpy array}, consecutive rows of feature matrix
+    '''
+
+    tail = b''
+    with zf.open(member) as f:
+        while True:
+            chunk = f.read(chunk_size)
+            buf = tail + chunk
+            if chunk:
+                cut = buf.rfind(b'\n') + 1
+                buf, tail = buf[:cut], buf[cut:]
+            if buf.strip():
+                yield _parse_feature_block(buf.strip(b'\n') + b'\n', dtype, member)
+            if not chunk:
+                break
+
+def _load_feature_matrix(zf, member, dtype = 'float64', chunk_size = 1 << 24):
+
+    '''
+    Description:
+        Load a feature file in zip file as a single contiguous matrix. File is
+        read in chunks of chunk_size bytes and each chunk is parsed at once.
+    Parameters:
+        zf: {ZipFile}, opened zip file
+        member: {string}, name of feature file in zip file
+        dtype: {'float32','float64'}, (default = 'float64'), type of matrix
+        chunk_size: {int}, (default = 16 MiB), size of chunks in bytes
+    Returns:
+        X: {numpy array}, feature matrix of shape (n_proteins, n_features)
+    '''
+
+    blocks = list(_feature_blocks(zf, member, dtype = dtype, chunk_size = chunk_size))
+
+    if not blocks:
+        return np.empty((0,0), dtype = dtype)
+    if len(blocks) == 1:
+        return blocks[0]
+    return np.concatenate(blocks)
+
+def _read_indices(zf, member):
+    
+    '''
+    Description:
+        Read an index file in zip file as a sorted array of unique row indices
+    Parameters:
+        zf: {ZipFile}, opened zip file
+        member: {string}, name of index file in zip file
+    '''
+    
+    with zf.open(member) as f:
+        text = f.read().decode('utf-8')
+    
+    #parsing stops at the first malformed line, so all lines must be parsed
+    indices = _parse_values(text, int, '\n')
+    if indices.size != len(text.split()):
+        raise ValueError(f'Index file {member} has malformed lines: {len(text.split())} indices'
+                         f' expected, {indices.size} are parsed')
+    return np.unique(indices)
+
+def _form_sets(pX, nX, label, pos_idx = None, neg_idx = None):
+    
+    '''
+    Description:
+        Select rows of positive and negative matrices and form the outputs
+        of _classif_data_import with respect to label
+    '''
+    
+    if pos_idx is not None and len(pX):
+        pX = pX[pos_idx[pos_idx < len(pX)]]
+    if neg_idx is not None and len(nX):
+        nX = nX[neg_idx[neg_idx < len(nX)]]
+    
+    empty = np.empty((0,0), dtype = pX.dtype)
+    X,y = empty,np.empty(0, dtype = int)
+    
+    if label == None:
+        X = np.concatenate([pX, nX]) if len(pX) and len(nX) else (pX if len(pX) else nX)
+        y = np.concatenate([np.ones(len(pX), dtype = int), -np.ones(len(nX), dtype = int)])
+        pX,nX = empty,empty
+        
+    return pX,nX,X,y
+
+_ZIP_HASHES = {}
+
+def _zip_hash(zip_data):
+    
+    '''
+    Description:
+        SHA-1 hash of zip file. Hash is computed once per file state (size
+        and modification time) in a session.
+    '''
     
+    stat = os.stat(zip_data)
+    key = (os.path.realpath(zip_data), stat.st_size, stat.st_mtime_ns)
+    if key not in _ZIP_HASHES:
+        h = hashlib.sha1()
+        with open(zip_data, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+        _ZIP_HASHES[key] = h.hexdigest()
+    return _ZIP_HASHES[key]
 
-def _classif_data_import(zip_data,pos_file,neg_file, label, pos_indices = None,neg_indices = None):
+def _cache_folder(zip_data):
+    
+    '''
+    Description:
+        Folder of binary cache of zip file. It is placed next to zip file as
+        <data_name>_cache/<zip hash>. Caches of older versions of zip file
+        are removed.
+    '''
+    
+    base = os.path.splitext(zip_data)[0] + '_cache'
+    folder = os.path.join(base, _zip_hash(zip_data)[:16])
+    if not os.path.isdir(folder):
+        if os.path.isdir(base):
+            for old in os.listdir(base):
+                shutil.rmtree(os.path.join(base, old), ignore_errors = True)
+        os.makedirs(folder, exist_ok = True)
+    return folder
+
+def _cached_array(zip_data, member, suffix, loader):
+    
+    '''
+    Description:
+        Load array of a member of zip file from binary cache. If it is not
+        cached, array is formed by loader and saved as .npy file first.
+        Returned array is always memory-mapped in read only mode, whether
+        the cache was just written or not.
+    Parameters:
+        zip_data: {string}, name of zip file
+        member: {string}, name of file in zip file
+        suffix: {string}, extra key of cached file such as dtype
+        loader: {callable}, function that returns array of member
+    '''
+    
+    path = _cache_path(zip_data, member, suffix)
+    if os.path.isfile(path):
+        return np.load(path, mmap_mode = 'r')
+
+    arr = loader()
+    tmp_path = path + '.' + str(os.getpid()) + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.save(f, arr)
+    os.replace(tmp_path, path)
+    return np.load(path, mmap_mode = 'r')
+
+def _cache_path(zip_data, member, suffix):
+
+    return os.path.join(_cache_folder(zip_data),
+                        os.path.splitext(member)[0].replace('/', '_') + '_' + suffix + '.npy')
+
+#fixed size of .npy headers written before shape of matrix is known
+_NPY_HEADER_SIZE = 128
+
+def _npy_header(dtype, shape):
+
+    '''
+    Description:
+        Header of version 1.0 .npy file padded to _NPY_HEADER_SIZE bytes,
+        so that a placeholder can be overwritten by the final header.
+    '''
+    header = repr({'descr':np.lib.format.dtype_to_descr(np.dtype(dtype)),
+                   'fortran_order':False, 'shape':shape})
+    header = header.ljust(_NPY_HEADER_SIZE - 11) + '\n'
+    return np.lib.format.magic(1, 0) + struct.pack('<H', len(header)) + header.encode('latin1')
+
+def _cached_blocks(zip_data, member, suffix, blocks):
+
+    '''
+    Description:
+        Load matrix of a member of zip file from binary cache as in
+        _cached_array. If it is not cached, its blocks of rows are written
+        to cache one by one, so whole matrix is never held in memory.
+        Returned matrix is always memory-mapped in read only mode.
+    Parameters:
+        zip_data: {string}, name of zip file
+        member: {string}, name of file in zip file
+        suffix: {string}, dtype of matrix
+        blocks: {callable}, function that returns an iterator of blocks of
+            rows of matrix such as _feature_blocks
+    '''
+
+    path = _cache_path(zip_data, member, suffix)
+    if os.path.isfile(path):
+        return np.load(path, mmap_mode = 'r')
+
+    tmp_path = path + '.' + str(os.getpid()) + '.tmp'
+    n_rows, n_cols = 0, None
+    try:
+        with open(tmp_path, 'wb') as f:
+            #shape is known after last block, its header replaces the placeholder
+            f.write(_npy_header(suffix, (0, 0)))
+            for block in blocks():
+                if n_cols is not None and block.shape[1] != n_cols:
+                    raise ValueError('Rows of feature file have different number of columns')
+                n_rows, n_cols = n_rows + len(block), block.shape[1]
+                f.write(np.ascontiguousarray(block, dtype = suffix).tobytes())
+            f.seek(0)
+            f.write(_npy_header(suffix, (n_rows, n_cols or 0)))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+    return np.load(path, mmap_mode = 'r')
+
+def _classif_split_import(zip_data, pos_file, neg_file, label, indices, dtype = 'float64',
+                          cache = False):
+    
+    '''
+    Description:
+        Load data from zip file and split it into partitions given by index
+        files. Each feature file is read and parsed once, partitions are
+        sliced from the parsed matrices.
+    Paramters:
+        zip_data: {string}, name of zip file
+        pos_file: {string}, name of positive data in zip file
+        neg_file: {string}, name of negative data in zip file
+        label: {None,'positive','negative','positive_negative'}, if 'negative',
+                only negative set is loaded, If 'positive', only positive set
+                is loaded.
+        indices: {list}, pairs of (pos_indices, neg_indices) names of index
+            files in zip file, one pair for each partition such as train,
+            test and validation. If a pair is None, all data is taken.
+        dtype: {'float32','float64'}, (default = 'float64'), type of feature
+            matrices
+        cache: {bool}, (default = False), If True, parsed matrices and
+            indices are stored as .npy files next to zip file and loaded
+            memory-mapped in later calls. Matrices are then read only
+            memory-mapped arrays.
+    Returns:
+        List of (pX,nX,X,y) for each partition. See _classif_data_import.
+    '''
+    
+    pX,nX,idx = _load_split_files(zip_data, pos_file, neg_file, label, indices, dtype, cache)
+    return [_form_sets(pX, nX, label, pos_idx, neg_idx) for pos_idx,neg_idx in idx]
+
+def _load_split_files(zip_data, pos_file, neg_file, label, indices, dtype, cache):
+    
+    '''
+    Description:
+        Load feature matrices and index files of _classif_split_import
+    '''
+    
+    empty = np.empty((0,0), dtype = dtype)
+    pX,nX = empty,empty
+    
+    with ZipFile(zip_data) as f:
+        
+        def features(member):
+            if not cache:
+                return _load_feature_matrix(f, member, dtype = dtype)
+            return _cached_array(zip_data, member, dtype,
+                                 lambda: _load_feature_matrix(f, member, dtype = dtype))
+        
+        def rows(member):
+            if not cache:
+                return _read_indices(f, member)
+            return _cached_array(zip_data, member, 'int', lambda: _read_indices(f, member))
+        
+        if label in ['positive', 'positive_negative', None]:
+            pX = features(pos_file)
+        if label in ['negative', 'positive_negative', None]:
+            nX = features(neg_file)
+        
+        idx = [(None,None) if pair is None else (rows(pair[0]),rows(pair[1]))
+               for pair in indices]
+    
+    return pX,nX,idx
+
+def _classif_split_rows(zip_data, pos_file, neg_file, indices, dtype = 'float64', cache = False):
+    
+    '''
+    Description:
+        Load data from zip file as _classif_split_import does for label =
+        None, but partitions are not formed. They are given as indices of
+        rows of positive matrix followed by rows of negative matrix, so
+        that they can be taken from the matrices at once (see Split).
+    Paramters:
+        zip_data, pos_file, neg_file, indices, dtype, cache: see
+            _classif_split_import
+    Returns:
+        pX: {numpy array}, positive feature matrix
+        nX: {numpy array}, negative feature matrix
+        parts: {list}, (rows, y) of each partition, rows are indices of
+            stacked pX and nX and y are their labels
+    '''
+    
+    pX,nX,idx = _load_split_files(zip_data, pos_file, neg_file, 'positive_negative', indices,
+                                  dtype, cache)
+    parts = []
+    for pos_idx,neg_idx in idx:
+        pos_idx = np.arange(len(pX)) if pos_idx is None else pos_idx[pos_idx < len(pX)]
+        neg_idx = np.arange(len(nX)) if neg_idx is None else neg_idx[neg_idx < len(nX)]
+        rows = np.concatenate([pos_idx, len(pX) + neg_idx])
+        y = np.concatenate([np.ones(len(pos_idx), dtype = int), -np.ones(len(neg_idx), dtype = int)])
+        parts.append((rows,y))
+    
+    return pX,nX,parts
+
+def _classif_data_import(zip_data,pos_file,neg_file, label, pos_indices = None,neg_indices = None,
+                         dtype = 'float64', cache = False):
     
     '''
     Description:
@@ -97,60 +729,188 @@ def _classif_data_import(zip_data,pos_file,neg_file, label, pos_indices = None,n
             otherwise data at pos_indices are loaded
         neg_indices: {set}, (default = None), If None, all negative data is loaded,
             otherwise negative data at neg_indices are loaded
-            
+        dtype: {'float32','float64'}, (default = 'float64'), type of feature
+            matrices
+        cache: {bool}, (default = False), If True, binary cache next to zip
+            file is used. See _classif_split_import.
+    Returns:
+        pX: {numpy array}, positive feature matrix, empty if label is not 'positive'
+        nX: {numpy array}, negative feature matrix, empty if label is not 'negative'
+        X: {numpy array}, feature matrix of both sets, empty if label is not None
+        y: {numpy array}, labels of X, 1 for positive and -1 for negative
     '''    
     
-    pX,nX,X,y = [],[],[],[]
+    pair = None
+    if pos_indices is not None and neg_indices is not None:
+        pair = (pos_indices, neg_indices)
     
+    return _classif_split_import(zip_data, pos_file, neg_file, label, [pair], dtype = dtype,
+                                 cache = cache)[0]
+
+def _count_rows(zf, member, chunk_size = 1 << 24):
+
+    '''
+    Description:
+        Number of non-empty lines of a file in zip file
+    '''
+
+    n, tail = 0, b''
+    with zf.open(member) as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            lines = (tail + chunk).split(b'\n')
+            tail = lines.pop()
+            n += sum(1 for line in lines if line.strip())
+    return n + bool(tail.strip())
+
+def _ratio_rows(n, ratio, part, random_state):
+
+    '''
+    Description:
+        Sorted rows of a part of random split of n rows formed by
+        split_indices. Parts are 'train' and 'test' if ratio is a float and
+        'validation' is added if it is a list [a,b].
+    '''
+
+    split = split_indices(n, ratio, random_state = random_state)
+    parts = {'train':split.train, 'test':split.test, 'validation':split.validation}
+    if parts.get(part) is None:
+        raise AttributeError(f'Part "{part}" is not formed by ratio = {ratio}')
+    return np.sort(parts[part])
+
+def _row_blocks(zf, member, dtype, X, rows, shuffle, block_size):
+
+    '''
+    Description:
+        Blocks of selected rows of a feature file. If X (memory-mapped
+        matrix) is given, rows are read from it, in random order if shuffle
+        is True. Otherwise file is parsed in order and rows are selected
+        from each parsed block.
+    '''
+
+    if X is not None:
+        rows = np.arange(len(X)) if rows is None else rows
+        if shuffle:
+            rows = np.random.permutation(rows)
+        for start in range(0, len(rows), block_size):
+            yield np.asarray(X[np.sort(rows[start:start + block_size])])
+        return
+
+    offset = 0
+    for block in _feature_blocks(zf, member, dtype = dtype):
+        n = len(block)
+        if rows is not None:
+            block = block[rows[(rows >= offset) & (rows < offset + n)] - offset]
+        offset += n
+        yield block
+
+class _RowTaker():
+
+    '''
+    Description:
+        Take consecutive rows from blocks of rows. Only one block and the
+        rows left from previous one are held.
+    '''
+
+    def __init__(self, blocks):
+        self.blocks = blocks
+        self.buffer = []
+        self.n = 0
+
+    def take(self, k):
+        while self.n < k:
+            block = next(self.blocks, None)
+            if block is None:
+                break
+            self.buffer.append(block)
+            self.n += len(block)
+        if not self.buffer:
+            return None
+        rows = np.concatenate(self.buffer) if len(self.buffer) > 1 else self.buffer[0]
+        self.buffer = [rows[k:]] if len(rows) > k else []
+        self.n = len(rows) - min(k, len(rows))
+        return rows[:k]
+
+def _classif_batch_import(zip_data, pos_file, neg_file, batch_size = 1024, indices = None,
+                          ratio = None, part = 'train', dtype = 'float64', cache = False,
+                          shuffle = True, random_state = 0):
+
+    '''
+    Description:
+        Load data from zip file as mini-batches. Memory used is bounded by
+        batch_size and chunk size of parsing rather than size of data.
+        Positive and negative rows are mixed into each batch in proportion
+        to their sizes.
+    Paramters:
+        zip_data: {string}, name of zip file
+        pos_file: {string}, name of positive data in zip file
+        neg_file: {string}, name of negative data in zip file
+        batch_size: {int}, (default = 1024), number of rows of a batch
+        indices: {tuple}, (default = None), names of positive and negative
+            index files in zip file. If None, all rows are taken.
+        ratio: {None, float, list}, (default = None), if given, rows (of
+            index files) are randomly split with respect to ratio as in
+            separator, separately for positive and negative sets, and rows
+            of part are taken.
+        part: {'train','test','validation'}, (default = 'train'), part of
+            split formed by ratio
+        dtype: {'float32','float64'}, (default = 'float64'), type of batches
+        cache: {bool}, (default = False), If True, feature files are written
+            to binary cache next to zip file block by block and batches are
+            read from memory-mapped matrices. Otherwise feature files are
+            parsed in each pass.
+        shuffle: {bool}, (default = True), If True, rows of each batch are
+            shuffled. With cache, order of all rows is shuffled.
+        random_state: {int}, (default = 0), seed of split by ratio. It
+            must be the same for all parts of a split.
+    Yields:
+        X: {numpy array}, feature matrix of at most batch_size rows
+        y: {numpy array}, labels of X, 1 for positive and -1 for negative
+    '''
+
     with ZipFile(zip_data) as f:
-        pf =  f.open(pos_file)
-        nf = f.open(neg_file)
-        
-        if pos_indices is not None and neg_indices is not None:
-	        pos_idx = set([int(i.decode('utf-8').strip('\n')) for i in f.open(pos_indices)])
-	        neg_idx = set([int(i.decode('utf-8').strip('\n')) for i in f.open(neg_indices)])
-	        for k,(rowx) in enumerate(pf):
-	            if k in pos_idx:
-	                rowx = re.split('\t',rowx.decode('utf-8').strip('\n'))
-	                rowx = list(np.array(rowx[1:],dtype = 'float64'))
-	                if label == 'positive':
-	                    pX.append(rowx)
-	                if label == None:
-	                    X.append(rowx)
-	                    y.append(1)
-	        for k,(rowx) in enumerate(nf):
-	            if k in neg_idx:
-	                rowx = re.split('\t',rowx.decode('utf-8').strip('\n'))
-	                rowx = list(np.array(rowx[1:],dtype = 'float64'))
-	                if label == 'negative':
-	                    nX.append(rowx)
-	                if label == None:
-	                    X.append(rowx)
-	                    y.append(-1)
-        else:
 
-            for rowx in pf:
-                rowx = re.split('\t',rowx.decode('utf-8').strip('\n'))
-                rowx = list(np.array(rowx[1:],dtype = 'float64'))
-                if label == 'positive':
-                    pX.append(rowx)
-                    
-                if label == None:
-                    X.append(rowx)
-                    y.append(1)
-            for rowx in nf:
-                rowx = re.split('\t',rowx.decode('utf-8').strip('\n'))
-                rowx = list(np.array(rowx[1:],dtype = 'float64'))
-                if label == 'negative':
-                    nX.append(rowx)
-                    
-                if label == None:
-                    X.append(rowx)
-                    y.append(-1)
-    pf.close()
-    nf.close()
-        
-    return pX,nX,X,y
+        sources, sizes = [], []
+        for k,member in enumerate([pos_file, neg_file]):
+
+            X, rows = None, None
+            if indices is not None:
+                rows = (_cached_array(zip_data, indices[k], 'int', lambda: _read_indices(f, indices[k]))
+                        if cache else _read_indices(f, indices[k]))
+            if cache:
+                X = _cached_blocks(zip_data, member, dtype,
+                                   lambda: _feature_blocks(f, member, dtype = dtype))
+                if rows is not None:
+                    rows = rows[rows < len(X)]
+
+            if rows is not None:
+                n = len(rows)
+            else:
+                n = len(X) if X is not None else _count_rows(f, member)
+            if ratio is not None:
+                selected = _ratio_rows(n, ratio, part, random_state)
+                rows = selected if rows is None else rows[selected]
+
+            sizes.append(len(rows) if rows is not None else n)
+            sources.append(_RowTaker(_row_blocks(f, member, dtype, X, rows, shuffle, batch_size)))
+
+        total, done = sum(sizes), 0
+        for stop in range(batch_size, total + batch_size, batch_size):
+            stop = min(stop, total)
+            n_pos = sizes[0]*stop//total - sizes[0]*done//total
+            pX = sources[0].take(n_pos)
+            nX = sources[1].take(stop - done - n_pos)
+            done = stop
+
+            blocks = [b for b in [pX, nX] if b is not None and len(b)]
+            if not blocks:
+                continue
+            X = np.concatenate(blocks)
+            y = np.concatenate([np.ones(0 if pX is None else len(pX), dtype = int),
+                                -np.ones(0 if nX is None else len(nX), dtype = int)])
+            if shuffle:
+                perm = np.random.permutation(len(y))
+                X,y = X[perm],y[perm]
+            yield X,y
 
 def self_data(file_name, delimiter, label, name):
         
@@ -274,7 +1034,7 @@ def _rgr_form_table(scores, size = None, score_path = 'score_path.csv'):
     f.write(f'\n')
     f.close()
 
-def multiform_table(score_dict, score_path):
+def multiform_table(score_dict, score_path, header = True, end_table = True):
     '''
     Description:
         Storing classification scoring metrics in .csv format for different
@@ -284,17 +1044,24 @@ def multiform_table(score_dict, score_path):
             different datasets
         score_path: {string}, (default = "score_path.csv"), a path where
             metrics are saved    
+        header: {bool}, (default = True), If True, column names are written
+            before scores. It is False when scores of a table are appended
+            dataset by dataset.
+        end_table: {bool}, (default = True), If True, table is closed with
+            an empty line after scores.
     '''
     func = 'w'
     if os.path.isfile(score_path):
-        print(f'File {score_path} already exists, Scores are append to old score path')
+        if header:
+            print(f'File {score_path} already exists, Scores are append to old score path')
         func = 'a'
         
     f = open(score_path, func)
     
     datasets = list(score_dict.keys())
-    columns = ['Dataset Name', 'Set'] + list(list(score_dict[datasets[0]].values())[0].keys())
-    f.write(f'{",".join(columns)}\n')
+    if header:
+        columns = ['Dataset Name', 'Set'] + list(list(score_dict[datasets[0]].values())[0].keys())
+        f.write(f'{",".join(columns)}\n')
     for data_name in datasets:
         
         f.write(f'{data_name}')
@@ -306,8 +1073,38 @@ def multiform_table(score_dict, score_path):
             f.write(f'{",".join(score)}\n')
         f.write(f'\n')
     
-    f.write(f'\n')
+    if end_table:
+        f.write(f'\n')
     f.close()
+
+def tidy_table(records, score_path, header = True):
+    '''
+    Description:
+        Storing scoring metrics in .csv format as a tidy table where each
+        record is a single row, e.g. one row for each dataset, model and set
+    Paramters:
+        records: {list}, dicts of row values. Keys of first record are
+            used as columns
+        score_path: {string}, a path where metrics are saved
+        header: {bool}, (default = True), If True, column names are written
+            before rows
+    '''
+    if not records:
+        return
+    
+    func = 'w'
+    if os.path.isfile(score_path):
+        if header:
+            print(f'File {score_path} already exists, Scores are append to old score path')
+        func = 'a'
+    
+    columns = list(records[0].keys())
+    with open(score_path, func) as f:
+        if header:
+            f.write(f'{",".join(columns)}\n')
+        for record in records:
+            row = np.array([record[col] for col in columns], dtype = str)
+            f.write(f'{",".join(row)}\n')
     
 
 
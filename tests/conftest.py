@@ -0,0 +1,109 @@
+import os
+import re
+import sys
+import random
+from importlib import import_module
+from zipfile import ZipFile
+import numpy as np
+import pytest
+
+from reference import IFEATURE_PATH
+
+#descriptors of iFeature/codes import each other as top level modules
+sys.path.append(os.path.join(IFEATURE_PATH, 'codes'))
+import readFasta
+
+SAMPLE_FASTA = os.path.join(os.path.dirname(os.path.dirname(IFEATURE_PATH)), 'input_folder', 'sample.fasta')
+AMINO_ACIDS = 'ACDEFGHIKLMNPQRSTVWY'
+
+
+def random_fastas(n, min_length, max_length, alphabet = AMINO_ACIDS + '-', seed = 0):
+    """random_fastas forms [name, sequence] records of random sequences.
+
+    Args:
+        n (int): number of records
+        min_length (int): smallest length of a sequence
+        max_length (int): largest length of a sequence
+        alphabet (str): residues of sequences, '-' is a gap
+        seed (int): seed of random sequences
+
+    Returns:
+        list: [name, sequence] records
+
+    """
+    rng = random.Random(seed)
+    return [['random_{}'.format(i), ''.join(rng.choice(alphabet) for _ in range(rng.randint(min_length, max_length)))]
+            for i in range(n)]
+
+
+def descriptor_pair(descriptor):
+    """descriptor_pair imports a descriptor of iFeature/codes and its frozen copy.
+
+    Args:
+        descriptor (str): name of the descriptor, which is also the name of
+            its module and function
+
+    Returns:
+        tuple: current and reference descriptor functions
+
+    """
+    return (getattr(import_module(descriptor), descriptor),
+            getattr(import_module('reference.' + descriptor), descriptor))
+
+
+def encoding_values(encodings):
+    """encoding_values drops the header and sequence names of encodings.
+
+    Args:
+        encodings (list): header and [name, values...] rows of a descriptor
+
+    Returns:
+        list: values of each row
+
+    """
+    return [code[1:] for code in encodings[1:]]
+
+
+@pytest.fixture(scope = 'session')
+def sample_fastas():
+    return readFasta.readFasta(SAMPLE_FASTA)
+
+
+@pytest.fixture(scope = 'session')
+def fastas(sample_fastas):
+    return sample_fastas + random_fastas(40, 31, 200)
+
+
+@pytest.fixture(scope = 'session')
+def sequences(fastas):
+    #batch APIs take sequences without gaps
+    return [re.sub('-', '', i[1]) for i in fastas]
+
+
+def feature_lines(X, names):
+    """feature_lines forms a tab separated feature file as in ProFAB zip files.
+
+    Args:
+        X (numpy array): feature matrix
+        names (list): protein id of each row
+
+    Returns:
+        str: lines of protein id followed by features
+
+    """
+    return ''.join(name + '\t' + '\t'.join(repr(v) for v in row) + '\n' for name, row in zip(names, X))
+
+
+@pytest.fixture
+def feature_zip(tmp_path):
+    #positive and negative feature files and index files of a dataset
+    rng = np.random.RandomState(0)
+    pX, nX = rng.randn(50, 7), rng.randn(80, 7)
+    path = str(tmp_path / 'data.zip')
+    with ZipFile(path, 'w') as f:
+        f.writestr('positive.txt', feature_lines(pX, ['P{}'.format(i) for i in range(len(pX))]))
+        #windows line endings are accepted as well
+        f.writestr('negative.txt', feature_lines(nX, ['N{}'.format(i) for i in range(len(nX))]).replace('\n', '\r\n'))
+        f.writestr('pos_idx.txt', '\n'.join(str(i) for i in [3, 1, 7, 3, 49]) + '\n')
+        f.writestr('neg_idx.txt', '\n'.join(str(i) for i in [0, 79, 5]))
+    return path, pX, nX
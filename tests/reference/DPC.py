@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+#_*_coding:utf-8_*_
+
+import re
+
+def DPC(fastas, **kw):
+	AA = kw['order'] if kw['order'] != None else 'ACDEFGHIKLMNPQRSTVWY'
+	encodings = []
+	diPeptides = [aa1 + aa2 for aa1 in AA for aa2 in AA]
+	header = ['#'] + diPeptides
+	encodings.append(header)
+
+	AADict = {}
+	for i in range(len(AA)):
+		AADict[AA[i]] = i
+
+	for i in fastas:
+		name, sequence = i[0], re.sub('-', '', i[1])
+		code = [name]
+		tmpCode = [0] * 400
+		for j in range(len(sequence) - 2 + 1):
+			tmpCode[AADict[sequence[j]] * 20 + AADict[sequence[j+1]]] = tmpCode[AADict[sequence[j]] * 20 + AADict[sequence[j+1]]] +1
+		if sum(tmpCode) != 0:
+			tmpCode = [i/sum(tmpCode) for i in tmpCode]
+		code = code + tmpCode
+		encodings.append(code)
+	return encodings
\ No newline at end of file
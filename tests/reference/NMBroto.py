@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+#_*_coding:utf-8_*_
+
+import sys, platform, os, re
+import argparse
+import numpy as np
+pPath = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(pPath)
+import checkFasta
+import readFasta
+import saveCode
+from reference import IFEATURE_PATH
+
+def NMBroto(fastas, props=['CIDH920105', 'BHAR880101', 'CHAM820101', 'CHAM820102',
+										 'CHOC760101', 'BIGC670101', 'CHAM810101', 'DAYM780201'],
+				nlag = 30, **kw):
+	if checkFasta.minSequenceLengthWithNormalAA(fastas) < nlag + 1:
+		print('Error: all the sequence length should be larger than the nlag+1: ' + str(nlag + 1) + '\n\n')
+		return 0
+
+	AA = 'ARNDCQEGHILKMFPSTWYV'
+	fileAAidx = IFEATURE_PATH + r'\data\AAidx.txt' if platform.system() == 'Windows' else IFEATURE_PATH + '/data/AAidx.txt'
+	with open(fileAAidx) as f:
+		records = f.readlines()[1:]
+	myDict = {}
+	for i in records:
+		array = i.rstrip().split('\t')
+		myDict[array[0]] = array[1:]
+
+	AAidx = []
+	AAidxName = []
+	for i in props:
+		if i in myDict:
+			AAidx.append(myDict[i])
+			AAidxName.append(i)
+		else:
+			print('"' + i + '" properties not exist.')
+			return None
+
+	AAidx1 = np.array([float(j) for i in AAidx for j in i])
+	AAidx = AAidx1.reshape((len(AAidx),20))
+	pstd = np.std(AAidx, axis=1)
+	pmean = np.average(AAidx, axis=1)
+
+	for i in range(len(AAidx)):
+		for j in range(len(AAidx[i])):
+			AAidx[i][j] = (AAidx[i][j] - pmean[i]) / pstd[i]
+
+	index = {}
+	for i in range(len(AA)):
+		index[AA[i]] = i
+
+	encodings = []
+	header = ['#']
+	for p in props:
+		for n in range(1, nlag + 1):
+			header.append(p + '.lag' + str(n))
+	encodings.append(header)
+
+	for i in fastas:
+		name, sequence = i[0], re.sub('-', '', i[1])
+		code = [name]
+		N = len(sequence)
+		for prop in range(len(props)):
+			for n in range(1, nlag + 1):
+				if len(sequence) > nlag:
+					# if key is '-', then the value is 0
+					rn = sum([AAidx[prop][index.get(sequence[j], 0)] * AAidx[prop][index.get(sequence[j + n], 0)] for j in range(len(sequence)-n)]) / (N - n)
+				else:
+					rn = 'NA'
+				code.append(rn)
+		encodings.append(code)
+	return encodings
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(usage="it's usage tip.",
+									 description="Moran descriptor")
+	parser.add_argument("--file", required=True, help="input fasta file")
+	parser.add_argument("--props", help="input fasta file")
+	parser.add_argument("--nlag", help="input fasta file")
+	parser.add_argument("--out", dest='outFile', help="the generated descriptor file")
+	args = parser.parse_args()
+
+	fastas = readFasta.readFasta(args.file)
+	props = args.props.split(':') if args.props != None else ['CIDH920105', 'BHAR880101', 'CHAM820101', 'CHAM820102',
+															  'CHOC760101', 'BIGC670101', 'CHAM810101', 'DAYM780201']
+	nlag = int(args.nlag) if args.nlag != None else 30
+	output = args.outFile if args.outFile != None else 'encoding.tsv'
+	encodings = NMBroto(fastas, props, nlag)
+	saveCode.savetsv(encodings, output)
\ No newline at end of file
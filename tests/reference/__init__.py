@@ -0,0 +1,10 @@
+"""
+Frozen copies of iFeature descriptors as they were before they were
+vectorized. Only their data paths are changed, so that they read the data
+files of the package. Current descriptors are compared with them.
+"""
+
+import os
+
+IFEATURE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__)))),
+                             'profab', 'utils', 'feature_extraction_module', 'iFeature', '')
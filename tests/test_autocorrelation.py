@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+import autocorrelation
+from conftest import descriptor_pair, encoding_values, random_fastas
+
+DESCRIPTORS = ['Moran', 'Geary', 'NMBroto']
+
+
+def assert_close_encodings(current, reference):
+    #lag sums are vectorized, so values differ from Python sums only by rounding
+    assert current[0] == reference[0]
+    assert [code[0] for code in current] == [code[0] for code in reference]
+    np.testing.assert_allclose(np.array(encoding_values(current)),
+                               np.array(encoding_values(reference)), rtol = 1e-10, atol = 1e-12)
+
+
+@pytest.mark.parametrize('descriptor', DESCRIPTORS)
+@pytest.mark.parametrize('nlag', [1, 5, 30])
+def test_autocorrelations_match_reference(descriptor, nlag, fastas):
+    current, reference = descriptor_pair(descriptor)
+    assert_close_encodings(current(fastas, nlag = nlag), reference(fastas, nlag = nlag))
+
+
+@pytest.mark.parametrize('descriptor', DESCRIPTORS)
+def test_fft_lag_products_match_reference(descriptor):
+    fastas = random_fastas(2, autocorrelation.FFT_LENGTH + 1, autocorrelation.FFT_LENGTH + 300, seed = 1)
+    current, reference = descriptor_pair(descriptor)
+    assert_close_encodings(current(fastas), reference(fastas))
+
+
+def test_one_pass_equals_each_descriptor(fastas):
+    encodings = autocorrelation.autocorrelationEncodings(fastas)
+    for descriptor in DESCRIPTORS:
+        assert encodings[descriptor] == descriptor_pair(descriptor)[0](fastas)
+
+
+def test_short_sequences_and_unknown_properties(fastas):
+    assert autocorrelation.autocorrelationEncodings(fastas + [['short', 'ACDE']]) == dict.fromkeys(DESCRIPTORS, 0)
+    assert autocorrelation.autocorrelationEncodings(fastas, props = ['UNKNOWN']) == dict.fromkeys(DESCRIPTORS, None)
@@ -0,0 +1,52 @@
+import os
+from zipfile import ZipFile
+import numpy as np
+import pytest
+
+from profab.utils import imp_split_form
+
+
+def cached_sets(path, label = 'positive_negative'):
+    return imp_split_form._classif_data_import(path, 'positive.txt', 'negative.txt', label,
+                                               'pos_idx.txt', 'neg_idx.txt', cache = True)
+
+
+def test_cache_is_off_by_default(feature_zip):
+    path, pX, nX = feature_zip
+    imp_split_form._classif_data_import(path, 'positive.txt', 'negative.txt', None)
+    assert not os.path.exists(os.path.splitext(path)[0] + '_cache')
+
+
+def test_cached_sets_equal_parsed_sets(feature_zip):
+    path, pX, nX = feature_zip
+    parsed = imp_split_form._classif_data_import(path, 'positive.txt', 'negative.txt', 'positive_negative',
+                                                 'pos_idx.txt', 'neg_idx.txt')
+    for cached in [cached_sets(path), cached_sets(path)]:
+        for a, b in zip(cached, parsed):
+            assert np.array_equal(a, b)
+
+
+def test_miss_and_hit_return_read_only_memmaps(feature_zip):
+    path, pX, nX = feature_zip
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return pX
+
+    arrays = [imp_split_form._cached_array(path, 'positive.txt', 'float64', loader) for _ in range(2)]
+    assert len(calls) == 1
+    for X in arrays:
+        assert isinstance(X, np.memmap)
+        assert not X.flags.writeable
+        assert np.array_equal(X, pX)
+
+
+def test_changed_zip_invalidates_cache(feature_zip):
+    path, pX, nX = feature_zip
+    cached_sets(path)
+    with ZipFile(path, 'a') as f:
+        f.writestr('other.txt', 'changed')
+    os.utime(path, ns = (0, 0))
+    assert np.array_equal(cached_sets(path)[0], pX[[1, 3, 7, 49]])
+    assert len(os.listdir(os.path.splitext(path)[0] + '_cache')) == 1
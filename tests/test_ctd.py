@@ -0,0 +1,27 @@
+import pytest
+
+import CTD
+from conftest import descriptor_pair, encoding_values, random_fastas
+
+DESCRIPTORS = ['CTDC', 'CTDT', 'CTDD']
+
+
+@pytest.fixture(scope = 'module')
+def ctd_fastas(fastas):
+    #short sequences of few residues leave some groups without residues
+    return fastas + random_fastas(30, 2, 20, alphabet = 'KRDE', seed = 1) + [['unknown', 'AXBKZ-R']]
+
+
+@pytest.mark.parametrize('descriptor', DESCRIPTORS)
+def test_ctd_equals_reference(descriptor, ctd_fastas):
+    current, reference = descriptor_pair(descriptor)
+    assert current(ctd_fastas) == reference(ctd_fastas)
+
+
+def test_batch_shares_one_pass(ctd_fastas):
+    matrices = CTD.CTDMatrices([sequence.replace('-', '') for name, sequence in ctd_fastas])
+    encodings = CTD.CTDEncodings(ctd_fastas)
+    for descriptor in DESCRIPTORS:
+        reference = descriptor_pair(descriptor)[1](ctd_fastas)
+        assert matrices[descriptor].tolist() == encoding_values(reference)
+        assert encodings[descriptor] == reference
@@ -0,0 +1,113 @@
+import os
+import io
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from zipfile import ZipFile
+import numpy as np
+import pytest
+
+from profab.utils import imp_split_form
+
+
+class DataHandler(BaseHTTPRequestHandler):
+
+    #stand-in of the dataset server, its behaviour is set on the server object
+
+    def log_message(self, *args):
+        pass
+
+    def send_data(self, body):
+        server = self.server
+        start = 0
+        ranged = self.headers.get('Range')
+        if ranged and server.honor_range:
+            start = int(ranged.split('=')[1].rstrip('-'))
+            self.send_response(206)
+            self.send_header('Content-Range', 'bytes {}-{}/{}'.format(start, len(server.data) - 1, len(server.data)))
+        else:
+            self.send_response(200)
+        self.send_header('Content-Length', str(len(server.data) - start))
+        self.send_header('Accept-Ranges', 'bytes')
+        self.end_headers()
+        if body:
+            server.ranges.append(start)
+            stop = len(server.data)
+            if server.truncate:
+                #connection is dropped after truncate bytes of the first transfers
+                stop = min(stop, start + server.truncate.pop(0))
+            self.wfile.write(server.data[start:stop])
+            self.wfile.flush()
+            self.close_connection = True
+
+    def do_HEAD(self):
+        self.send_data(False)
+
+    def do_GET(self):
+        self.send_data(True)
+
+
+@pytest.fixture
+def server():
+    data = io.BytesIO()
+    with ZipFile(data, 'w') as f:
+        f.writestr('positive.txt', np.random.RandomState(0).bytes(300000).hex())
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), DataHandler)
+    httpd.data, httpd.honor_range, httpd.truncate, httpd.ranges = data.getvalue(), True, [], []
+    thread = threading.Thread(target = httpd.serve_forever, daemon = True)
+    thread.start()
+    httpd.url = 'http://127.0.0.1:{}/data.zip'.format(httpd.server_address[1])
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def download(server, path, **kwargs):
+    imp_split_form.download_data(server.url, str(path), progress = False, **kwargs)
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def test_download_is_verified_by_checksum(server, tmp_path):
+    checksum = 'sha256:' + hashlib.sha256(server.data).hexdigest()
+    assert download(server, tmp_path / 'data.zip', checksum = checksum) == server.data
+    assert not os.path.exists(str(tmp_path / 'data.zip.part'))
+
+
+def test_truncated_transfer_is_resumed(server, tmp_path):
+    server.truncate = [100000, 50000]
+    assert download(server, tmp_path / 'data.zip') == server.data
+    #bytes of a chunk cut by the dropped connection are fetched again
+    assert len(server.ranges) == 3 and server.ranges[0] == 0
+    assert 0 < server.ranges[1] <= 100000 and server.ranges[1] <= server.ranges[2] <= server.ranges[1] + 50000
+
+
+def test_partial_file_of_earlier_run_is_resumed(server, tmp_path):
+    with open(str(tmp_path / 'data.zip.part'), 'wb') as f:
+        f.write(server.data[:123456])
+    assert download(server, tmp_path / 'data.zip') == server.data
+    assert server.ranges == [123456]
+
+
+def test_server_ignoring_range_restarts(server, tmp_path):
+    server.honor_range = False
+    with open(str(tmp_path / 'data.zip.part'), 'wb') as f:
+        f.write(b'x'*123456)
+    assert download(server, tmp_path / 'data.zip') == server.data
+    assert server.ranges == [0]
+
+
+def test_checksum_mismatch_removes_partial_file(server, tmp_path):
+    with pytest.raises(IOError, match = 'Checksum'):
+        download(server, tmp_path / 'data.zip', checksum = 'sha256:' + '0'*64)
+    assert os.listdir(str(tmp_path)) == []
+
+
+def test_corrupted_zip_removes_partial_file(server, tmp_path):
+    #without checksum, CRC values of zip members are checked
+    with open(str(tmp_path / 'data.zip.part'), 'wb') as f:
+        f.write(server.data[:1000] + b'x'*1000)
+    server.data = server.data[:1000] + b'x'*1000 + server.data[2000:]
+    with pytest.raises(IOError):
+        download(server, tmp_path / 'data.zip')
+    assert os.listdir(str(tmp_path)) == []
@@ -0,0 +1,87 @@
+import os
+import numpy as np
+import pytest
+
+import easy_profab
+from profab.model_evaluate import ResultStore
+
+USER_KWARGS = dict(delimiter = '\t', name = False, label = False)
+FASTA_KWARGS = dict(place_protein_id = 1, max_len = -1, similarity_threshold = 0.3)
+
+
+@pytest.fixture
+def user_datasets(tmp_path):
+    #folders of positive and negative feature files as given with --isUser
+    rng = np.random.RandomState(0)
+    names = []
+    for k in range(3):
+        folder = tmp_path / 'data_{}'.format(k)
+        folder.mkdir()
+        np.savetxt(str(folder / 'positive.txt'), rng.rand(40, 5) + 0.1*k, delimiter = '\t')
+        np.savetxt(str(folder / 'negative.txt'), rng.rand(40, 5), delimiter = '\t')
+        names.append(str(folder))
+    return names
+
+
+def benchmark(tmp_path, data_names, name, **kwargs):
+    file_name = str(tmp_path / (name + '.txt'))
+    with open(file_name, 'w') as f:
+        f.write('\n'.join(data_names) + '\n')
+    kwargs = dict(dict(isUser = True, isFasta = False, ml_type = 'logistic_reg', scale_type = 'standard',
+                       score_path = str(tmp_path / (name + '.csv')), model_path = None, ratio = 0.2,
+                       protein_feature = 'paac', pre_determined = False, set_type = 'random', prefetch = 0,
+                       workers = 1, results_store = str(tmp_path / (name + '.jsonl')), search = 'random',
+                       cv_budget = None, fit_cache = None, seed = 3), **kwargs)
+    easy_profab.loop_trough(file_name, kwargs, USER_KWARGS, FASTA_KWARGS)
+    return ResultStore(kwargs['results_store'])
+
+
+def test_workers_give_scores_of_sequential_run(tmp_path, user_datasets):
+    sequential = benchmark(tmp_path, user_datasets, 'sequential')
+    parallel = benchmark(tmp_path, user_datasets, 'parallel', workers = 2)
+    assert len(sequential) == len(parallel) == len(user_datasets)
+    assert parallel.results == sequential.results
+
+
+def test_prefetch_gives_scores_of_sequential_run(tmp_path, user_datasets):
+    sequential = benchmark(tmp_path, user_datasets, 'sequential')
+    prefetched = benchmark(tmp_path, user_datasets, 'prefetched', prefetch = 2)
+    assert prefetched.results == sequential.results
+
+
+def test_failed_dataset_does_not_stop_workers(tmp_path, user_datasets):
+    store = benchmark(tmp_path, user_datasets[:1] + [str(tmp_path / 'missing')] + user_datasets[1:],
+                      'failed', workers = 2)
+    assert sorted(key[0] for key in store.results) == sorted(user_datasets)
+    assert os.path.isfile(str(tmp_path / 'failed.csv'))
+
+
+def test_stored_datasets_are_not_run_again(tmp_path, user_datasets):
+    store = benchmark(tmp_path, user_datasets[:2], 'resumed')
+    with open(store.path) as f:
+        n_lines = len(f.readlines())
+    resumed = benchmark(tmp_path, user_datasets, 'resumed')
+    with open(store.path) as f:
+        assert len(f.readlines()) == n_lines + 1
+    assert {key: resumed.results[key] for key in store.results} == store.results
+    #another seed is another run
+    assert len(benchmark(tmp_path, user_datasets[:1], 'resumed', seed = 4)) == 4
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_matrix_cells_equal_single_runs(tmp_path, user_datasets, workers):
+    axes = dict(ml_type = ['logistic_reg', 'ridge_class'], scale_type = ['standard', 'min_max'])
+    matrix = benchmark(tmp_path, user_datasets[:1], 'matrix', workers = workers, **axes)
+    assert len(matrix) == 4
+    for ml_type in axes['ml_type']:
+        for scale_type in axes['scale_type']:
+            single = benchmark(tmp_path, user_datasets[:1], 'single', ml_type = ml_type, scale_type = scale_type)
+            for key, scores in single.results.items():
+                assert matrix.get(key) == scores
+    #one row for each dataset, protein feature, scale type, ml type and set
+    with open(str(tmp_path / 'matrix.csv')) as f:
+        assert len([line for line in f if line.strip()]) == 1 + 4*2
+    #stored cells are not trained again
+    benchmark(tmp_path, user_datasets[:1], 'matrix', **axes)
+    with open(matrix.path) as f:
+        assert len(f.readlines()) == 4
@@ -0,0 +1,94 @@
+from zipfile import ZipFile
+import numpy as np
+import pytest
+
+from profab.utils import imp_split_form
+
+
+@pytest.mark.parametrize('chunk_size', [64, 1000, 1 << 24])
+def test_bulk_parse_equals_rows(feature_zip, chunk_size):
+    path, pX, nX = feature_zip
+    with ZipFile(path) as f:
+        assert np.array_equal(imp_split_form._load_feature_matrix(f, 'positive.txt', chunk_size = chunk_size), pX)
+        assert np.array_equal(imp_split_form._load_feature_matrix(f, 'negative.txt', chunk_size = chunk_size), nX)
+        assert imp_split_form._load_feature_matrix(f, 'negative.txt', 'float32').dtype == np.float32
+
+
+def test_indices_select_rows(feature_zip):
+    path, pX, nX = feature_zip
+    sets = imp_split_form._classif_data_import(path, 'positive.txt', 'negative.txt', 'positive_negative',
+                                               'pos_idx.txt', 'neg_idx.txt')
+    assert np.array_equal(sets[0], pX[[1, 3, 7, 49]])
+    assert np.array_equal(sets[1], nX[[0, 5, 79]])
+    _, _, X, y = imp_split_form._classif_data_import(path, 'positive.txt', 'negative.txt', None)
+    assert np.array_equal(X, np.concatenate([pX, nX]))
+    assert y.tolist() == [1]*len(pX) + [-1]*len(nX)
+
+
+@pytest.mark.parametrize('bad_row', ['P9\t1.0\tx\t3.0\n', 'P9\t1.0\t\t3.0\n', 'P9\t1.0\t2.0\n',
+                                     'P9\t1.0\t2.0\t3.0\t4.0\n', 'P9\n'])
+@pytest.mark.parametrize('position', [0, 1, 2])
+def test_malformed_rows_raise(tmp_path, bad_row, position):
+    rows = ['P{}\t1.0\t2.0\t3.0\n'.format(i) for i in range(3)]
+    rows[position] = bad_row
+    path = str(tmp_path / 'data.zip')
+    with ZipFile(path, 'w') as f:
+        f.writestr('positive.txt', ''.join(rows))
+    with ZipFile(path) as f:
+        with pytest.raises(ValueError, match = 'positive.txt'):
+            imp_split_form._load_feature_matrix(f, 'positive.txt')
+
+
+def test_malformed_indices_raise(tmp_path):
+    path = str(tmp_path / 'data.zip')
+    with ZipFile(path, 'w') as f:
+        f.writestr('pos_idx.txt', '1\n2\nthree\n4\n5\n6\n')
+    with ZipFile(path) as f:
+        with pytest.raises(ValueError, match = 'pos_idx.txt'):
+            imp_split_form._read_indices(f, 'pos_idx.txt')
+
+
+def baseline_rows(path, member, indices = None):
+    #rows of a feature file read line by line as _classif_data_import did before bulk parsing
+    with ZipFile(path) as f:
+        if indices is not None:
+            indices = set(int(i.decode('utf-8').strip('\n')) for i in f.open(indices))
+        rows = [line.decode('utf-8').strip('\r\n').split('\t')[1:] for line in f.open(member)]
+    return np.array([row for k, row in enumerate(rows) if indices is None or k in indices], dtype = 'float64')
+
+
+@pytest.fixture
+def split_zip(feature_zip):
+    path, pX, nX = feature_zip
+    rng = np.random.RandomState(1)
+    with ZipFile(path, 'a') as f:
+        for part in ['train', 'test', 'validation']:
+            f.writestr(part + '_pos.txt', '\n'.join(str(i) for i in rng.choice(len(pX), 20)) + '\n')
+            f.writestr(part + '_neg.txt', '\n'.join(str(i) for i in rng.choice(len(nX), 30)) + '\n')
+    return path, [(part + '_pos.txt', part + '_neg.txt') for part in ['train', 'test', 'validation']] + [None]
+
+
+@pytest.mark.parametrize('label', [None, 'positive', 'negative', 'positive_negative'])
+def test_split_import_equals_loading_each_partition(split_zip, label):
+    path, indices = split_zip
+    sets = imp_split_form._classif_split_import(path, 'positive.txt', 'negative.txt', label, indices)
+    assert len(sets) == len(indices)
+    for (pX, nX, X, y), pair in zip(sets, indices):
+        pos = baseline_rows(path, 'positive.txt', None if pair is None else pair[0])
+        neg = baseline_rows(path, 'negative.txt', None if pair is None else pair[1])
+        if label is None:
+            assert np.array_equal(X, np.concatenate([pos, neg]))
+            assert y.tolist() == [1]*len(pos) + [-1]*len(neg)
+        if label in ['positive', 'positive_negative']:
+            assert np.array_equal(pX, pos)
+        if label in ['negative', 'positive_negative']:
+            assert np.array_equal(nX, neg)
+
+
+def test_split_rows_index_stacked_matrices(split_zip):
+    path, indices = split_zip
+    sets = imp_split_form._classif_split_import(path, 'positive.txt', 'negative.txt', None, indices)
+    pX, nX, parts = imp_split_form._classif_split_rows(path, 'positive.txt', 'negative.txt', indices)
+    for (_, _, X, y), (rows, part_y) in zip(sets, parts):
+        assert np.array_equal(imp_split_form._take_stacked([pX, nX], rows), X)
+        assert np.array_equal(part_y, y)
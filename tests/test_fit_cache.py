@@ -0,0 +1,68 @@
+import os
+import json
+import numpy as np
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import StratifiedKFold
+
+from profab.model_learn.fit_cache import FitCache
+from profab.model_learn.search import search_cv
+
+PARAMETERS = dict(C = [0.01, 0.1, 1.0, 10.0], class_weight = [None, 'balanced'])
+
+
+def keys(n):
+    return [FitCache.key('data', LogisticRegression(), dict(C = float(i)), 'f1') for i in range(n)]
+
+
+def test_failed_fits_are_not_cached(tmp_path):
+    cache = FitCache(str(tmp_path))
+    key, failed = keys(2)
+    cache.put(key, 0.5)
+    cache.put(failed, np.nan)
+    assert cache.get(key) == 0.5
+    assert cache.get(failed) is None
+    #caches of earlier versions kept failed fits as null scores
+    os.makedirs(os.path.dirname(cache._file(failed, '.json')), exist_ok = True)
+    with open(cache._file(failed, '.json'), 'w') as f:
+        json.dump({'score': None}, f)
+    assert cache.get(failed) is None
+
+
+def test_full_cache_is_reduced_to_low_water(tmp_path):
+    cache = FitCache(str(tmp_path), max_size = 1000)
+    scans = []
+    files = cache._files
+    cache._files = lambda: scans.append(1) or files()
+    all_keys = keys(200)
+    for i, key in enumerate(all_keys):
+        cache.put(key, 0.5)
+        #recently read entries are kept
+        assert cache.get(all_keys[0]) == 0.5
+        assert cache.size <= cache.max_size
+    assert cache.size == sum(os.path.getsize(f) for f in files())
+    #each scan removes about a tenth of the cache, so it is not repeated at each insert
+    assert 0 < len(scans) <= 200 // 5
+    assert [key for key in all_keys if cache.get(key) is not None][-3:] == all_keys[-3:]
+
+
+def test_repeated_search_uses_cache(tmp_path):
+    X, y = make_classification(n_samples = 200, random_state = 0)
+    cv = StratifiedKFold(n_splits = 4, shuffle = True, random_state = 0)
+    searches = [search_cv(LogisticRegression(solver = 'liblinear'), PARAMETERS, cv, 'f1', n_iter = 5,
+                          random_state = 0, fit_cache = FitCache(str(tmp_path))).fit(X, y) for _ in range(2)]
+    assert searches[0].n_fits_ == 5*4 and searches[1].n_fits_ == 0
+    assert searches[0].cv_results_ == searches[1].cv_results_
+
+
+def test_failed_fits_are_fitted_again(tmp_path):
+    X, y = make_classification(n_samples = 200, random_state = 0)
+    cv = StratifiedKFold(n_splits = 4, shuffle = True, random_state = 0)
+    #liblinear does not fit l1 penalty with dual formulation, these candidates fail
+    parameters = dict(PARAMETERS, dual = [True], penalty = ['l1', 'l2'])
+    searches = [search_cv(LogisticRegression(solver = 'liblinear'), parameters, cv, 'f1', n_iter = 6,
+                          random_state = 0, fit_cache = FitCache(str(tmp_path))).fit(X, y) for _ in range(2)]
+    n_failed = sum(4 for score in searches[0].cv_results_['mean_test_score'] if np.isnan(score))
+    assert 0 < n_failed < 6*4
+    assert searches[1].n_fits_ == n_failed
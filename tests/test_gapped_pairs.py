@@ -0,0 +1,26 @@
+import pytest
+
+import kmerCount
+from conftest import AMINO_ACIDS, descriptor_pair, random_fastas
+
+ORDER = 'ACDEFGHIKLMNPQRSTVWY'
+
+
+@pytest.mark.parametrize('descriptor', ['CKSAAP', 'CKSAAGP'])
+@pytest.mark.parametrize('gap', [0, 3, 5])
+def test_gapped_pair_descriptors_equal_reference(descriptor, gap, fastas):
+    current, reference = descriptor_pair(descriptor)
+    assert current(fastas, gap, order = ORDER) == reference(fastas, gap, order = ORDER)
+
+
+def test_gapped_pair_counts_do_not_cross_sequences():
+    sequences = [sequence for name, sequence in random_fastas(15, 0, 40, alphabet = AMINO_ACIDS + 'X')]
+    gap = 4
+    counts = kmerCount.gappedPairCounts(sequences, gap, AMINO_ACIDS, batchSize = 4)
+    for sequence, row in zip(sequences, counts):
+        for g in range(gap + 1):
+            pairs = [(sequence[i], sequence[i + g + 1]) for i in range(len(sequence) - g - 1)]
+            pairs = [pair for pair in pairs if 'X' not in pair]
+            assert row[g].sum() == len(pairs)
+            for first, second in set(pairs):
+                assert row[g][AMINO_ACIDS.index(first) * 20 + AMINO_ACIDS.index(second)] == pairs.count((first, second))
@@ -0,0 +1,61 @@
+import os
+import sys
+import subprocess
+import numpy as np
+import pytest
+
+from profab.utils.feature_extraction_module import ifeature_engine
+from profab.utils.feature_extraction_module.ifeature_engine import (IFEATURE_DESCRIPTORS, encode_iFeature,
+                                                                    extract_iFeature_matrix, read_iFeature_fasta)
+
+from reference import IFEATURE_PATH
+
+FASTA = os.path.join(os.path.dirname(os.path.dirname(IFEATURE_PATH)), 'input_folder', 'random_positive.fasta')
+
+
+def script_output(descriptor, tmp_path):
+    #tsv written by iFeature.py, which was run for each descriptor before the engine
+    out = str(tmp_path / (descriptor + '.tsv'))
+    subprocess.run([sys.executable, os.path.join(IFEATURE_PATH, 'iFeature.py'), '--file', FASTA,
+                    '--type', descriptor, '--out', out], check = True, stdout = subprocess.DEVNULL)
+    with open(out) as f:
+        rows = [line.rstrip('\n').split('\t') for line in f]
+    return rows[0][1:], [row[0] for row in rows[1:]], np.array([row[1:] for row in rows[1:]], dtype = float)
+
+
+@pytest.fixture(scope = 'module')
+def encoded():
+    #all descriptors in one pass, records are split into shards of worker processes
+    return dict(zip(IFEATURE_DESCRIPTORS, encode_iFeature(read_iFeature_fasta(FASTA), IFEATURE_DESCRIPTORS,
+                                                          n_jobs = 3)))
+
+
+@pytest.mark.parametrize('descriptor', IFEATURE_DESCRIPTORS)
+def test_engine_equals_iFeature_script(encoded, descriptor, tmp_path):
+    columns, names, matrix = script_output(descriptor, tmp_path)
+    assert encoded[descriptor][0] == columns
+    assert np.array_equal(encoded[descriptor][1], matrix)
+    assert [name for name, _ in read_iFeature_fasta(FASTA)] == names
+
+
+def test_shared_passes_equal_single_descriptors(encoded):
+    fastas = read_iFeature_fasta(FASTA)
+    for descriptor in ['Moran', 'QSOrder', 'CTDT', 'AAC']:
+        (columns, matrix), = encode_iFeature(fastas, [descriptor], n_jobs = 1)
+        assert columns == encoded[descriptor][0]
+        assert np.array_equal(matrix, encoded[descriptor][1])
+
+
+def test_matrix_stacks_descriptors_in_given_order(encoded):
+    X, protein_ids = extract_iFeature_matrix(FASTA, ['CTDC', 'AAC'], n_jobs = 2)
+    assert np.array_equal(X, np.hstack([encoded['CTDC'][1], encoded['AAC'][1]]))
+    assert protein_ids == [name.split('|')[1] for name, _ in read_iFeature_fasta(FASTA)]
+    assert np.array_equal(extract_iFeature_matrix(FASTA, 'AAC', n_jobs = 1)[0], encoded['AAC'][1])
+
+
+def test_descriptor_errors():
+    with pytest.raises(AttributeError):
+        encode_iFeature(read_iFeature_fasta(FASTA), ['AAC', 'PSSM'])
+    #nlag of Moran is longer than the sequences
+    with pytest.raises(ValueError, match = 'Moran'):
+        ifeature_engine._encode_records([['short', 'ACDEFG']], ['Moran'])
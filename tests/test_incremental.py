@@ -0,0 +1,103 @@
+import os
+import numpy as np
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.naive_bayes import GaussianNB
+
+from profab.model_learn import incremental_methods
+from profab.utils import imp_split_form
+
+
+def batch_sets(path, **kwargs):
+    batches = list(imp_split_form._classif_batch_import(path, 'positive.txt', 'negative.txt', **kwargs))
+    X, y = np.concatenate([X for X, _ in batches]), np.concatenate([y for _, y in batches])
+    return batches, X[y == 1], X[y == -1]
+
+
+def sorted_rows(X):
+    return X[np.lexsort(X.T[::-1])]
+
+
+def test_cached_blocks_are_streamed_into_npy(feature_zip):
+    path, pX, nX = feature_zip
+    blocks = lambda: iter([pX[:20], pX[20:21], pX[21:]])
+    X = imp_split_form._cached_blocks(path, 'positive.txt', 'float32', blocks)
+    assert isinstance(X, np.memmap) and not X.flags.writeable
+    assert X.dtype == np.float32 and np.array_equal(X, pX.astype('float32'))
+    #only the .npy file is left in cache folder
+    folder = imp_split_form._cache_folder(path)
+    assert os.listdir(folder) == [os.path.basename(imp_split_form._cache_path(path, 'positive.txt', 'float32'))]
+    #headers of all shapes have the size of the placeholder
+    assert len(imp_split_form._npy_header('float64', (2**63 - 1, 2**63 - 1))) == imp_split_form._NPY_HEADER_SIZE
+
+
+def test_failed_cache_leaves_no_file(feature_zip):
+    path, pX, nX = feature_zip
+    with pytest.raises(ValueError):
+        imp_split_form._cached_blocks(path, 'positive.txt', 'float64', lambda: iter([pX[:10], pX[10:, :3]]))
+    assert os.listdir(imp_split_form._cache_folder(path)) == []
+
+
+@pytest.mark.parametrize('cache', [False, True])
+@pytest.mark.parametrize('shuffle', [False, True])
+def test_batches_cover_selected_rows(feature_zip, cache, shuffle):
+    path, pX, nX = feature_zip
+    sets = imp_split_form._classif_data_import(path, 'positive.txt', 'negative.txt', 'positive_negative',
+                                               'pos_idx.txt', 'neg_idx.txt')
+    for indices, expected in [(None, (pX, nX)), (('pos_idx.txt', 'neg_idx.txt'), sets)]:
+        batches, pos, neg = batch_sets(path, batch_size = 16, indices = indices, cache = cache, shuffle = shuffle)
+        assert all(len(y) <= 16 for _, y in batches)
+        assert np.array_equal(sorted_rows(pos), sorted_rows(expected[0]))
+        assert np.array_equal(sorted_rows(neg), sorted_rows(expected[1]))
+        if not shuffle:
+            assert np.array_equal(pos, expected[0]) and np.array_equal(neg, expected[1])
+
+
+def test_batches_mix_classes_in_proportion(feature_zip):
+    path, pX, nX = feature_zip
+    for _, y in batch_sets(path, batch_size = 26)[0]:
+        #50 positive and 80 negative rows
+        assert abs((y == 1).sum() - 10) <= 1
+
+
+def test_ratio_parts_are_disjoint(feature_zip):
+    path, pX, nX = feature_zip
+    parts = [batch_sets(path, ratio = [0.2, 0.1], part = part, random_state = 3)
+             for part in ['train', 'test', 'validation']]
+    assert [len(pos) for _, pos, _ in parts] == [35, 10, 5]
+    assert [len(neg) for _, _, neg in parts] == [56, 16, 8]
+    assert np.array_equal(sorted_rows(np.concatenate([pos for _, pos, _ in parts])), sorted_rows(pX))
+    assert np.array_equal(sorted_rows(np.concatenate([neg for _, _, neg in parts])), sorted_rows(nX))
+
+
+@pytest.fixture(scope = 'module')
+def batches():
+    X, y = make_classification(n_samples = 600, n_features = 10, class_sep = 2.0, random_state = 0)
+    y = np.where(y == 1, 1, -1)
+    return [(X[i:i + 64], y[i:i + 64]) for i in range(0, 500, 64)], (X[500:], y[500:])
+
+
+@pytest.mark.parametrize('ml_type', ['SGD_logistic', 'SGD_hinge', 'gaussian_NB', 'MLP'])
+def test_incremental_models_learn(batches, ml_type):
+    train, (X, y) = batches
+    parameters = dict(max_iter = 50) if ml_type == 'MLP' else None
+    model = incremental_methods(train, ml_type, parameters = parameters)
+    assert model.score(X, y) > 0.85
+
+
+def test_naive_bayes_equals_fit_on_whole_data(batches):
+    train, (X, y) = batches
+    model = incremental_methods(lambda: iter(train), 'gaussian_NB', scale_type = None)
+    whole = GaussianNB().fit(np.concatenate([b[0] for b in train]), np.concatenate([b[1] for b in train]))
+    assert np.allclose(model.predict_proba(X), whole.predict_proba(X))
+
+
+def test_incremental_checks_arguments(batches, tmp_path):
+    train, _ = batches
+    with pytest.raises(AttributeError):
+        incremental_methods(iter(train))
+    with pytest.raises(AttributeError):
+        incremental_methods(train, 'multinomial_NB', scale_type = 'standard')
+    path = str(tmp_path / 'model.txt')
+    incremental_methods(train, path = path)
+    assert os.path.isfile(path)
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.metrics.pairwise import pairwise_kernels
+from sklearn.model_selection import StratifiedKFold
+from sklearn.svm import SVC
+
+from profab.model_learn import kernel_search
+from profab.model_learn.kernel_search import PrecomputedSVMSearchCV, gram_matrix
+
+
+@pytest.fixture(scope = 'module')
+def data():
+    X, y = make_classification(n_samples = 120, n_features = 8, random_state = 0)
+    return X, np.where(y == 1, 1, -1)
+
+
+def cv():
+    return StratifiedKFold(n_splits = 3, shuffle = True, random_state = 0)
+
+
+def search(**kwargs):
+    #gamma 'scale' of a precomputed kernel is computed from whole data, not from training fold
+    parameters = dict(kernel = ['rbf', 'poly', 'sigmoid', 'linear'], gamma = [0.01, 0.1, 1.0],
+                      C = [0.1, 1.0, 10.0], coef0 = [0.0, 1.0])
+    return PrecomputedSVMSearchCV(SVC(), parameters, cv(), 'f1', n_iter = 12, random_state = 0, **kwargs)
+
+
+@pytest.mark.parametrize('kernel', ['rbf', 'poly', 'sigmoid', 'linear'])
+def test_gram_matrix_equals_pairwise_kernels(data, kernel):
+    X, _ = data
+    #two rows per block
+    K = gram_matrix(X, kernel, gamma = 0.1, degree = 2, coef0 = 1.0, working_memory = 16*len(X)/2**20)
+    params = dict(gamma = 0.1) if kernel == 'rbf' else dict(gamma = 0.1, coef0 = 1.0)
+    params = dict(params, degree = 2) if kernel == 'poly' else params
+    expected = pairwise_kernels(X, metric = kernel, **({} if kernel == 'linear' else params))
+    assert np.allclose(K, expected, rtol = 1e-10, atol = 1e-12)
+
+
+def test_precomputed_scores_equal_fits_on_features(data):
+    X, y = data
+    precomputed = search().fit(X, y)
+    #without budget for the kernel matrix, candidates are fitted on features
+    direct = search(max_memory = 0).fit(X, y)
+    assert precomputed.cv_results_['params'] == direct.cv_results_['params']
+    assert np.allclose(precomputed.cv_results_['mean_test_score'], direct.cv_results_['mean_test_score'],
+                       atol = 1e-6)
+    assert precomputed.best_params_ == direct.best_params_
+
+
+def test_memory_budget_counts_slices_of_parallel_jobs(data):
+    X, _ = data
+    splits = list(cv().split(X, np.ones(len(X))))
+    gram, slices = 8*len(X)**2, 8*80*120
+
+    def jobs(max_memory, n_tasks = 30):
+        return search(max_memory = max_memory, n_jobs = 4)._precompute_jobs(len(X), splits, n_tasks)
+
+    assert jobs(gram + 4*slices) == 4
+    assert jobs(gram + 3*slices) == 3
+    assert jobs(gram + slices) == 1
+    #kernel matrix alone fits but a fit on it does not
+    assert jobs(gram + slices - 1) == 0
+    assert jobs(gram + 4*slices, n_tasks = 2) == 2
+
+
+def test_lowered_jobs_are_used_by_search(data, monkeypatch):
+    X, y = data
+    used = []
+    parallel = kernel_search.Parallel
+
+    def recording(n_jobs = None, **kwargs):
+        used.append(n_jobs)
+        return parallel(n_jobs = n_jobs, **kwargs)
+
+    monkeypatch.setattr(kernel_search, 'Parallel', recording)
+    search(max_memory = 8*len(X)**2 + 2*8*80*120, n_jobs = 4).fit(X, y)
+    search(max_memory = 8*len(X)**2, n_jobs = 4).fit(X, y)
+    assert used == [2, 4]
@@ -0,0 +1,33 @@
+from collections import Counter
+import numpy as np
+import pytest
+
+import kmerCount
+from conftest import AMINO_ACIDS, descriptor_pair, random_fastas
+
+ORDER = 'ACDEFGHIKLMNPQRSTVWY'
+
+
+@pytest.mark.parametrize('descriptor', ['AAC', 'DPC', 'GAAC', 'GDPC', 'GTPC'])
+def test_kmer_descriptors_equal_reference(descriptor, fastas):
+    current, reference = descriptor_pair(descriptor)
+    assert current(fastas, order = ORDER) == reference(fastas, order = ORDER)
+
+
+def test_tpc_equals_reference(sample_fastas):
+    #reference TPC scans every sequence for each of 8000 tripeptides
+    current, reference = descriptor_pair('TPC')
+    fastas = sample_fastas[:3] + random_fastas(3, 31, 60)
+    assert current(fastas, order = ORDER) == reference(fastas, order = ORDER)
+
+
+@pytest.mark.parametrize('k', [1, 2, 3])
+def test_kmer_counts_count_every_kmer(k):
+    sequences = [sequence for name, sequence in random_fastas(20, 0, 80, alphabet = AMINO_ACIDS + 'X')]
+    counts = kmerCount.kmerCounts(sequences, k, AMINO_ACIDS, batchSize = 7)
+    for sequence, row in zip(sequences, counts):
+        expected = Counter(sequence[i:i + k] for i in range(len(sequence) - k + 1) if 'X' not in sequence[i:i + k])
+        found = {kmer: row[np.ravel_multi_index([AMINO_ACIDS.index(aa) for aa in kmer], [20] * k)]
+                 for kmer in expected}
+        assert found == dict(expected)
+        assert row.sum() == sum(expected.values())
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.linear_model import LogisticRegression, RidgeClassifier
+from sklearn.model_selection import GridSearchCV, StratifiedKFold
+
+from profab.model_learn.search import search_cv
+
+
+@pytest.fixture(scope = 'module')
+def data():
+    X, y = make_classification(n_samples = 240, n_features = 20, n_informative = 5, flip_y = 0.1,
+                               random_state = 0)
+    return X, np.where(y == 1, 1, -1)
+
+
+def cv():
+    return StratifiedKFold(n_splits = 4, shuffle = True, random_state = 0)
+
+
+def scores_of(search):
+    return {repr(sorted(params.items())): score
+            for params, score in zip(search.cv_results_['params'], search.cv_results_['mean_test_score'])}
+
+
+def compare(estimator, parameters, path_param, scoring, data, atol):
+    X, y = data
+    path = search_cv(estimator, parameters, cv(), scoring, search = 'path', path_param = path_param).fit(X, y)
+    grid = GridSearchCV(estimator, parameters, cv = cv(), scoring = scoring).fit(X, y)
+    path_scores, grid_scores = scores_of(path), scores_of(grid)
+    assert path_scores.keys() <= grid_scores.keys()
+    for params, score in path_scores.items():
+        assert score == pytest.approx(grid_scores[params], abs = atol), params
+    assert path.best_params_ == grid.best_params_
+    assert path.best_score_ == pytest.approx(grid.best_score_, abs = atol)
+    assert path.best_estimator_.get_params() == grid.best_estimator_.get_params()
+
+
+@pytest.mark.parametrize('scoring', ['f1', 'roc_auc', 'accuracy'])
+def test_ridge_path_equals_grid_search(data, scoring):
+    parameters = dict(alpha = list(np.logspace(-3, 4, 15)), fit_intercept = [True, False])
+    compare(RidgeClassifier(), parameters, 'alpha', scoring, data, 1e-10)
+
+
+@pytest.mark.parametrize('scoring', ['f1', 'roc_auc'])
+def test_logistic_path_equals_grid_search(data, scoring):
+    #warm started path stops at the tolerance of the solver, so scores are close but not equal
+    parameters = dict(C = [1e-3, 1e-2, 1e-1, 1.0, 10.0], class_weight = [None, 'balanced'])
+    compare(LogisticRegression(max_iter = 5000, tol = 1e-8), parameters, 'C', scoring, data, 1e-6)
+
+
+def test_solvers_of_the_same_optimum_share_a_path(data):
+    X, y = data
+    parameters = dict(C = [0.1, 1.0], solver = ['liblinear', 'lbfgs', 'newton-cg'])
+    path = search_cv(LogisticRegression(max_iter = 5000), parameters, cv(), 'f1', search = 'path',
+                     path_param = 'C').fit(X, y)
+    assert [params['solver'] for params in path.cv_results_['params']] == ['lbfgs', 'lbfgs']
+
+
+def test_path_search_needs_path_param():
+    with pytest.raises(AttributeError):
+        search_cv(RidgeClassifier(), dict(alpha = [1.0]), cv(), 'f1', search = 'path')
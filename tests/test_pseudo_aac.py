@@ -0,0 +1,34 @@
+import pytest
+
+import pseudoAAC
+from conftest import descriptor_pair, encoding_values
+
+DESCRIPTORS = ['PAAC', 'APAAC']
+LAMBDAS = [1, 5, 30]
+
+
+@pytest.mark.parametrize('descriptor', DESCRIPTORS)
+@pytest.mark.parametrize('lambdaValue', LAMBDAS)
+def test_pseudo_aac_equals_reference(descriptor, lambdaValue, fastas):
+    current, reference = descriptor_pair(descriptor)
+    assert current(fastas, lambdaValue) == reference(fastas, lambdaValue)
+
+
+@pytest.mark.parametrize('descriptor', DESCRIPTORS)
+def test_pseudo_aac_weight_equals_reference(descriptor, fastas):
+    current, reference = descriptor_pair(descriptor)
+    assert current(fastas, 5, w = 0.1) == reference(fastas, 5, w = 0.1)
+
+
+@pytest.mark.parametrize('descriptor', DESCRIPTORS)
+@pytest.mark.parametrize('lambdaValue', LAMBDAS)
+def test_pseudo_composition_batch_equals_reference(descriptor, lambdaValue, fastas, sequences):
+    reference = descriptor_pair(descriptor)[1](fastas, lambdaValue)
+    matrix = pseudoAAC.pseudoComposition(sequences, descriptor, lambdaValue)
+    assert matrix.tolist() == encoding_values(reference)
+
+
+@pytest.mark.parametrize('descriptor', DESCRIPTORS)
+def test_short_sequences(descriptor, fastas):
+    current = descriptor_pair(descriptor)[0]
+    assert current(fastas + [['short', 'ACDE']]) == 0
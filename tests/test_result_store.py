@@ -0,0 +1,55 @@
+import json
+import numpy as np
+import pytest
+
+from profab.model_evaluate.result_store import ResultStore, KEY_FIELDS
+
+RUN = dict(data_name = 'GO_0000018', set_type = 'similarity', protein_feature = 'paac', scale_type = 'standard',
+           ml_type = 'SVM', ratio = [0.2, 0.1], seed = 1, search = 'halving', cv_budget = {'n_folds': 3},
+           pre_determined = False, similarity_threshold = 0.3)
+CHANGED = dict(data_name = 'GO_0000019', set_type = 'random', protein_feature = 'aac', scale_type = 'minmax',
+               ml_type = 'RF', ratio = 0.2, seed = 2, search = 'random', cv_budget = {'n_folds': 5},
+               pre_determined = True, similarity_threshold = 0.5)
+SCORES = {'train': {'F1-Score': np.float64(0.5), 'TP': np.int64(3)}, 'test': {'F1-Score': 0.25, 'TP': 1}}
+
+
+def test_every_field_is_part_of_key():
+    assert set(CHANGED) == set(KEY_FIELDS)
+    for field in KEY_FIELDS:
+        assert ResultStore.key(**dict(RUN, **{field: CHANGED[field]})) != ResultStore.key(**RUN), field
+
+
+def test_key_ignores_other_parameters_and_threshold_of_other_splits():
+    assert ResultStore.key(workers = 4, prefetch = 2, **RUN) == ResultStore.key(**RUN)
+    random_run = dict(RUN, set_type = 'random')
+    assert ResultStore.key(**dict(random_run, similarity_threshold = 0.5)) == ResultStore.key(**random_run)
+    assert ResultStore.key(**dict(RUN, ratio = (0.2, 0.1))) == ResultStore.key(**RUN)
+
+
+def test_stored_runs_are_found_after_restart(tmp_path):
+    path = str(tmp_path / 'results.jsonl')
+    store = ResultStore(path)
+    store.add(ResultStore.key(**RUN), SCORES)
+    store.add(ResultStore.key(**CHANGED), SCORES)
+    #a run stored again replaces the earlier one
+    store.add(ResultStore.key(**RUN), {'test': {'F1-Score': 0.75}})
+    restarted = ResultStore(path)
+    assert len(restarted) == 2
+    assert restarted.get(ResultStore.key(**RUN)) == {'test': {'F1-Score': 0.75}}
+    assert restarted.get(ResultStore.key(**CHANGED)) == {'train': {'F1-Score': 0.5, 'TP': 3},
+                                                         'test': {'F1-Score': 0.25, 'TP': 1}}
+    assert ResultStore.key(**dict(CHANGED, seed = 3)) not in restarted
+
+
+def test_older_records_and_incomplete_lines_are_read(tmp_path):
+    path = str(tmp_path / 'results.jsonl')
+    old = {field: RUN[field] for field in ['data_name', 'set_type', 'protein_feature', 'scale_type', 'ml_type',
+                                           'ratio', 'seed', 'cv_budget']}
+    old['set_type'] = 'random'
+    with open(path, 'w') as f:
+        f.write(json.dumps({'key': old, 'scores': {'test': {'F1-Score': 0.5}}}) + '\n')
+        f.write('{"key": {"data_name": "GO_00')
+    store = ResultStore(path)
+    assert len(store) == 1
+    #fields added later take the values that runs of older stores had
+    assert ResultStore.key(**dict(old, search = 'random', pre_determined = False)) in store
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+from scipy.stats import loguniform
+from sklearn.base import clone
+from sklearn.datasets import make_classification
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import RepeatedStratifiedKFold, RandomizedSearchCV
+
+from profab.model_learn.search import search_cv, cv_budget_of, CV_BUDGET
+from profab.model_learn.search import HalvingSearchCV, HyperbandSearchCV, BudgetSearchCV
+
+PARAMETERS = dict(C = loguniform(1e-3, 1e2), class_weight = [None, 'balanced'])
+
+
+@pytest.fixture(scope = 'module')
+def data():
+    return make_classification(n_samples = 300, n_features = 10, random_state = 0)
+
+
+def repeated_cv():
+    return RepeatedStratifiedKFold(n_splits = 5, n_repeats = 3, random_state = 0)
+
+
+def test_halving_starts_from_folds_of_one_repeat(data):
+    X, y = data
+    search = search_cv(LogisticRegression(solver = 'liblinear'), PARAMETERS, repeated_cv(), 'f1',
+                       search = 'halving', random_state = 0)
+    assert isinstance(search, HalvingSearchCV)
+    search.fit(X, y)
+    #scikit-learn would count 2 samples of each class for each of 15 folds
+    assert search.min_resources_ == 2*20
+    assert search.n_resources_[0] == 40 and search.n_resources_ == sorted(search.n_resources_)
+    assert search.get_params()['min_resources'] == 'smallest'
+    search.fit(X[:150], y[:150])
+    assert search.min_resources_ == 40 and search.max_resources_ == 150
+    assert search.best_params_ in search.cv_results_['params']
+    assert search.best_estimator_.get_params()['C'] == search.best_params_['C']
+
+
+def test_estimator_resource_is_taken_from_parameters(data):
+    X, y = data
+    parameters = dict(n_estimators = [10, 30, 90], max_depth = [2, 4, None])
+    search = search_cv(RandomForestClassifier(random_state = 0), parameters, repeated_cv(), 'f1',
+                       search = 'halving', resource = 'n_estimators', n_jobs = 1, random_state = 0)
+    assert search.param_distributions == dict(max_depth = [2, 4, None])
+    assert search.max_resources == 90
+    search.fit(X, y)
+    assert search.n_resources_[0] == 10 and search.n_resources_[-1] <= 90
+    assert search.best_estimator_.n_estimators == search.best_params_['n_estimators'] == search.n_resources_[-1]
+
+
+def test_hyperband_keeps_best_bracket(data):
+    X, y = data
+    search = search_cv(LogisticRegression(solver = 'liblinear'), PARAMETERS, repeated_cv(), 'f1',
+                       search = 'hyperband', random_state = 0)
+    assert isinstance(search, HyperbandSearchCV)
+    search.fit(X, y)
+    #brackets start from 300 // 3**s samples for s = 1, 0 as 300 // 3**2 is below the smallest 40
+    assert [bracket.n_resources_[0] for bracket in search.brackets_] == [100, 300]
+    assert [len(bracket.cv_results_['params']) for bracket in search.brackets_] == [3 + 1, 2]
+    best = max(search.brackets_, key = lambda bracket: bracket.best_score_)
+    assert search.best_score_ == best.best_score_ and search.best_params_ == best.best_params_
+    assert search.best_estimator_.get_params()['C'] == search.best_params_['C']
+    assert hasattr(search.best_estimator_, 'coef_')
+
+
+def test_budget_search_without_limits_equals_randomized_search(data):
+    X, y = data
+    budget = BudgetSearchCV(LogisticRegression(solver = 'liblinear'), PARAMETERS, repeated_cv(), 'f1',
+                            n_iter = 8, random_state = 0).fit(X, y)
+    randomized = RandomizedSearchCV(LogisticRegression(solver = 'liblinear'), PARAMETERS, n_iter = 8,
+                                    cv = repeated_cv(), scoring = 'f1', random_state = 0).fit(X, y)
+    assert budget.cv_results_['params'] == randomized.cv_results_['params']
+    np.testing.assert_allclose(budget.cv_results_['mean_test_score'], randomized.cv_results_['mean_test_score'])
+    assert budget.best_params_ == randomized.best_params_
+    assert budget.cv_results_['status'] == ['done']*8 and budget.n_fits_ == 8*15
+
+
+def test_bad_candidates_are_aborted(data):
+    X, y = data
+    search = search_cv(LogisticRegression(solver = 'liblinear'), PARAMETERS, repeated_cv(), 'f1',
+                       n_iter = 20, n_jobs = 1, random_state = 0,
+                       cv_budget = dict(min_folds = 3, abort_margin = 0.01))
+    assert isinstance(search, BudgetSearchCV)
+    search.fit(X, y)
+    results = search.cv_results_
+    assert 'aborted' in results['status']
+    assert search.n_fits_ == sum(results['n_folds']) < 20*15
+    best = max(score for score, status in zip(results['mean_test_score'], results['status']) if status == 'done')
+    assert search.best_score_ == best
+    for n_folds, status in zip(results['n_folds'], results['status']):
+        assert (n_folds == 15) == (status == 'done')
+        assert status == 'done' or 3 <= n_folds < 15
+
+
+def test_fits_and_time_are_bounded(data):
+    X, y = data
+    search = search_cv(LogisticRegression(solver = 'liblinear'), PARAMETERS, repeated_cv(), 'f1',
+                       n_iter = 20, random_state = 0, cv_budget = dict(max_fits = 40)).fit(X, y)
+    assert search.n_fits_ == 40
+    assert search.cv_results_['n_folds'] == [15, 15, 10] and search.cv_results_['status'][-1] == 'budget'
+    #a candidate cut by budget is used only if none is finished
+    search = search_cv(LogisticRegression(solver = 'liblinear'), PARAMETERS, repeated_cv(), 'f1',
+                       n_iter = 20, random_state = 0, cv_budget = dict(max_fits = 5)).fit(X, y)
+    assert search.cv_results_['status'] == ['budget'] and search.best_params_ == search.cv_results_['params'][0]
+    search = search_cv(LogisticRegression(solver = 'liblinear'), PARAMETERS, repeated_cv(), 'f1',
+                       n_iter = 20, random_state = 0, cv_budget = dict(max_time = 0)).fit(X, y)
+    assert search.n_fits_ == 0 and hasattr(search.best_estimator_, 'coef_')
+
+
+def test_unknown_budget_keys_raise():
+    with pytest.raises(AttributeError, match = 'n_fold'):
+        cv_budget_of(dict(n_fold = 3))
+    assert cv_budget_of(dict(n_folds = 3))['n_repeats'] == CV_BUDGET['n_repeats']
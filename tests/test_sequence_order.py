@@ -0,0 +1,32 @@
+import pytest
+
+import sequenceOrder
+from conftest import descriptor_pair, encoding_values
+
+DESCRIPTORS = ['SOCNumber', 'QSOrder']
+
+
+@pytest.mark.parametrize('descriptor', DESCRIPTORS)
+@pytest.mark.parametrize('nlag', [1, 5, 30])
+def test_sequence_order_equals_reference(descriptor, nlag, fastas):
+    current, reference = descriptor_pair(descriptor)
+    assert current(fastas, nlag) == reference(fastas, nlag)
+
+
+def test_qsorder_weight_equals_reference(fastas):
+    current, reference = descriptor_pair('QSOrder')
+    assert current(fastas, 5, w = 0.3) == reference(fastas, 5, w = 0.3)
+
+
+def test_batch_shares_one_pass(fastas, sequences):
+    matrices = sequenceOrder.sequenceOrderMatrices(sequences)
+    for descriptor in DESCRIPTORS:
+        reference = descriptor_pair(descriptor)[1](fastas)
+        assert matrices[descriptor].tolist() == encoding_values(reference)
+        assert sequenceOrder.sequenceOrderEncodings(fastas)[descriptor] == reference
+
+
+@pytest.mark.parametrize('descriptor', DESCRIPTORS)
+def test_short_sequences(descriptor, fastas):
+    current = descriptor_pair(descriptor)[0]
+    assert current(fastas + [['short', 'ACDE']]) == 0
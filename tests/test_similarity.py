@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from profab.model_preprocess import fasta_groups, similarity_groups
+from profab.model_preprocess.similarity import _MAX_HASH, _PRIME, _kmer_codes, minhash_signatures
+
+from conftest import AMINO_ACIDS
+
+
+def kmer_set(sequence, k = 3):
+    return set(sequence[i:i + k] for i in range(len(sequence) - k + 1))
+
+
+def jaccard(a, b):
+    return len(a & b)/len(a | b)
+
+
+@pytest.fixture(scope = 'module')
+def families():
+    #families of mutated copies of random sequences, copies of a family are similar to each other
+    rng = np.random.RandomState(0)
+    sequences, family = [], []
+    for f in range(40):
+        base = rng.choice(list(AMINO_ACIDS), rng.randint(80, 300))
+        for copy in range(4):
+            mutated = base.copy()
+            sites = rng.rand(len(base)) < rng.uniform(0.02, 0.12)
+            mutated[sites] = rng.choice(list(AMINO_ACIDS), sites.sum())
+            sequences.append(''.join(mutated))
+            family.append(f)
+    order = rng.permutation(len(sequences))
+    return [sequences[i] for i in order], np.array(family)[order]
+
+
+def test_signatures_equal_minimum_of_hashes(sequences):
+    signatures = minhash_signatures(sequences + ['AC', ''], k = 3, num_perm = 16, random_state = 4)
+    rng = np.random.RandomState(4)
+    a = rng.randint(1, int(_PRIME), size = 16).astype(np.uint64)
+    b = rng.randint(0, int(_PRIME), size = 16).astype(np.uint64)
+    for sequence, signature in zip(sequences, signatures):
+        codes = np.unique(_kmer_codes(sequence, 3))
+        assert np.array_equal(signature, ((codes[:,None]*a + b) % _PRIME).min(axis = 0))
+    #sequences shorter than k have no k-mers
+    assert (signatures[-2:] == _MAX_HASH).all()
+
+
+def test_parallel_signatures_equal_sequential(families):
+    sequences = families[0]*8
+    assert np.array_equal(minhash_signatures(sequences, n_jobs = 1), minhash_signatures(sequences, n_jobs = 2))
+
+
+def test_signatures_estimate_jaccard_similarity(families):
+    sequences, _ = families
+    signatures = minhash_signatures(sequences, num_perm = 256)
+    sets = [kmer_set(s) for s in sequences]
+    errors = [(signatures[i] == signatures[j]).mean() - jaccard(sets[i], sets[j])
+              for i in range(40) for j in range(i + 1, 40)]
+    #standard error of an estimate is at most 0.5/sqrt(256)
+    assert np.abs(np.mean(errors)) < 0.01 and np.max(np.abs(errors)) < 0.15
+
+
+def test_lsh_recall_of_similar_pairs(families):
+    sequences, family = families
+    threshold = 0.3
+    groups = similarity_groups(sequences, threshold = threshold)
+    sets = [kmer_set(s) for s in sequences]
+    similar = [(i, j) for i in range(len(sets)) for j in range(i + 1, len(sets))
+               if jaccard(sets[i], sets[j]) >= threshold]
+    recall = np.mean([groups[i] == groups[j] for i, j in similar])
+    #bands are chosen so that a pair at threshold is a candidate with probability 0.95
+    assert len(similar) > 100 and recall >= 0.95
+    #random sequences of different families are not linked
+    assert len(np.unique(groups)) >= len(np.unique(family))
+    for g in np.unique(groups):
+        assert len(np.unique(family[groups == g])) == 1
+
+
+def test_fasta_groups_follow_protein_ids(tmp_path, families):
+    sequences, family = families
+    names = ['>sp|P{}|x'.format(i) for i in range(len(sequences))]
+    paths = [str(tmp_path / 'positive.fasta'), str(tmp_path / 'negative.fasta')]
+    for path, rows in zip(paths, [range(0, 80), range(80, len(sequences))]):
+        with open(path, 'w') as f:
+            f.write(''.join('{}\n{}\n{}\n'.format(names[i], sequences[i][:60], sequences[i][60:]) for i in rows))
+    groups = fasta_groups(paths)
+    assert np.array_equal(groups, similarity_groups(sequences))
+    ids = ['P{}'.format(i) for i in range(len(sequences))][::-1]
+    assert np.array_equal(fasta_groups(paths, protein_ids = ids), groups[::-1])
+    with pytest.raises(ValueError):
+        fasta_groups(paths, protein_ids = ids + ['Q1'])
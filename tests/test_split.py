@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+from sklearn.model_selection import train_test_split
+
+from profab.model_preprocess import ttv_split
+from profab.utils import separator, split_indices
+
+
+def baseline_separator(X, y, ratio, random_state = None):
+    #separator as it was before splits were formed as index arrays
+    if type(ratio) == float:
+        return train_test_split(X, y, test_size = ratio, random_state = random_state)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size = ratio[0], random_state = random_state)
+    X_train, X_validation, y_train, y_validation = train_test_split(X_train, y_train,
+                                                                    test_size = ratio[1]/(1 - ratio[0]),
+                                                                    random_state = random_state)
+    return X_train, X_test, X_validation, y_train, y_test, y_validation
+
+
+@pytest.fixture(scope = 'module')
+def data():
+    rng = np.random.RandomState(0)
+    X = rng.rand(101, 4)
+    y = np.where(rng.rand(101) < 0.3, 1, -1)
+    return X, y
+
+
+def assert_sets_equal(sets, expected):
+    assert len(sets) == len(expected)
+    for a, b in zip(sets, expected):
+        assert np.array_equal(a, b)
+
+
+@pytest.mark.parametrize('ratio', [0.2, 0.33, [0.2, 0.1], [0.25, 0.25]])
+def test_split_equals_baseline_separator(data, ratio):
+    X, y = data
+    #a RandomState object is shared by the chained splits of baseline
+    expected = baseline_separator(X, y, ratio, np.random.RandomState(5))
+    assert_sets_equal(separator(X, y, ratio, random_state = 5), expected)
+    assert_sets_equal(ttv_split(X, y, ratio, random_state = 5), expected)
+    #global numpy random state is used without random_state
+    np.random.seed(7)
+    expected = baseline_separator(X, y, ratio)
+    np.random.seed(7)
+    assert_sets_equal(ttv_split(X, y, ratio), expected)
+
+
+def test_stacked_sets_equal_concatenated_sets(data):
+    X, y = data
+    pos, neg = X[y == 1], X[y == -1]
+    stacked = ttv_split(X_pos = pos, X_neg = neg, ratio = [0.2, 0.1], random_state = 2)
+    labels = np.concatenate([np.ones(len(pos), dtype = int), -np.ones(len(neg), dtype = int)])
+    assert_sets_equal(stacked, separator(np.concatenate([pos, neg]), labels, [0.2, 0.1], random_state = 2))
+
+
+@pytest.mark.parametrize('ratio, sizes', [(0.2, [80, 21]), ([0.2, 0.1], [70, 21, 10])])
+@pytest.mark.parametrize('stratify', [False, True])
+def test_parts_are_disjoint_and_cover_rows(data, ratio, sizes, stratify):
+    _, y = data
+    split = split_indices(y, ratio, stratify = stratify, random_state = 0)
+    if not stratify:
+        assert [len(part) for part in split.parts] == sizes
+    rows = np.concatenate(split.parts)
+    assert len(rows) == len(y) and np.array_equal(np.sort(rows), np.arange(len(y)))
+    if not stratify:
+        #number of rows gives the split of labels
+        assert_sets_equal(split_indices(len(y), ratio, random_state = 0).parts, split.parts)
+
+
+def test_stratified_parts_keep_label_fractions(data):
+    _, y = data
+    split = split_indices(y, [0.2, 0.2], stratify = True, random_state = 0)
+    fraction = (y == 1).mean()
+    for part in split.parts:
+        assert abs((y[part] == 1).mean() - fraction) < 1.5/len(part)
+
+
+def test_groups_are_kept_together(data):
+    _, y = data
+    groups = np.random.RandomState(1).randint(0, 30, len(y))
+    split = split_indices(y, [0.2, 0.1], random_state = 0, groups = groups)
+    assert np.array_equal(np.sort(np.concatenate(split.parts)), np.arange(len(y)))
+    members = [set(groups[part]) for part in split.parts]
+    assert not (members[0] & members[1]) and not (members[0] & members[2]) and not (members[1] & members[2])
+    #sizes are within half of the largest group of the ratio
+    half = np.bincount(groups).max()/2
+    assert abs(len(split.test) - 0.2*len(y)) <= half + 1
+    with pytest.raises(ValueError):
+        split_indices(y, 0.2, groups = groups[:-1])
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+from sklearn.preprocessing import MaxAbsScaler, MinMaxScaler, Normalizer, RobustScaler, StandardScaler
+
+from profab.model_preprocess.streaming_scaler import (StreamingMaxAbsScaler, StreamingMinMaxScaler,
+                                                      StreamingNormalizer, StreamingRobustScaler,
+                                                      StreamingStandardScaler, streaming_scaler)
+
+
+@pytest.fixture(scope = 'module')
+def X():
+    rng = np.random.RandomState(0)
+    X = np.column_stack([rng.normal(5, 3, 3000), rng.exponential(2, 3000), rng.uniform(-1, 1, 3000),
+                         np.full(3000, 7.0), rng.standard_t(3, 3000)])
+    return X
+
+
+def partial_fit(scaler, X, sizes):
+    #batches of different sizes, including an empty one
+    for rows in np.array_split(np.arange(len(X)), sizes):
+        scaler.partial_fit(X[rows])
+    return scaler
+
+
+@pytest.mark.parametrize('streaming, reference, attributes', [
+    (StreamingStandardScaler, StandardScaler, ['mean_', 'var_', 'scale_']),
+    (StreamingMinMaxScaler, MinMaxScaler, ['data_min_', 'data_max_', 'scale_', 'min_']),
+    (StreamingMaxAbsScaler, MaxAbsScaler, ['scale_']),
+    (StreamingNormalizer, Normalizer, [])])
+def test_scalers_equal_scikit_learn(X, streaming, reference, attributes):
+    expected = reference().fit(X)
+    for scaler in [streaming(chunk_size = 128).fit(X), partial_fit(streaming(chunk_size = 100), X, [7, 7, 1000])]:
+        for name in attributes:
+            assert np.allclose(getattr(scaler, name), getattr(expected, name), rtol = 1e-12, atol = 1e-12), name
+        assert np.allclose(scaler.transform(X), expected.transform(X), rtol = 1e-10, atol = 1e-12)
+
+
+def test_in_place_transform_keeps_float32(X):
+    scaler = StreamingStandardScaler(copy = False).fit(X)
+    X32 = X.astype(np.float32)
+    out = scaler.transform(X32)
+    assert out is X32 and out.dtype == np.float32
+    assert np.allclose(out, StandardScaler().fit(X).transform(X), atol = 1e-5)
+    assert np.allclose(scaler.inverse_transform(scaler.transform(X, copy = True)), X)
+
+
+def test_robust_scaler_is_exact_for_small_data(X):
+    scaler = StreamingRobustScaler(sketch_size = 1024, chunk_size = 100).fit(X[:1000])
+    expected = RobustScaler().fit(X[:1000])
+    assert np.allclose(scaler.center_, expected.center_)
+    assert np.allclose(scaler.scale_, expected.scale_)
+
+
+def test_robust_scaler_quantiles_are_within_rank_tolerance():
+    #stated tolerance: ranks of estimated quantiles are within 1% of their targets for sketch_size = 256
+    rng = np.random.RandomState(1)
+    X = np.column_stack([rng.normal(size = 50000), rng.exponential(size = 50000), rng.lognormal(size = 50000)])
+    scaler = StreamingRobustScaler(sketch_size = 256, chunk_size = 1000).fit(X)
+    for q, estimate in zip([0.25, 0.5, 0.75], scaler._quantiles([25.0, 50.0, 75.0])):
+        assert np.all(np.abs((X <= estimate).mean(axis = 0) - q) < 0.01)
+    expected = RobustScaler().fit(X)
+    assert np.allclose(scaler.center_, expected.center_, atol = 0.05*expected.scale_)
+    assert np.allclose(scaler.scale_, expected.scale_, rtol = 0.05)
+    #sketch keeps fewer values than a level holds on each level
+    assert all(len(level) < 256 for level in scaler._levels)
+
+
+@pytest.mark.parametrize('scale_type', ['normalizer', 'standard', 'max_abs', 'min_max', 'robust'])
+def test_streaming_scaler_of_scale_type(X, scale_type):
+    scaler = streaming_scaler(scale_type, chunk_size = 64)
+    assert scaler.chunk_size == 64
+    assert scaler.fit_transform(X).shape == X.shape